@@ -1,12 +1,83 @@
 import argparse
+import codecs
 import csv
+import json
+import os
 import re
+import select
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List
-from frobenius import solve_for_frobenius_number
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+)
+from batchplan import DEFAULT_PLAN_MEMORY_BYTES, iter_planned_results
+from cache import ResultCache
+from canonical import validate_units
+from checkpoint import (
+    DEFAULT_CHECKPOINT_DIR,
+    DEFAULT_CHECKPOINT_INTERVAL,
+    CheckpointOptions,
+)
+from dispatch import solve
+from estimator import Estimate, estimate
+from frobenius import ENGINES, np
+from orders import (
+    OrderChecker,
+    OrderPlanner,
+    check_order_batches,
+    iter_order_volumes,
+    plan_order_batches,
+)
+from portfolio import OBJECTIVES, PortfolioResult, search_portfolio
+from profiling import SolveProfile
+from server import run_server
+from sweep import format_sweep_table, parse_sweep, sweep_unit
+from vectorbatch import iter_vectorized_results
 
 INTEGER_LIST_PATTERN = re.compile(r"\d+(,\d+)*$")
 
+# Rows sent to a worker process per task when --workers > 1
+ROW_CHUNK_SIZE = 256
+
+# Buffered output is flushed at least this often
+OUTPUT_FLUSH_ROWS = 1000
+OUTPUT_FLUSH_SECONDS = 0.5
+
+# Bytes requested per read of the --stdin file descriptor
+INPUT_READ_SIZE = 65536
+
+# Cache used by solve_row in this process (see init_row_cache)
+_row_cache: Optional[ResultCache] = None
+
+
+class MalformedRow(list):
+    """Stands in for a CSV line that failed validation.
+
+    It is an empty row, so every solver passes it through as having no
+    solution, and format_result reports its error instead. One bad line then
+    gets an error line instead of stopping the batch, as with --stdin.
+
+    Attributes:
+        line: The raw line
+        error: Why the line was rejected
+    """
+
+    def __init__(self, line: str, error: str):
+        super().__init__()
+        self.line = line
+        self.error = error
+
 
 def validate_comma_separated_integers(input_str: str) -> None:
     """Validates that a string contains only comma-separated positive integers.
@@ -36,34 +107,53 @@ def parse_integer_string(input_str: str) -> List[int]:
     return [int(num) for num in input_str.split(",")]
 
 
-def read_csv_to_integer_lists(file_path: Path) -> List[List[int]]:
-    """Reads CSV file and returns lists of integers from each line.
+def iter_csv_integer_lists(file_path: Path) -> Iterator[List[int]]:
+    """Lazily reads a CSV file, validating and yielding one line at a time.
+
+    Only the current line is held in memory, so file size does not affect
+    peak memory.
 
     Args:
         file_path: Path to CSV file
 
-    Returns:
-        List of integer lists, one per CSV line
+    Yields:
+        The integer list for each CSV line, or a MalformedRow for a line
+        that is not a list of integers
     """
-    integer_lists = []
-
     with open(file_path, mode="r") as file:
         csv_reader = csv.reader(file)
         for line in csv_reader:
-            validate_comma_separated_integers(",".join(line))
-            integer_lists.append([int(num) for num in line])
+            row = ",".join(line)
+            try:
+                validate_comma_separated_integers(row)
+            except ValueError as error:
+                yield MalformedRow(row, f"{type(error).__name__}: {error}")
+                continue
+            yield [int(num) for num in line]
+
+
+def read_csv_to_integer_lists(file_path: Path) -> List[List[int]]:
+    """Reads CSV file and returns lists of integers from each line.
 
-    return integer_lists
+    Args:
+        file_path: Path to CSV file
+
+    Returns:
+        List of integer lists, one per CSV line
+    """
+    return list(iter_csv_integer_lists(file_path))
 
 
-def process_input_args(args: argparse.Namespace) -> List[List[int]]:
+def process_input_args(args: argparse.Namespace) -> Iterable[List[int]]:
     """Processes command line arguments into lists of integers.
 
+    CSV input is returned as a lazy iterator (see iter_csv_integer_lists).
+
     Args:
         args: Parsed command line arguments
 
     Returns:
-        List of integer lists to process
+        Integer lists to process
 
     Raises:
         ValueError: If file is not CSV format
@@ -75,7 +165,63 @@ def process_input_args(args: argparse.Namespace) -> List[List[int]]:
     if path.suffix.lower() != ".csv":
         raise ValueError("Input file must be in CSV format")
 
-    return read_csv_to_integer_lists(path)
+    return iter_csv_integer_lists(path)
+
+
+def positive_integer(value: str) -> int:
+    """Parses a strictly positive integer command line value.
+
+    Args:
+        value: Raw argument string
+
+    Returns:
+        The parsed integer
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a positive integer
+    """
+    if not value.isdigit() or int(value) < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got '{value}'")
+    return int(value)
+
+
+def positive_seconds(value: str) -> float:
+    """Parses a strictly positive number of seconds.
+
+    Args:
+        value: Raw argument string
+
+    Returns:
+        The parsed number
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a positive number
+    """
+    try:
+        seconds = float(value)
+    except ValueError:
+        seconds = 0.0
+    if not seconds > 0:
+        raise argparse.ArgumentTypeError(f"expected a positive number, got '{value}'")
+    return seconds
+
+
+def sweep_argument(value: str) -> Tuple[int, range]:
+    """Parses a --sweep value.
+
+    Args:
+        value: Raw argument string, UNIT=START:STOP[:STEP]
+
+    Returns:
+        A tuple of (unit, candidate values), see sweep.parse_sweep
+
+    Raises:
+        argparse.ArgumentTypeError: If value is malformed or the range is empty
+    """
+    try:
+        return parse_sweep(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error))
 
 
 def create_argument_parser() -> argparse.ArgumentParser:
@@ -101,6 +247,23 @@ def create_argument_parser() -> argparse.ArgumentParser:
         help="CSV file with integers (one combination per line for multiple calculations)",
         type=str,
     )
+    group.add_argument(
+        "--stdin",
+        action="store_true",
+        help=(
+            "Read unit sets from stdin as JSON lines or CSV lines and write one "
+            "JSON result per line"
+        ),
+    )
+    group.add_argument(
+        "--serve",
+        metavar="ADDRESS",
+        help=(
+            "Run a JSON-lines solver service on HOST:PORT, :PORT or unix:PATH "
+            "(uses --engine, --workers and --cache)"
+        ),
+        type=str,
+    )
     # Add verbose flag
     parser.add_argument(
         "-v",
@@ -108,38 +271,1151 @@ def create_argument_parser() -> argparse.ArgumentParser:
         action="store_true",  # This makes it a flag that's False by default
         help="Increase output verbosity",
     )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="python",
+        help="Round Robin engine used when no closed form applies (default: python)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=positive_integer,
+        default=1,
+        help="Number of worker processes for CSV input (default: 1)",
+    )
+    parser.add_argument(
+        "--solve-workers",
+        type=positive_integer,
+        default=1,
+        help=(
+            "Processes sharing one Round Robin table, for huge single rows whose "
+            "units share factors with the smallest unit (default: 1)"
+        ),
+    )
+    parser.add_argument(
+        "--share-prefixes",
+        action="store_true",
+        help=(
+            "Solve rows in batches that build the residue table of each shared "
+            "unit prefix once, for CSV files of near-identical rows"
+        ),
+    )
+    parser.add_argument(
+        "--plan-memory",
+        metavar="MIB",
+        type=positive_integer,
+        default=DEFAULT_PLAN_MEMORY_BYTES >> 20,
+        help=(
+            "With --share-prefixes, MiB of residue tables to hold at once "
+            f"(default: {DEFAULT_PLAN_MEMORY_BYTES >> 20})"
+        ),
+    )
+    parser.add_argument(
+        "--vectorize",
+        action="store_true",
+        help=(
+            "Solve rows in batches that stack the tables of rows with similar "
+            "smallest units into one NumPy array, for many small rows "
+            "(requires numpy)"
+        ),
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help="SQLite file that keeps results across runs (default: in-memory only)",
+        type=str,
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable result caching",
+    )
+    parser.add_argument(
+        "--table-dir",
+        metavar="DIR",
+        help=(
+            "Keep Round Robin residue tables in memory-mapped files in DIR, "
+            "for smallest units too large for RAM (requires numpy)"
+        ),
+        type=str,
+    )
+    parser.add_argument(
+        "--orders",
+        metavar="FILE",
+        help="File with one order volume per line to check against --units",
+        type=str,
+    )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="With --orders, print the combination with the fewest packages",
+    )
+    parser.add_argument(
+        "--estimate",
+        action="store_true",
+        help=(
+            "Print bounds on the result and the predicted solve time for each "
+            "row instead of solving it"
+        ),
+    )
+    parser.add_argument(
+        "--no-closed-forms",
+        action="store_true",
+        help=(
+            "With --estimate, bound and cost every row as a Round Robin solve, "
+            "even rows that have a closed form"
+        ),
+    )
+    parser.add_argument(
+        "--sweep",
+        metavar="UNIT=START:STOP[:STEP]",
+        type=sweep_argument,
+        help=(
+            "Solve --units once for every value of UNIT from START to STOP "
+            "(inclusive) and print a table"
+        ),
+    )
+    parser.add_argument(
+        "--portfolio",
+        metavar="K",
+        type=positive_integer,
+        help="Choose the best K units out of --units instead of solving them",
+    )
+    parser.add_argument(
+        "--objective",
+        choices=OBJECTIVES,
+        default="frobenius",
+        help=(
+            "With --portfolio, minimize the Frobenius number or the number of "
+            "unpurchasable volumes (default: frobenius)"
+        ),
+    )
+    parser.add_argument(
+        "--max-first",
+        metavar="N",
+        type=positive_integer,
+        help="With --portfolio, only consider subsets whose smallest unit is at most N",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write per-phase timings and table counters for each row to stderr as JSON",
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        metavar="DIR",
+        help=(
+            "Save Round Robin progress to DIR at regular intervals "
+            f"(default with --resume or --time-budget: {DEFAULT_CHECKPOINT_DIR})"
+        ),
+        type=str,
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        metavar="SECONDS",
+        type=positive_seconds,
+        default=DEFAULT_CHECKPOINT_INTERVAL,
+        help=f"Seconds between checkpoints (default: {DEFAULT_CHECKPOINT_INTERVAL:g})",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue interrupted solves from their checkpoints",
+    )
+    parser.add_argument(
+        "--time-budget",
+        metavar="SECONDS",
+        type=positive_seconds,
+        help="Stop Round Robin solves after SECONDS, saving their progress",
+    )
     return parser
 
 
-def calculate_and_print_results(integer_lists: List[List[int]], verbose: bool) -> None:
-    """Calculates and prints Frobenius numbers for each integer list.
+def init_row_cache(cache_path: Optional[str], use_cache: bool) -> None:
+    """Sets up the result cache used by solve_row in the current process.
+
+    Also runs as the process pool initializer, so every worker opens its own
+    SQLite connection.
 
     Args:
-        integer_lists: List of integer lists to process
+        cache_path: SQLite cache file, or None for an in-process memo only
+        use_cache: False disables caching entirely
     """
-    for numbers in integer_lists:
-        result = solve_for_frobenius_number(numbers)
+    global _row_cache
+    if _row_cache is not None:
+        _row_cache.close()
+    _row_cache = None
+    if use_cache:
+        _row_cache = ResultCache(Path(cache_path) if cache_path else None)
 
-        if verbose:
-            if result is not None:
-                print(
-                    f"The largest order volume that is NOT perfectly purchasable "
-                    f"for units {numbers} is {result}."
+
+def solve_row(
+    numbers: List[int],
+    engine: str,
+    table_dir: Optional[str] = None,
+    profile: Optional[SolveProfile] = None,
+    checkpoint: Optional[CheckpointOptions] = None,
+    solve_workers: int = 1,
+) -> Tuple[Optional[int], Optional[str]]:
+    """Solves a single row, turning a failure into a per-row error.
+
+    A row stopped by the checkpoint deadline is reported as a TimeoutError.
+
+    Args:
+        numbers: Integers to process
+        engine: Round Robin engine used when no closed form applies
+        table_dir: Directory for out-of-core residue tables, if any
+        profile: Optional profile to record the solve's phases in
+        checkpoint: Optional checkpointing of long Round Robin solves
+        solve_workers: Processes sharing the row's Round Robin table
+
+    Returns:
+        A tuple of (result, error); error is None when the row solved
+    """
+    try:
+        solution = solve(
+            numbers,
+            engine=engine,
+            cache=_row_cache,
+            table_dir=Path(table_dir) if table_dir else None,
+            profile=profile,
+            checkpoint=checkpoint,
+            workers=solve_workers,
+        )
+        return (solution.value, None)
+    except Exception as error:
+        return (None, f"{type(error).__name__}: {error}")
+
+
+def profile_row(
+    numbers: List[int],
+    engine: str,
+    table_dir: Optional[str] = None,
+    parse_seconds: float = 0.0,
+    checkpoint: Optional[CheckpointOptions] = None,
+) -> Tuple[Optional[int], Optional[str], dict]:
+    """Solves a single row with profiling turned on.
+
+    Args:
+        numbers: Integers to process
+        engine: Round Robin engine used when no closed form applies
+        table_dir: Directory for out-of-core residue tables, if any
+        parse_seconds: Time spent reading the row, reported as the parse phase
+        checkpoint: Optional checkpointing of long Round Robin solves
+
+    Returns:
+        A tuple of (result, error, profile) where profile is
+        SolveProfile.to_dict()
+    """
+    profile = SolveProfile()
+    profile.add_phase("parse", parse_seconds)
+    return (
+        *solve_row(numbers, engine, table_dir, profile, checkpoint),
+        profile.to_dict(),
+    )
+
+
+def solve_rows(
+    rows: List[List[int]],
+    engine: str,
+    table_dir: Optional[str] = None,
+    parse_seconds: Optional[List[float]] = None,
+    checkpoint: Optional[CheckpointOptions] = None,
+    solve_workers: int = 1,
+) -> List[tuple]:
+    """Solves a chunk of rows inside a worker process.
+
+    Args:
+        rows: Integer lists to process
+        engine: Round Robin engine used when no closed form applies
+        table_dir: Directory for out-of-core residue tables, if any
+        parse_seconds: Per-row parse times; when given, rows are profiled
+        checkpoint: Optional checkpointing of long Round Robin solves
+        solve_workers: Processes sharing each row's Round Robin table
+
+    Returns:
+        One (result, error) tuple per row, or (result, error, profile) when
+        profiling
+    """
+    if parse_seconds is not None:
+        return [
+            profile_row(numbers, engine, table_dir, seconds, checkpoint)
+            for numbers, seconds in zip(rows, parse_seconds)
+        ]
+    return [
+        solve_row(numbers, engine, table_dir, None, checkpoint, solve_workers)
+        for numbers in rows
+    ]
+
+
+def _timed_rows(
+    integer_lists: Iterable[List[int]],
+) -> Iterator[Tuple[List[int], float]]:
+    """Pairs each row with the time taken to read it from the input.
+
+    Args:
+        integer_lists: Integer lists to process
+
+    Yields:
+        (numbers, seconds) for each row
+    """
+    rows = iter(integer_lists)
+    while True:
+        start = time.perf_counter()
+        numbers = next(rows, None)
+        if numbers is None:
+            return
+        yield (numbers, time.perf_counter() - start)
+
+
+def iter_results(
+    integer_lists: Iterable[List[int]],
+    engine: str = "python",
+    workers: int = 1,
+    cache_path: Optional[str] = None,
+    use_cache: bool = False,
+    table_dir: Optional[str] = None,
+    profile: bool = False,
+    checkpoint: Optional[CheckpointOptions] = None,
+    solve_workers: int = 1,
+    input_idle: Optional[Callable[[], bool]] = None,
+) -> Iterator[tuple]:
+    """Solves every row, in input order, optionally across a process pool.
+
+    With workers > 1 rows are submitted in chunks of ROW_CHUNK_SIZE and at most
+    two chunks per worker are in flight, so results are yielded in order as
+    soon as the oldest chunk finishes. A chunk whose worker dies reports the
+    failure on each of its rows instead of stopping the batch. When
+    input_idle reports that the next row is not there yet, the rows read so
+    far are submitted as a shorter chunk and every pending result is yielded
+    before reading on.
+
+    Args:
+        integer_lists: Integer lists to process
+        engine: Round Robin engine used when no closed form applies
+        workers: Number of worker processes
+        cache_path: SQLite cache file, or None for an in-process memo only
+        use_cache: Reuse results of identical canonical unit sets
+        table_dir: Directory for out-of-core residue tables, if any
+        profile: Time each row's phases (see profile_row)
+        checkpoint: Optional checkpointing of long Round Robin solves
+        solve_workers: Processes sharing each row's Round Robin table (see
+            parallel); not used when profiling
+        input_idle: Returns True when reading another row would wait for
+            the producer of integer_lists
+
+    Yields:
+        (numbers, result, error) for each row, or (numbers, result, error,
+        profile) when profiling
+    """
+    if workers <= 1:
+        init_row_cache(cache_path, use_cache)
+        if profile:
+            for numbers, seconds in _timed_rows(integer_lists):
+                yield (
+                    numbers,
+                    *profile_row(numbers, engine, table_dir, seconds, checkpoint),
                 )
+            return
+        for numbers in integer_lists:
+            yield (
+                numbers,
+                *solve_row(numbers, engine, table_dir, None, checkpoint, solve_workers),
+            )
+        return
 
-            else:
-                print(f"There is no finite solution for units {numbers}.")
+    rows = _timed_rows(integer_lists) if profile else iter(integer_lists)
+    pending = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_row_cache,
+        initargs=(cache_path, use_cache),
+    ) as executor:
+        while True:
+            chunk = _read_chunk(rows, input_idle)
+            parse_seconds = None
+            if profile:
+                parse_seconds = [seconds for _, seconds in chunk]
+                chunk = [numbers for numbers, _ in chunk]
+            if chunk:
+                pending.append(
+                    (
+                        chunk,
+                        executor.submit(
+                            solve_rows,
+                            chunk,
+                            engine,
+                            table_dir,
+                            parse_seconds,
+                            checkpoint,
+                            solve_workers,
+                        ),
+                    )
+                )
+            if input_idle is not None and chunk and input_idle():
+                while pending:
+                    yield from _collect_chunk(*pending.popleft())
+            elif pending and (not chunk or len(pending) > 2 * workers):
+                yield from _collect_chunk(*pending.popleft())
+            elif not chunk:
+                return
+
+
+def _read_chunk(rows: Iterator, input_idle: Optional[Callable[[], bool]]) -> list:
+    """Reads up to ROW_CHUNK_SIZE rows, stopping early when the input is idle.
+
+    Args:
+        rows: Row iterator
+        input_idle: Returns True when reading another row would wait, or None
+            to always read a full chunk
+
+    Returns:
+        The rows read; empty once rows is exhausted
+    """
+    if input_idle is None:
+        return list(islice(rows, ROW_CHUNK_SIZE))
+
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= ROW_CHUNK_SIZE or input_idle():
+            break
+    return chunk
+
+
+def _collect_chunk(chunk: List[List[int]], future) -> Iterator[tuple]:
+    """Pairs a finished chunk's rows with their results.
+
+    Args:
+        chunk: Rows that were submitted
+        future: Future returned for the chunk
+
+    Yields:
+        (numbers, *result) for each row in the chunk, see solve_rows
+    """
+    try:
+        results = future.result()
+    except Exception as error:
+        results = [(None, f"{type(error).__name__}: {error}")] * len(chunk)
+
+    for numbers, result in zip(chunk, results):
+        yield (numbers, *result)
+
+
+def format_result(
+    numbers: List[int], result: Optional[int], error: Optional[str], verbose: bool
+) -> str:
+    """Formats one row's outcome as an output line.
+
+    Args:
+        numbers: Integers that were processed
+        result: Frobenius number, or None if no solution exists
+        error: Error message if the row failed, otherwise None
+        verbose: Use a full sentence
+
+    Returns:
+        The output line, without a trailing newline
+    """
+    if isinstance(numbers, MalformedRow):
+        numbers, error = numbers.line, numbers.error
+
+    if error is not None:
+        if verbose:
+            return f"Could not solve units {numbers}: {error}"
+        return f"{numbers} -> error: {error}"
+
+    if verbose:
+        if result is not None:
+            return (
+                f"The largest order volume that is NOT perfectly purchasable "
+                f"for units {numbers} is {result}."
+            )
+        return f"There is no finite solution for units {numbers}."
+
+    return f"{numbers} -> {result}"
+
+
+def calculate_and_print_results(
+    integer_lists: Iterable[List[int]],
+    verbose: bool,
+    engine: str = "python",
+    workers: int = 1,
+    output: Optional[TextIO] = None,
+    cache_path: Optional[str] = None,
+    use_cache: bool = False,
+    table_dir: Optional[str] = None,
+    profile_output: Optional[TextIO] = None,
+    checkpoint: Optional[CheckpointOptions] = None,
+    solve_workers: int = 1,
+    share_prefixes: bool = False,
+    plan_memory: int = DEFAULT_PLAN_MEMORY_BYTES,
+    vectorize: bool = False,
+) -> None:
+    """Calculates and writes Frobenius numbers for each integer list.
+
+    Rows are solved and written one at a time through write_lines. With
+    share_prefixes, rows are instead solved in batches by the batch planner
+    (see batchplan.BatchPlanner), which builds the residue table of each
+    shared unit prefix once. With vectorize, batches are solved with one
+    stacked NumPy table per bucket of similar rows (see
+    vectorbatch.solve_vectorized). In both cases the cache and the other
+    solve options are not used.
+
+    Args:
+        integer_lists: Integer lists to process
+        verbose: Print a full sentence per result
+        engine: Round Robin engine used when no closed form applies
+        workers: Number of worker processes
+        output: Text stream to write to (defaults to sys.stdout)
+        cache_path: SQLite cache file, or None for an in-process memo only
+        use_cache: Reuse results of identical canonical unit sets
+        table_dir: Directory for out-of-core residue tables, if any
+        profile_output: Text stream for one JSON profile line per row;
+            profiling is off when None
+        checkpoint: Optional checkpointing of long Round Robin solves
+        solve_workers: Processes sharing each row's Round Robin table
+        share_prefixes: Share residue tables between rows with common units
+        plan_memory: Bytes of residue tables the batch planner may hold
+        vectorize: Solve batches of rows with whole-array NumPy operations
+    """
+    if share_prefixes or vectorize:
+        if vectorize:
+            results = iter_vectorized_results(integer_lists, engine)
         else:
-            print(f"{numbers} -> {result}")
+            results = iter_planned_results(integer_lists, engine, plan_memory)
+        write_lines(
+            (
+                format_result(numbers, result, error, verbose)
+                for numbers, result, error in results
+            ),
+            output,
+        )
+        return
+
+    results = iter_results(
+        integer_lists,
+        engine,
+        workers,
+        cache_path,
+        use_cache,
+        table_dir,
+        profile=profile_output is not None,
+        checkpoint=checkpoint,
+        solve_workers=solve_workers,
+    )
+    if profile_output is not None:
+        results = _write_profiles(results, profile_output)
+
+    write_lines(
+        (
+            format_result(numbers, result, error, verbose)
+            for numbers, result, error in results
+        ),
+        output,
+    )
+
+
+def _write_profiles(
+    results: Iterable[tuple], profile_output: TextIO
+) -> Iterator[Tuple[List[int], Optional[int], Optional[str]]]:
+    """Writes each row's profile as a JSON line and passes the result on.
+
+    Args:
+        results: (numbers, result, error, profile) tuples from iter_results
+        profile_output: Text stream for the JSON lines
+
+    Yields:
+        (numbers, result, error) for each row
+    """
+    for row, (numbers, result, error, *profile) in enumerate(results, start=1):
+        record = {"row": row, "numbers": numbers, "result": result, "error": error}
+        if isinstance(numbers, MalformedRow):
+            record.update(numbers=numbers.line, error=numbers.error)
+        record.update(profile[0] if profile else {})
+        profile_output.write(json.dumps(record) + "\n")
+        profile_output.flush()
+        yield (numbers, result, error)
+
+
+def parse_stream_line(
+    line: str, line_number: int
+) -> Tuple[object, Optional[List[int]], Optional[str]]:
+    """Parses one stdin line as a JSON row or a CSV row.
+
+    JSON rows are {"id": ..., "units": [...]} objects or bare [...] lists;
+    anything else is read as comma-separated integers. Rows without an id
+    are identified by their line number.
+
+    Args:
+        line: Input line
+        line_number: 1-based line number
+
+    Returns:
+        A tuple of (row_id, numbers, error); numbers is None when the line
+        could not be parsed
+    """
+    row_id = line_number
+    line = line.strip()
+    try:
+        if not line.startswith(("{", "[")):
+            return (row_id, parse_integer_string(line), None)
+
+        record = json.loads(line)
+        numbers = record
+        if isinstance(record, dict):
+            row_id = record.get("id", line_number)
+            numbers = record.get("units")
+        if not isinstance(numbers, list):
+            raise ValueError("JSON rows need a 'units' list")
+        validate_units(numbers)
+        return (row_id, numbers, None)
+    except (TypeError, ValueError) as error:
+        return (row_id, None, f"{type(error).__name__}: {error}")
+
+
+class StreamLineReader:
+    """Reads lines from a stream and tells whether the next one is there yet.
+
+    A text stream such as sys.stdin reads ahead into its own buffer, where
+    select cannot see the lines, so it would report an idle producer while
+    rows are still waiting. Streams with a file descriptor are therefore
+    read here with os.read: every unread line is either in this reader's
+    buffer or still in the descriptor. Other streams are read as they are
+    and never reported idle.
+    """
+
+    def __init__(self, stream: TextIO):
+        """Wraps a stream that has not been read from yet.
+
+        Args:
+            stream: Input stream
+        """
+        self._stream = stream
+        try:
+            self._fd = stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            self._fd = None
+        self._decoder = codecs.getincrementaldecoder(
+            getattr(stream, "encoding", None) or "utf-8"
+        )(getattr(stream, "errors", None) or "strict")
+        self._buffer = ""
+        self._position = 0
+        self._at_eof = False
+
+    def has_pending(self) -> bool:
+        """Checks whether readline would return without waiting.
+
+        Returns:
+            False only when no full line is buffered and the file
+            descriptor has nothing to read
+        """
+        if (
+            self._fd is None
+            or self._at_eof
+            or self._buffer.find("\n", self._position) >= 0
+        ):
+            return True
+        try:
+            readable, _, _ = select.select([self._fd], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+    def readline(self) -> str:
+        """Reads the next line.
+
+        Returns:
+            The line with its newline, or an empty string at the end
+        """
+        if self._fd is None:
+            return self._stream.readline()
+
+        end = self._buffer.find("\n", self._position)
+        while end < 0 and not self._at_eof:
+            data = os.read(self._fd, INPUT_READ_SIZE)
+            self._at_eof = not data
+            self._buffer = self._buffer[self._position :] + self._decoder.decode(
+                data, final=self._at_eof
+            )
+            self._position = 0
+            end = self._buffer.find("\n")
+
+        stop = len(self._buffer) if end < 0 else end + 1
+        line = self._buffer[self._position : stop]
+        self._position = stop
+        return line
+
+
+def iter_stream_rows(
+    reader: StreamLineReader, on_idle: Optional[Callable[[], None]] = None
+) -> Iterator[Tuple[object, Optional[List[int]], Optional[str]]]:
+    """Lazily parses rows from a stream such as stdin, skipping blank lines.
+
+    Args:
+        reader: Reader of the input stream
+        on_idle: Called before a read that would wait for the producer, so
+            buffered output can be flushed while the pipeline is idle
+
+    Yields:
+        (row_id, numbers, error) for each row, see parse_stream_line
+    """
+    line_number = 0
+    while True:
+        if on_idle is not None and not reader.has_pending():
+            on_idle()
+        line = reader.readline()
+        if not line:
+            return
+        line_number += 1
+        if line.strip():
+            yield parse_stream_line(line, line_number)
+
+
+def format_json_result(
+    row_id: object,
+    numbers: Optional[List[int]],
+    result: Optional[int],
+    error: Optional[str],
+) -> str:
+    """Formats one row's outcome as a JSON line.
+
+    Args:
+        row_id: Row id from the input
+        numbers: Integers that were processed, None if the row did not parse
+        result: Frobenius number, or None if no solution exists
+        error: Error message if the row failed, otherwise None
+
+    Returns:
+        The JSON object, without a trailing newline
+    """
+    return json.dumps(
+        {"id": row_id, "units": numbers, "result": result, "error": error}
+    )
+
+
+def stream_json_results(
+    input_stream: TextIO,
+    output: Optional[TextIO] = None,
+    engine: str = "python",
+    workers: int = 1,
+    cache_path: Optional[str] = None,
+    use_cache: bool = False,
+    table_dir: Optional[str] = None,
+    checkpoint: Optional[CheckpointOptions] = None,
+) -> None:
+    """Solves rows from a stream and writes one JSON result line per row.
+
+    Rows are read lazily, solved in input order through iter_results and
+    written through write_lines, which flushes in batches; output is also
+    flushed whenever the input runs dry, so results never wait for the
+    producer. A row that does not parse gets an error line instead of
+    stopping the stream.
+
+    Args:
+        input_stream: Stream with one JSON or CSV row per line
+        output: Text stream to write to (defaults to sys.stdout)
+        engine: Round Robin engine used when no closed form applies
+        workers: Number of worker processes
+        cache_path: SQLite cache file, or None for an in-process memo only
+        use_cache: Reuse results of identical canonical unit sets
+        table_dir: Directory for out-of-core residue tables, if any
+        checkpoint: Optional checkpointing of long Round Robin solves
+    """
+    output = output or sys.stdout
+    reader = StreamLineReader(input_stream)
+
+    # (row_id, parse error) of every row read but not yet written
+    pending_rows = deque()
+
+    def integer_lists() -> Iterator[List[int]]:
+        for row_id, numbers, error in iter_stream_rows(reader, output.flush):
+            pending_rows.append((row_id, error))
+            yield numbers if error is None else []
+
+    results = iter_results(
+        integer_lists(),
+        engine,
+        workers,
+        cache_path,
+        use_cache,
+        table_dir,
+        checkpoint=checkpoint,
+        input_idle=lambda: not reader.has_pending(),
+    )
+
+    def lines() -> Iterator[str]:
+        for numbers, result, error in results:
+            row_id, parse_error = pending_rows.popleft()
+            if parse_error is not None:
+                yield format_json_result(row_id, None, None, parse_error)
+            else:
+                yield format_json_result(row_id, numbers, result, error)
+
+    write_lines(lines(), output)
+
+
+def format_order_result(
+    volume: int, purchasable: bool, units: List[int], verbose: bool
+) -> str:
+    """Formats one order volume check as an output line.
+
+    Args:
+        volume: Order volume that was checked
+        purchasable: Whether the volume is perfectly purchasable
+        units: Units the volume was checked against
+        verbose: Use a full sentence
+
+    Returns:
+        The output line, without a trailing newline
+    """
+    if verbose:
+        negation = "" if purchasable else "NOT "
+        return (
+            f"The order volume {volume} is {negation}perfectly purchasable "
+            f"for units {units}."
+        )
+    return f"{volume} -> {purchasable}"
+
+
+def format_order_plan(
+    volume: int, combination: Optional[Dict[int, int]], verbose: bool
+) -> str:
+    """Formats one order's fewest-package combination as an output line.
+
+    Args:
+        volume: Order volume that was planned
+        combination: {unit: count}, or None if the volume is not purchasable
+        verbose: Use a full sentence
+
+    Returns:
+        The output line, without a trailing newline
+    """
+    if combination is None:
+        if verbose:
+            return f"The order volume {volume} is NOT perfectly purchasable."
+        return f"{volume} -> None"
+
+    packages = " + ".join(f"{count}x{unit}" for unit, count in combination.items())
+    if verbose:
+        total = sum(combination.values())
+        return (
+            f"The order volume {volume} is filled with {total} packages: "
+            f"{packages or 'none'}."
+        )
+    return f"{volume} -> {packages or 0}"
+
+
+def format_estimate(numbers: List[int], row_estimate: Estimate, verbose: bool) -> str:
+    """Formats one row's estimate as an output line.
+
+    Args:
+        numbers: Integers that were estimated
+        row_estimate: Bounds and predicted cost for the row
+        verbose: Use a full sentence
+
+    Returns:
+        The output line, without a trailing newline
+    """
+    if row_estimate.lower is None:
+        if verbose:
+            return f"There is no finite solution for units {numbers}."
+        return f"{numbers} -> None"
+
+    path = row_estimate.method
+    if row_estimate.engine is not None:
+        path += f"/{row_estimate.engine}"
+    if verbose:
+        return (
+            f"The largest order volume that is NOT perfectly purchasable for "
+            f"units {numbers} is between {row_estimate.lower} and "
+            f"{row_estimate.upper}; solving it with {path} should take about "
+            f"{row_estimate.seconds:.3g} s and {row_estimate.table_bytes} bytes."
+        )
+    return (
+        f"{numbers} -> {row_estimate.lower}..{row_estimate.upper} "
+        f"({path}, ~{row_estimate.seconds:.3g} s, {row_estimate.table_bytes} bytes)"
+    )
+
+
+def estimate_and_print_results(
+    integer_lists: Iterable[List[int]],
+    verbose: bool,
+    engine: str = "python",
+    output: Optional[TextIO] = None,
+    closed_forms: bool = True,
+) -> None:
+    """Writes an estimate instead of a result for each integer list.
+
+    Estimates are cheap (see estimator.estimate), so rows are handled in
+    this process, one at a time.
+
+    Args:
+        integer_lists: Integer lists to process
+        verbose: Print a full sentence per row
+        engine: Round Robin engine the solve would use
+        output: Text stream to write to (defaults to sys.stdout)
+        closed_forms: Report exact values for rows with a closed form
+    """
+
+    def lines() -> Iterator[str]:
+        for numbers in integer_lists:
+            if isinstance(numbers, MalformedRow):
+                yield format_result(numbers, None, None, verbose)
+                continue
+            try:
+                row_estimate = estimate(numbers, engine, closed_forms)
+                yield format_estimate(numbers, row_estimate, verbose)
+            except (TypeError, ValueError) as error:
+                yield format_result(
+                    numbers, None, f"{type(error).__name__}: {error}", verbose
+                )
+
+    write_lines(lines(), output)
+
+
+def format_portfolio_result(
+    result: Optional[PortfolioResult], count: int, verbose: bool
+) -> str:
+    """Formats the outcome of a portfolio search as an output line.
+
+    Args:
+        result: Best subset, or None if no subset has a solution
+        count: Number of units that were chosen
+        verbose: Use a full sentence
+
+    Returns:
+        The output line, without a trailing newline
+    """
+    if result is None:
+        if verbose:
+            return f"No {count} of the units have a finite solution."
+        return "None"
+
+    if verbose:
+        return (
+            f"The best {count} units are {result.units}: the largest order volume "
+            f"that is NOT perfectly purchasable is {result.frobenius_number} and "
+            f"{result.genus} volumes are NOT perfectly purchasable."
+        )
+    return f"{result.units} -> {result.frobenius_number} ({result.genus} gaps)"
+
+
+def check_and_print_orders(
+    numbers: List[int],
+    order_file: Path,
+    verbose: bool,
+    engine: str = "python",
+    output: Optional[TextIO] = None,
+    plan: bool = False,
+) -> None:
+    """Checks, or plans, every order volume in a file against one unit set.
+
+    The residue table is built once and the file is processed in batches of
+    ORDER_CHUNK_SIZE volumes. With plan, each purchasable volume is
+    printed with the package combination that uses the fewest packages.
+
+    Args:
+        numbers: Units to check against
+        order_file: File with one order volume per line
+        verbose: Print a full sentence per order
+        engine: Round Robin engine used to build the residue table
+        output: Text stream to write to (defaults to sys.stdout)
+        plan: Print fewest-package combinations instead of True/False
+    """
+    batches = iter_order_volumes(order_file)
+    if plan:
+        lines = (
+            format_order_plan(volume, combination, verbose)
+            for volume, combination in plan_order_batches(
+                OrderPlanner(numbers), batches
+            )
+        )
+    else:
+        checker = OrderChecker(numbers, engine, cache=_row_cache)
+        lines = (
+            format_order_result(volume, purchasable, numbers, verbose)
+            for volume, purchasable in check_order_batches(checker, batches)
+        )
+    write_lines(lines, output)
+
+
+def write_lines(lines: Iterable[str], output: Optional[TextIO] = None) -> None:
+    """Writes lines through a buffered stream as they are produced.
+
+    Output is flushed after the first line, then every OUTPUT_FLUSH_ROWS
+    lines or OUTPUT_FLUSH_SECONDS seconds, whichever comes first.
+
+    Args:
+        lines: Lines to write, without trailing newlines
+        output: Text stream to write to (defaults to sys.stdout)
+    """
+    output = output or sys.stdout
+    last_flush = time.monotonic()
+
+    for line_count, line in enumerate(lines, start=1):
+        output.write(line + "\n")
+
+        now = time.monotonic()
+        if (
+            line_count == 1
+            or line_count % OUTPUT_FLUSH_ROWS == 0
+            or now - last_flush >= OUTPUT_FLUSH_SECONDS
+        ):
+            output.flush()
+            last_flush = now
+
+    output.flush()
 
 
 def main():
     """Main entry point for the Frobenius calculator."""
     parser = create_argument_parser()
     args = parser.parse_args()
+    if args.cache and args.no_cache:
+        parser.error("--cache and --no-cache cannot be used together")
+    if args.orders and not args.units:
+        parser.error("--orders requires -u/--units")
+    if args.plan and not args.orders:
+        parser.error("--plan requires --orders")
+    if args.portfolio and not args.units:
+        parser.error("--portfolio requires -u/--units")
+    if args.estimate and (args.stdin or args.serve or args.orders):
+        parser.error("--estimate requires -u/--units or -f/--file")
+    if args.no_closed_forms and not args.estimate:
+        parser.error("--no-closed-forms requires --estimate")
+    if args.estimate and (args.sweep or args.portfolio or args.profile):
+        parser.error("--estimate cannot be used with --sweep, --portfolio or --profile")
+    if args.sweep and not args.units:
+        parser.error("--sweep requires -u/--units")
+    if args.sweep and (args.orders or args.portfolio):
+        parser.error("--sweep cannot be used with --orders or --portfolio")
+    if args.portfolio and args.orders:
+        parser.error("--portfolio cannot be used with --orders")
+    if (args.max_first or args.objective != "frobenius") and not args.portfolio:
+        parser.error("--objective and --max-first require --portfolio")
+    if args.profile and args.orders:
+        parser.error("--profile cannot be used with --orders")
+    if args.profile and args.stdin:
+        parser.error("--profile cannot be used with --stdin")
+    checkpointing = args.checkpoint_dir or args.resume or args.time_budget
+    if args.solve_workers > 1 and (args.table_dir or args.profile or checkpointing):
+        parser.error(
+            "--solve-workers cannot be combined with --table-dir, --profile or "
+            "checkpoints"
+        )
+    if args.table_dir and checkpointing:
+        parser.error("--table-dir cannot be combined with checkpoints")
+    if args.vectorize and args.share_prefixes:
+        parser.error("--vectorize cannot be used with --share-prefixes")
+    if args.vectorize and np is None:
+        parser.error("--vectorize requires numpy to be installed")
+    batch_flag = "--vectorize" if args.vectorize else "--share-prefixes"
+    batched = args.share_prefixes or args.vectorize
+    if batched and not (args.units or args.file):
+        parser.error(f"{batch_flag} requires -u/--units or -f/--file")
+    if batched and (
+        args.workers > 1
+        or args.solve_workers > 1
+        or args.table_dir
+        or args.profile
+        or checkpointing
+    ):
+        parser.error(
+            f"{batch_flag} cannot be combined with --workers, --solve-workers, "
+            "--table-dir, --profile or checkpoints"
+        )
+    if batched and (args.estimate or args.sweep or args.portfolio or args.orders):
+        parser.error(
+            f"{batch_flag} cannot be used with --estimate, --sweep, "
+            "--portfolio or --orders"
+        )
+    if args.plan_memory != DEFAULT_PLAN_MEMORY_BYTES >> 20 and not args.share_prefixes:
+        parser.error("--plan-memory requires --share-prefixes")
+
+    checkpoint = None
+    if checkpointing:
+        checkpoint = CheckpointOptions(
+            Path(args.checkpoint_dir or DEFAULT_CHECKPOINT_DIR),
+            interval=args.checkpoint_interval,
+            resume=args.resume,
+            deadline=time.time() + args.time_budget if args.time_budget else None,
+        )
+
+    if args.serve:
+        run_server(args.serve, args.engine, args.workers, args.cache, not args.no_cache)
+        return
+
+    # Let calculate_and_print_results decide when to flush
+    sys.stdout.reconfigure(line_buffering=False)
+
+    if args.sweep:
+        numbers = parse_integer_string(args.units)
+        unit, candidates = args.sweep
+        if unit not in numbers:
+            parser.error(f"--sweep unit {unit} is not one of the units {numbers}")
+        rows = sweep_unit(numbers, unit, candidates, args.engine, args.workers)
+        write_lines(format_sweep_table(rows))
+        return
+
+    if args.portfolio:
+        result = search_portfolio(
+            parse_integer_string(args.units),
+            args.portfolio,
+            args.objective,
+            args.max_first,
+            args.workers,
+        )
+        print(format_portfolio_result(result, args.portfolio, args.verbose))
+        return
+
+    if args.orders:
+        init_row_cache(args.cache, not args.no_cache)
+        check_and_print_orders(
+            parse_integer_string(args.units),
+            Path(args.orders),
+            args.verbose,
+            args.engine,
+            plan=args.plan,
+        )
+        return
+
+    if args.stdin:
+        stream_json_results(
+            sys.stdin,
+            engine=args.engine,
+            workers=args.workers,
+            cache_path=args.cache,
+            use_cache=not args.no_cache,
+            table_dir=args.table_dir,
+            checkpoint=checkpoint,
+        )
+        return
 
     integer_lists = process_input_args(args)
-    calculate_and_print_results(integer_lists, args.verbose)
+    if args.estimate:
+        estimate_and_print_results(
+            integer_lists,
+            args.verbose,
+            args.engine,
+            closed_forms=not args.no_closed_forms,
+        )
+        return
+
+    calculate_and_print_results(
+        integer_lists,
+        args.verbose,
+        args.engine,
+        args.workers,
+        cache_path=args.cache,
+        use_cache=not args.no_cache,
+        table_dir=args.table_dir,
+        profile_output=sys.stderr if args.profile else None,
+        checkpoint=checkpoint,
+        solve_workers=args.solve_workers,
+        share_prefixes=args.share_prefixes,
+        plan_memory=args.plan_memory << 20,
+        vectorize=args.vectorize,
+    )
 
 
 if __name__ == "__main__":
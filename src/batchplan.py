@@ -0,0 +1,204 @@
+import math
+from copy import copy
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from canonical import canonicalize_units
+from dispatch import select_method, solve
+from frobenius import (
+    TABLE_ENTRY_BYTES,
+    frobenius_from_table,
+    extend_residue_table,
+    pass_engine,
+    validate_engine,
+)
+from sweep import build_fixed_table
+
+# Rows read and planned together; results of a batch are written before the
+# next batch is read
+PLAN_BATCH_ROWS = 4096
+
+# Default limit on the residue tables held at once while walking the trie
+DEFAULT_PLAN_MEMORY_BYTES = 1 << 30
+
+
+class PrefixNode:
+    """A sorted unit prefix shared by one or more rows.
+
+    Attributes:
+        children: Longer prefixes, keyed by their last unit
+        rows: Indices of the rows whose canonical units end here
+    """
+
+    def __init__(self):
+        self.children: Dict[int, "PrefixNode"] = {}
+        self.rows: List[int] = []
+
+
+class BatchPlanner:
+    """Solves a batch of rows while sharing residue tables between them.
+
+    Rows that need a Round Robin table are canonicalized and inserted into a
+    trie of sorted unit prefixes, one root per a₁. The trie is walked depth
+    first: each prefix's table is built once, with one pass on its parent's
+    table, and rows ending at a prefix read their answer off it. Identical
+    canonical sets land on the same node and are solved once.
+
+    A child takes over its parent's table in place when it is the parent's
+    last child, since the parent's subtree is then finished; earlier
+    children work on copies. If a copy would push the tables held along the
+    current path above memory_limit, the parent's table is handed over
+    anyway and rebuilt from scratch for the remaining children.
+
+    Rows with a closed form, no solution or invalid input go through
+    dispatch.solve directly.
+
+    Attributes:
+        engine: Round Robin engine, "python" or "numpy"
+        memory_limit: Bytes of residue tables to hold at once
+        evictions: Number of parent tables given up to stay under the limit
+    """
+
+    def __init__(
+        self, engine: str = "python", memory_limit: int = DEFAULT_PLAN_MEMORY_BYTES
+    ):
+        """Sets up an empty planner.
+
+        Args:
+            engine: Round Robin engine, one of ENGINES; dijkstra, sieve and
+                auto are mapped to a pass-based engine per root
+            memory_limit: Bytes of residue tables to hold at once
+
+        Raises:
+            ValueError: If engine is not one of ENGINES
+        """
+        validate_engine(engine)
+        self.engine = engine
+        self.memory_limit = memory_limit
+        self.evictions = 0
+        self._held_bytes = 0
+
+    def solve_batch(
+        self, integer_lists: List[List[int]]
+    ) -> List[Tuple[Optional[int], Optional[str]]]:
+        """Solves every row of a batch.
+
+        Args:
+            integer_lists: Rows to solve
+
+        Returns:
+            One (result, error) tuple per row, in input order
+        """
+        results: List[Tuple[Optional[int], Optional[str]]] = [(None, None)] * len(
+            integer_lists
+        )
+        roots: Dict[int, PrefixNode] = {}
+        root_engines: Dict[int, str] = {}
+
+        for index, numbers in enumerate(integer_lists):
+            try:
+                units = canonicalize_units(numbers).units if len(numbers) > 1 else []
+                if (
+                    len(units) < 2
+                    or math.gcd(*units) != 1
+                    or select_method(units) != "round_robin"
+                ):
+                    results[index] = (solve(numbers, self.engine).value, None)
+                    continue
+            except Exception as error:
+                results[index] = (None, f"{type(error).__name__}: {error}")
+                continue
+
+            node = roots.setdefault(units[0], PrefixNode())
+            root_engines.setdefault(units[0], pass_engine(units, self.engine))
+            for unit in units[1:]:
+                node = node.children.setdefault(unit, PrefixNode())
+            node.rows.append(index)
+
+        for first_num, root in roots.items():
+            engine = root_engines[first_num]
+            residue_table = build_fixed_table([first_num], engine)
+            self._held_bytes += TABLE_ENTRY_BYTES * first_num
+            self._walk(root, [first_num], engine, residue_table, results)
+        return results
+
+    def _walk(
+        self,
+        node: PrefixNode,
+        prefix: List[int],
+        engine: str,
+        residue_table,
+        results: list,
+    ) -> None:
+        """Answers the rows of a node and its subtree.
+
+        The caller counts residue_table in the held bytes; this call releases
+        it once the subtree is done or the table is handed to a child.
+
+        Args:
+            node: Trie node to solve
+            prefix: Units on the path to the node
+            engine: "python" or "numpy", used to rebuild the prefix table
+            residue_table: Table of the prefix, owned by this call
+            results: Per-row results to fill in
+        """
+        first_num = prefix[0]
+        table_bytes = TABLE_ENTRY_BYTES * first_num
+        if node.rows:
+            value = frobenius_from_table(residue_table, first_num)
+            for index in node.rows:
+                results[index] = (value, None)
+
+        children = sorted(node.children.items())
+        for position, (unit, child) in enumerate(children):
+            if residue_table is None:
+                # Given up earlier to stay under the memory limit
+                residue_table = build_fixed_table(prefix, engine)
+                self._held_bytes += table_bytes
+
+            last_child = position == len(children) - 1
+            over_limit = self._held_bytes + table_bytes > self.memory_limit
+            if last_child or over_limit:
+                child_table = extend_residue_table(
+                    residue_table, first_num, unit, in_place=True
+                )
+                residue_table = None
+                self._held_bytes -= table_bytes
+                self.evictions += not last_child
+            else:
+                child_table = extend_residue_table(residue_table, first_num, unit)
+                if child_table is residue_table:
+                    # The unit adds nothing, but the child owns its table
+                    child_table = copy(residue_table)
+            self._held_bytes += table_bytes
+            self._walk(child, prefix + [unit], engine, child_table, results)
+
+        if residue_table is not None:
+            self._held_bytes -= table_bytes
+
+
+def iter_planned_results(
+    integer_lists: Iterable[List[int]],
+    engine: str = "python",
+    memory_limit: int = DEFAULT_PLAN_MEMORY_BYTES,
+    batch_rows: int = PLAN_BATCH_ROWS,
+) -> Iterator[Tuple[List[int], Optional[int], Optional[str]]]:
+    """Solves rows in planned batches, yielding results in input order.
+
+    Args:
+        integer_lists: Rows to solve
+        engine: Round Robin engine, one of ENGINES
+        memory_limit: Bytes of residue tables to hold at once
+        batch_rows: Rows planned together
+
+    Yields:
+        (numbers, result, error) for each row
+    """
+    planner = BatchPlanner(engine, memory_limit)
+    rows = iter(integer_lists)
+    while True:
+        batch = list(islice(rows, batch_rows))
+        if not batch:
+            return
+        for numbers, result in zip(batch, planner.solve_batch(batch)):
+            yield (numbers, *result)
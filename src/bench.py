@@ -0,0 +1,484 @@
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from dispatch import solve
+from frobenius import (
+    ENGINES,
+    build_residue_table,
+    np,
+    select_engine,
+    solve_for_frobenius_number,
+)
+
+DEFAULT_CASES_PATH = Path(__file__).resolve().parent.parent / "docs" / "test_cases.csv"
+
+# A case slows down by more than this fraction of its baseline median to count
+# as a regression
+DEFAULT_THRESHOLD = 0.10
+
+FAMILIES = (
+    "random_coprime",
+    "arithmetic_sequence",
+    "large_first_unit",
+    "many_units",
+    "high_pairwise_gcd",
+)
+
+# Grid of the crossover benchmark: smallest unit × number of units, with the
+# other units drawn from (a₁, CROSSOVER_SPREAD·a₁)
+CROSSOVER_FIRST_UNITS = (20, 100, 1000, 10000)
+CROSSOVER_UNIT_COUNTS = (3, 5, 10, 20, 40)
+CROSSOVER_SPREAD = 4
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Returns the nearest-rank percentile of a list of samples.
+
+    Args:
+        samples: Measured values
+        fraction: Percentile as a fraction, e.g. 0.95
+
+    Returns:
+        The smallest sample with at least that fraction of samples at or below it
+    """
+    ordered = sorted(samples)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def _coprime_units(
+    rng: random.Random, first_num: int, count: int, high: int
+) -> List[int]:
+    """Draws sorted distinct units above first_num until they are coprime.
+
+    Args:
+        rng: Random source
+        first_num: Smallest unit
+        count: Total number of units
+        high: Upper bound for the other units
+
+    Returns:
+        A sorted, coprime list of count units starting with first_num
+    """
+    while True:
+        units = [first_num] + rng.sample(range(first_num + 1, high), count - 1)
+        if math.gcd(*units) == 1:
+            return sorted(units)
+
+
+def generate_family(name: str, seed: int, scale: int = 1) -> Dict[str, List[int]]:
+    """Generates the parametrized cases of one benchmark family.
+
+    Args:
+        name: One of FAMILIES
+        seed: Seed for the random source, so runs are reproducible
+        scale: Multiplier for the smallest unit, to run bigger or smaller suites
+
+    Returns:
+        Case name -> units
+    """
+    rng = random.Random(f"{name}:{seed}")
+    cases = {}
+
+    if name == "random_coprime":
+        for count in (3, 5, 8):
+            first_num = 2000 * scale
+            cases[f"{name}:k{count}"] = _coprime_units(
+                rng, first_num, count, 4 * first_num
+            )
+
+    elif name == "arithmetic_sequence":
+        for count in (3, 6, 12):
+            first_num = 5000 * scale + 1
+            step = rng.choice(
+                [step for step in range(2, 200) if math.gcd(step, first_num) == 1]
+            )
+            cases[f"{name}:k{count}"] = [first_num + i * step for i in range(count)]
+
+    elif name == "large_first_unit":
+        for first_num in (20000 * scale, 100000 * scale):
+            cases[f"{name}:a{first_num}"] = _coprime_units(
+                rng, first_num, 4, 2 * first_num
+            )
+
+    elif name == "many_units":
+        for count in (20, 50):
+            first_num = 1000 * scale
+            cases[f"{name}:k{count}"] = _coprime_units(
+                rng, first_num, count, 10 * first_num
+            )
+
+    elif name == "high_pairwise_gcd":
+        first_num = 6930 * scale
+        factors = [d for d in range(2, 100) if first_num % d == 0]
+        for count in (4, 8):
+            units = [first_num]
+            while len(units) < count - 1:
+                unit = rng.choice(factors) * rng.randint(
+                    first_num // 50, first_num // 2
+                )
+                if unit > first_num and unit not in units:
+                    units.append(unit)
+            units.append(_coprime_units(rng, first_num, 2, 3 * first_num)[1])
+            cases[f"{name}:k{count}"] = sorted(units)
+
+    else:
+        raise ValueError(f"Unknown family '{name}'. Choose from {FAMILIES}")
+
+    return cases
+
+
+def generate_crossover_cases(
+    seed: int,
+    first_units: Iterable[int] = CROSSOVER_FIRST_UNITS,
+    unit_counts: Iterable[int] = CROSSOVER_UNIT_COUNTS,
+) -> Dict[str, List[int]]:
+    """Generates one random coprime set per cell of the crossover grid.
+
+    Args:
+        seed: Seed for the random source, so runs are reproducible
+        first_units: Smallest units (a₁) to cover
+        unit_counts: Numbers of units (k) to cover
+
+    Returns:
+        Case name ("crossover:a<a₁>:k<k>") -> units
+    """
+    rng = random.Random(f"crossover:{seed}")
+    return {
+        f"crossover:a{first_num}:k{count}": _coprime_units(
+            rng, first_num, count, CROSSOVER_SPREAD * first_num
+        )
+        for first_num in first_units
+        for count in unit_counts
+    }
+
+
+def run_crossover(cases: Dict[str, List[int]], repeats: int = 3) -> dict:
+    """Times every engine on every case to show where each one is fastest.
+
+    Args:
+        cases: Case name -> units, e.g. from generate_crossover_cases
+        repeats: Number of timed runs per engine and case
+
+    Returns:
+        A report with a "meta" section and one "cases" entry per case,
+        holding the median time of each engine, the fastest engine and the
+        engine select_engine picks for engine="auto"
+    """
+    engines = ["python", "dijkstra", "sieve"] + (["numpy"] if np is not None else [])
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "engines": engines,
+            "repeats": repeats,
+        },
+        "cases": {},
+    }
+    for name, units in cases.items():
+        medians = {}
+        for engine in engines:
+            samples = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                build_residue_table(units, engine)
+                samples.append(time.perf_counter() - start)
+            medians[engine] = statistics.median(samples)
+
+        report["cases"][name] = {
+            "units": units,
+            "median_s": medians,
+            "fastest": min(medians, key=medians.get),
+            "selected": select_engine(units),
+        }
+    return report
+
+
+def format_crossover_table(report: dict) -> List[str]:
+    """Lays out a crossover report as an a₁ × k grid of engine names.
+
+    Each cell shows the fastest engine, followed by the engine auto would
+    pick when they differ.
+
+    Args:
+        report: Report from run_crossover on generate_crossover_cases
+
+    Returns:
+        One line per a₁, after a header line
+    """
+    grid: Dict[int, Dict[int, str]] = {}
+    for case in report["cases"].values():
+        units = case["units"]
+        cell = case["fastest"]
+        if case["selected"] != cell:
+            cell += f" (auto: {case['selected']})"
+        grid.setdefault(units[0], {})[len(units)] = cell
+
+    counts = sorted({count for row in grid.values() for count in row})
+    width = max([len(cell) for row in grid.values() for cell in row.values()] + [8])
+    lines = ["a1 \\ k".rjust(8) + "".join(f"{count:>{width + 2}}" for count in counts)]
+    for first_num in sorted(grid):
+        cells = (grid[first_num].get(count, "") for count in counts)
+        lines.append(
+            f"{first_num:>8}" + "".join(f"{cell:>{width + 2}}" for cell in cells)
+        )
+    return lines
+
+
+def load_csv_cases(path: Path) -> Dict[str, List[int]]:
+    """Loads benchmark cases from a CSV file of unit sets.
+
+    Args:
+        path: CSV file with one comma-separated unit set per line
+
+    Returns:
+        Case name ("csv:<line number>") -> units
+    """
+    cases = {}
+    with open(path, mode="r") as file:
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            if line:
+                cases[f"csv:{line_number:02d}"] = [int(num) for num in line.split(",")]
+    return cases
+
+
+def time_case(solver: Callable[[list], object], units: List[int], repeats: int) -> dict:
+    """Times one case and measures its peak traced memory.
+
+    Timing runs are done without tracing; peak memory comes from one extra
+    run under tracemalloc, since tracing slows allocation-heavy code.
+
+    Args:
+        solver: Function that solves a unit list
+        units: Units to solve
+        repeats: Number of timed runs
+
+    Returns:
+        A dict with units, result, median_s, p95_s, peak_bytes and samples_s
+    """
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = solver(list(units))
+        samples.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    solver(list(units))
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "units": units,
+        "result": getattr(result, "value", result),
+        "median_s": statistics.median(samples),
+        "p95_s": percentile(samples, 0.95),
+        "peak_bytes": peak_bytes,
+        "samples_s": samples,
+    }
+
+
+def compare_to_baseline(report: dict, baseline: dict, threshold: float) -> List[dict]:
+    """Finds cases whose median time regressed against a baseline report.
+
+    Args:
+        report: Report from run_benchmarks
+        baseline: Earlier report to compare against
+        threshold: Allowed slowdown as a fraction of the baseline median
+
+    Returns:
+        One dict per regressed case with name, baseline_s, current_s and ratio
+    """
+    regressions = []
+    for name, current in report["cases"].items():
+        previous = baseline.get("cases", {}).get(name)
+        if previous is None or previous["median_s"] <= 0:
+            continue
+        ratio = current["median_s"] / previous["median_s"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                {
+                    "name": name,
+                    "baseline_s": previous["median_s"],
+                    "current_s": current["median_s"],
+                    "ratio": ratio,
+                }
+            )
+    return regressions
+
+
+def run_benchmarks(
+    cases: Dict[str, List[int]],
+    engine: str = "python",
+    repeats: int = 5,
+    use_dispatch: bool = False,
+    legacy: bool = False,
+) -> dict:
+    """Runs every case and collects a JSON-serializable report.
+
+    Args:
+        cases: Case name -> units
+        engine: Engine passed to the solver
+        repeats: Number of timed runs per case
+        use_dispatch: Time dispatch.solve instead of solve_for_frobenius_number
+        legacy: Time the original list-based kernel instead, so a saved
+            report can serve as a baseline for the table engines
+
+    Returns:
+        A report with a "meta" section and one "cases" entry per case
+    """
+
+    def solve_with_dispatch(units: List[int]):
+        return solve(units, engine=engine)
+
+    def solve_with_legacy_kernel(units: List[int]):
+        return solve_for_frobenius_number(units, legacy=True)
+
+    def solve_with_round_robin(units: List[int]):
+        return solve_for_frobenius_number(units, engine=engine)
+
+    if use_dispatch:
+        solver_name, solver = "dispatch", solve_with_dispatch
+    elif legacy:
+        solver_name, solver = "legacy", solve_with_legacy_kernel
+    else:
+        solver_name, solver = "round_robin", solve_with_round_robin
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "engine": engine,
+            "solver": solver_name,
+            "repeats": repeats,
+        },
+        "cases": {},
+    }
+    for name, units in cases.items():
+        report["cases"][name] = time_case(solver, units, repeats)
+    return report
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """Creates and configures the benchmark argument parser.
+
+    Returns:
+        Configured argument parser
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Frobenius solver and compare against a baseline."
+    )
+    parser.add_argument(
+        "--cases",
+        default=str(DEFAULT_CASES_PATH),
+        help="CSV file of unit sets to time (default: docs/test_cases.csv)",
+    )
+    parser.add_argument(
+        "--families",
+        nargs="*",
+        choices=FAMILIES,
+        default=list(FAMILIES),
+        help="Generated case families to include (default: all)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for generated cases")
+    parser.add_argument(
+        "--scale", type=int, default=1, help="Multiplier for generated unit sizes"
+    )
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per case")
+    parser.add_argument("--engine", choices=ENGINES, default="python")
+    solvers = parser.add_mutually_exclusive_group()
+    solvers.add_argument(
+        "--dispatch",
+        action="store_true",
+        help="Time the dispatcher (closed forms first) instead of Round Robin",
+    )
+    solvers.add_argument(
+        "--legacy",
+        action="store_true",
+        help="Time the original list-based Round Robin kernel instead",
+    )
+    parser.add_argument(
+        "--crossover",
+        action="store_true",
+        help=(
+            "Time every engine on a grid of smallest units and unit counts and "
+            "show which engine is fastest where"
+        ),
+    )
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="Earlier JSON report to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed median slowdown vs. the baseline (default: 0.10 = 10%%)",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the benchmark suite.
+
+    Returns:
+        0 if there is no regression against the baseline, 1 otherwise
+    """
+    args = create_argument_parser().parse_args(argv)
+
+    if args.crossover:
+        report = run_crossover(generate_crossover_cases(args.seed), args.repeats)
+        if args.output:
+            Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+        else:
+            print(json.dumps(report, indent=2))
+        for line in format_crossover_table(report):
+            print(line, file=sys.stderr)
+        return 0
+
+    cases = load_csv_cases(Path(args.cases)) if args.cases else {}
+    for family in args.families:
+        cases.update(generate_family(family, args.seed, args.scale))
+
+    report = run_benchmarks(
+        cases, args.engine, args.repeats, args.dispatch, args.legacy
+    )
+    report["meta"]["seed"] = args.seed
+    report["meta"]["scale"] = args.scale
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    else:
+        print(json.dumps(report, indent=2))
+
+    for name, case in report["cases"].items():
+        print(
+            f"{name:32} median {case['median_s'] * 1000:10.2f} ms  "
+            f"p95 {case['p95_s'] * 1000:10.2f} ms  "
+            f"peak {case['peak_bytes'] / 1024:10.1f} KiB",
+            file=sys.stderr,
+        )
+
+    if not args.baseline:
+        return 0
+
+    baseline = json.loads(Path(args.baseline).read_text())
+    regressions = compare_to_baseline(report, baseline, args.threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression['name']}: {regression['baseline_s'] * 1000:.2f} ms "
+            f"-> {regression['current_s'] * 1000:.2f} ms ({regression['ratio']:.2f}x)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
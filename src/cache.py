@@ -0,0 +1,260 @@
+import sqlite3
+import time
+import zlib
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+# Size limits for the two cache layers
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MEMO_MAX_BYTES = 64 * 1024 * 1024
+
+# Rough per-entry overhead added to the stored size, so sets with no table
+# still count towards the limit
+ENTRY_OVERHEAD_BYTES = 64
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    units TEXT PRIMARY KEY,
+    value TEXT,
+    method TEXT NOT NULL,
+    residue_table BLOB,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+
+class CacheEntry(NamedTuple):
+    """A cached solve for one canonical unit set.
+
+    Attributes:
+        value: The Frobenius number, or None if no solution exists
+        method: Dispatch method that produced the value
+        residue_table: Final residue table (int64 array), or None when a
+            closed form was used
+    """
+
+    value: Optional[int]
+    method: str
+    residue_table: Optional[array]
+
+
+def cache_key(units: list) -> str:
+    """Builds the cache key for a canonical unit set.
+
+    Args:
+        units: Sorted, zero-free, non-redundant units
+
+    Returns:
+        The units joined with commas
+    """
+    return ",".join(str(unit) for unit in units)
+
+
+def pack_residue_table(residue_table) -> bytes:
+    """Serializes a residue table as compressed int64 bytes.
+
+    Args:
+        residue_table: An int64 array or NumPy array
+
+    Returns:
+        zlib-compressed table bytes
+    """
+    return zlib.compress(residue_table.tobytes())
+
+
+def unpack_residue_table(blob: bytes) -> array:
+    """Restores a residue table written by pack_residue_table.
+
+    Args:
+        blob: zlib-compressed table bytes
+
+    Returns:
+        The residue table as an int64 array
+    """
+    residue_table = array("q")
+    residue_table.frombytes(zlib.decompress(blob))
+    return residue_table
+
+
+def _entry_size(key: str, residue_table) -> int:
+    """Estimates the memory a memoized entry holds.
+
+    Args:
+        key: Cache key
+        residue_table: The entry's residue table, or None
+
+    Returns:
+        Size in bytes
+    """
+    size = ENTRY_OVERHEAD_BYTES + len(key)
+    if residue_table is not None:
+        size += len(residue_table) * residue_table.itemsize
+    return size
+
+
+class ResultCache:
+    """Two-level cache of solves keyed by canonical unit set.
+
+    Lookups hit an in-process LRU memo first, then an optional SQLite file.
+    Both layers are bounded by size and evict the least recently used
+    entries. Entries keep the residue table, not just the answer, so other
+    queries on the same set can reuse it.
+
+    Attributes:
+        path: SQLite file, or None for a memo-only cache
+        max_bytes: Size limit of the SQLite layer
+        memo_max_bytes: Size limit of the in-process memo
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        memo_max_bytes: int = DEFAULT_MEMO_MAX_BYTES,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.memo_max_bytes = memo_max_bytes
+        self._memo = OrderedDict()
+        self._memo_bytes = 0
+        self._connection = None
+
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            # Not thread-safe, but callers may move it to another thread and
+            # use it from there only (see server.SolverService)
+            self._connection = sqlite3.connect(
+                str(path), timeout=30, check_same_thread=False
+            )
+            self._connection.execute(SCHEMA)
+            self._connection.commit()
+
+    def get(self, units: list) -> Optional[CacheEntry]:
+        """Looks up a canonical unit set.
+
+        Args:
+            units: Sorted, zero-free, non-redundant units
+
+        Returns:
+            The cached entry, or None on a miss
+        """
+        key = cache_key(units)
+
+        if key in self._memo:
+            self._memo.move_to_end(key)
+            return self._memo[key][0]
+
+        if self._connection is None:
+            return None
+
+        row = self._connection.execute(
+            "SELECT value, method, residue_table FROM results WHERE units = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        self._connection.execute(
+            "UPDATE results SET last_used = ? WHERE units = ?", (time.time(), key)
+        )
+        self._connection.commit()
+
+        value, method, blob = row
+        entry = CacheEntry(
+            None if value is None else int(value),
+            method,
+            None if blob is None else unpack_residue_table(blob),
+        )
+        self._remember(key, entry)
+        return entry
+
+    def put(
+        self, units: list, value: Optional[int], method: str, residue_table=None
+    ) -> None:
+        """Stores the solve of a canonical unit set.
+
+        Args:
+            units: Sorted, zero-free, non-redundant units
+            value: The Frobenius number, or None if no solution exists
+            method: Dispatch method that produced the value
+            residue_table: Final residue table, if one was built; wide tables
+                (see frobenius.table_fits) are not kept, only their value
+        """
+        key = cache_key(units)
+        if isinstance(residue_table, list):
+            residue_table = None
+        # Only memoized tables are copied, so a table too large for the memo
+        # is not held twice
+        memo_table = residue_table
+        if (
+            residue_table is not None
+            and not isinstance(residue_table, array)
+            and _entry_size(key, residue_table) <= self.memo_max_bytes
+        ):
+            memo_table = array("q", residue_table.tobytes())
+        self._remember(key, CacheEntry(value, method, memo_table))
+
+        if self._connection is None:
+            return
+
+        blob = None if residue_table is None else pack_residue_table(residue_table)
+        size = ENTRY_OVERHEAD_BYTES + len(key) + (len(blob) if blob else 0)
+        self._connection.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                None if value is None else str(value),
+                method,
+                blob,
+                size,
+                time.time(),
+            ),
+        )
+        self._evict()
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Closes the SQLite connection, if any."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        """Adds an entry to the memo and evicts down to memo_max_bytes.
+
+        An entry larger than memo_max_bytes on its own is not kept, so its
+        table can be freed once the caller is done with it.
+
+        Args:
+            key: Cache key
+            entry: Entry to keep
+        """
+        size = _entry_size(key, entry.residue_table)
+        if key in self._memo:
+            self._memo_bytes -= self._memo.pop(key)[1]
+        if size > self.memo_max_bytes:
+            return
+        self._memo[key] = (entry, size)
+        self._memo_bytes += size
+
+        while self._memo_bytes > self.memo_max_bytes:
+            _, (_, evicted_size) = self._memo.popitem(last=False)
+            self._memo_bytes -= evicted_size
+
+    def _evict(self) -> None:
+        """Deletes least recently used rows until the file fits max_bytes."""
+        total = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()[0]
+
+        while total > self.max_bytes:
+            row = self._connection.execute(
+                "SELECT units, size FROM results ORDER BY last_used LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._connection.execute("DELETE FROM results WHERE units = ?", (row[0],))
+            total -= row[1]
@@ -0,0 +1,102 @@
+from typing import List, NamedTuple, Tuple
+
+# Units up to this size are checked for representability by the smaller units
+# with a bitset sieve; larger units only get the cheaper multiple check.
+REPRESENTABILITY_SIEVE_LIMIT = 1 << 20
+
+
+class CanonicalUnits(NamedTuple):
+    """Canonical form of a unit set.
+
+    Attributes:
+        units: Sorted, deduplicated, zero-free units with no redundant generators
+        removed: (unit, reason) pairs for every input value that was dropped
+    """
+
+    units: List[int]
+    removed: List[Tuple[int, str]]
+
+
+def validate_units(numbers: list) -> None:
+    """Checks that every value is a non-negative integer.
+
+    Booleans are rejected even though bool is a subclass of int, since a
+    JSON true would otherwise be read as a unit of 1.
+
+    Args:
+        numbers: Values to check
+
+    Raises:
+        TypeError: If any value is not an integer
+        ValueError: If any value is negative
+    """
+    for num in numbers:
+        if not isinstance(num, int) or isinstance(num, bool):
+            raise TypeError(f"Units must be integers, got {type(num).__name__}")
+        if num < 0:
+            raise ValueError(f"Units must be non-negative, got {num}")
+
+
+def canonicalize_units(numbers: list, keep_redundant: bool = False) -> CanonicalUnits:
+    """Reduces a unit set to the smallest equivalent set of generators.
+
+    Removing a unit that is a non-negative combination of smaller units does
+    not change which order volumes are reachable, so it does not change the
+    Frobenius number. Dropping them up front shrinks k, and sorting makes sure
+    the residue table is sized by the true smallest unit a₁.
+
+    Example with [10, 0, 3, 5, 3, 8]:
+    ```
+    Value | Reason
+    ------+--------------------
+      0   | zero
+      3   | duplicate
+     10   | multiple of 5
+      8   | representable (3+5)
+    ```
+    which leaves [3, 5].
+
+    Args:
+        numbers: A list of non-negative integers in any order
+        keep_redundant: Only drop zeros and duplicates, e.g. when package
+            counts matter and a redundant unit can still save packages
+
+    Returns:
+        CanonicalUnits with the remaining units and what was removed
+
+    Raises:
+        TypeError: If any value is not an integer
+        ValueError: If any value is negative
+    """
+    validate_units(numbers)
+
+    removed = []
+    units = []
+
+    # Bit n of reachable is set when n is a combination of the kept units
+    sieve_limit = min(max(numbers, default=0), REPRESENTABILITY_SIEVE_LIMIT)
+    sieve_mask = (1 << (sieve_limit + 1)) - 1
+    reachable = 1
+
+    for num in sorted(numbers):
+        if num == 0:
+            removed.append((num, "zero"))
+        elif units and num == units[-1]:
+            removed.append((num, "duplicate"))
+        elif keep_redundant:
+            units.append(num)
+        elif any(num % unit == 0 for unit in units):
+            divisor = next(unit for unit in units if num % unit == 0)
+            removed.append((num, f"multiple of {divisor}"))
+        elif num <= sieve_limit and reachable >> num & 1:
+            removed.append((num, "representable"))
+        else:
+            units.append(num)
+
+            # Doubling shifts add 0..(2ʲ-1) copies of num in j steps
+            shift = num
+            while shift <= sieve_limit:
+                reachable = (reachable | reachable << shift) & sieve_mask
+                shift <<= 1
+
+    return CanonicalUnits(units, removed)
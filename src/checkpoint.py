@@ -0,0 +1,151 @@
+import hashlib
+import json
+import os
+import zlib
+from array import array
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+# Default seconds between snapshots of a running solve
+DEFAULT_CHECKPOINT_INTERVAL = 60.0
+
+# Residue cycle steps walked between checks of the deadline and snapshot
+# interval, so a pass over a large a₁ can stop and resume part way
+CHECKPOINT_STEPS = 1 << 20
+
+# Directory used by --resume and --time-budget when no --checkpoint-dir is given
+DEFAULT_CHECKPOINT_DIR = ".frobenius_checkpoints"
+
+# First line of every checkpoint file, bumped when the layout changes
+CHECKPOINT_MAGIC = b"FROBENIUS-CHECKPOINT 1\n"
+
+
+class CheckpointOptions(NamedTuple):
+    """How a Round Robin solve snapshots its progress.
+
+    Attributes:
+        directory: Directory holding one checkpoint file per unit set
+        interval: Seconds between snapshots
+        resume: Continue from an existing checkpoint instead of starting over
+        deadline: time.time() after which the solve saves and stops, or None
+    """
+
+    directory: Path
+    interval: float = DEFAULT_CHECKPOINT_INTERVAL
+    resume: bool = False
+    deadline: Optional[float] = None
+
+
+class PassPosition(NamedTuple):
+    """Where an unfinished Round Robin pass stopped.
+
+    Attributes:
+        cycle: Residue cycle to continue with
+        steps: Steps of that cycle already walked
+        saved_val: Value carried along the cycle, or None if the cycle has
+            not been started
+    """
+
+    cycle: int
+    steps: int
+    saved_val: Optional[int]
+
+
+class Checkpoint(NamedTuple):
+    """A saved Round Robin solve.
+
+    Attributes:
+        units: Canonical units being solved
+        next_index: Index in units of the next unit to add
+        residue_table: Residue table after units[:next_index], plus the part
+            of the next pass before position
+        position: Where the pass of units[next_index] stopped, or None if it
+            has not started
+    """
+
+    units: List[int]
+    next_index: int
+    residue_table: array
+    position: Optional[PassPosition] = None
+
+
+def checkpoint_path(directory: Path, units: list) -> Path:
+    """Names the checkpoint file of a canonical unit set.
+
+    Args:
+        directory: Checkpoint directory
+        units: Sorted, zero-free units
+
+    Returns:
+        directory / <digest of the units>.ckpt
+    """
+    key = ",".join(str(unit) for unit in units)
+    return Path(directory) / f"{hashlib.sha1(key.encode()).hexdigest()[:20]}.ckpt"
+
+
+def save_checkpoint(
+    path: Path,
+    units: list,
+    next_index: int,
+    residue_table,
+    position: Optional[PassPosition] = None,
+) -> None:
+    """Writes a checkpoint atomically.
+
+    The file is written next to its final name and then renamed over it, so
+    a solve killed mid-write leaves the previous checkpoint intact.
+
+    Args:
+        path: Checkpoint file
+        units: Canonical units being solved
+        next_index: Index in units of the next unit to add
+        residue_table: Residue table after units[:next_index], plus the part
+            of the next pass before position
+        position: Where the pass of units[next_index] stopped, or None if it
+            has not started
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    header = json.dumps(
+        {"units": units, "next_index": next_index, "position": position}
+    ).encode()
+    temporary_path = path.with_name(path.name + ".tmp")
+
+    with open(temporary_path, "wb") as file:
+        file.write(CHECKPOINT_MAGIC)
+        file.write(header + b"\n")
+        file.write(zlib.compress(residue_table.tobytes()))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_path, path)
+
+
+def load_checkpoint(path: Path) -> Optional[Checkpoint]:
+    """Reads a checkpoint written by save_checkpoint.
+
+    Args:
+        path: Checkpoint file
+
+    Returns:
+        The checkpoint, or None if the file does not exist
+
+    Raises:
+        ValueError: If the file is not a checkpoint
+    """
+    try:
+        with open(path, "rb") as file:
+            if file.readline() != CHECKPOINT_MAGIC:
+                raise ValueError(f"{path} is not a Frobenius checkpoint")
+            header = json.loads(file.readline())
+            residue_table = array("q")
+            residue_table.frombytes(zlib.decompress(file.read()))
+    except FileNotFoundError:
+        return None
+
+    position = header.get("position")
+    return Checkpoint(
+        header["units"],
+        header["next_index"],
+        residue_table,
+        None if position is None else PassPosition(*position),
+    )
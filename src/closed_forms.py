@@ -0,0 +1,108 @@
+import math
+from typing import Optional
+
+
+def frobenius_two_units(a: int, b: int) -> int:
+    """Computes the Frobenius number of two coprime units (Sylvester).
+
+    Args:
+        a: A positive integer
+        b: A positive integer coprime to a
+
+    Returns:
+        a·b - a - b
+    """
+    return a * b - a - b
+
+
+def arithmetic_sequence_step(units: list) -> Optional[int]:
+    """Returns the common difference if the units form an arithmetic sequence.
+
+    Args:
+        units: A sorted list of at least three positive integers
+
+    Returns:
+        The difference d with units = [a, a+d, ..., a+sd], or None
+    """
+    step = units[1] - units[0]
+    for prev, current in zip(units[1:], units[2:]):
+        if current - prev != step:
+            return None
+    return step
+
+
+def frobenius_arithmetic_sequence(first: int, step: int, count: int) -> int:
+    """Computes the Frobenius number of an arithmetic sequence (Roberts).
+
+    For units [a, a+d, ..., a+sd] with gcd(a, d) = 1:
+
+        g = (⌊(a-2)/s⌋ + 1)·a + (d-1)(a-1) - 1
+
+    Example with [9901, 10000, 10099] (a=9901, d=99, s=2):
+    ```
+    (⌊9899/2⌋ + 1)·9901 + 98·9900 - 1 = 49980149
+    ```
+
+    Args:
+        first: The smallest unit a
+        step: The common difference d, coprime to a
+        count: The number of units, s + 1
+
+    Returns:
+        The Frobenius number
+    """
+    s = count - 1
+    return ((first - 2) // s + 1) * first + (step - 1) * (first - 1) - 1
+
+
+def frobenius_three_units(a1: int, a2: int, a3: int) -> int:
+    """Computes the Frobenius number of three units with overall gcd 1.
+
+    Common factors between pairs are removed with Johnson's reduction
+
+        g(a₁, a₂, a₃) = d·g(a₁/d, a₂/d, a₃) + (d-1)·a₃,  d = gcd(a₁, a₂)
+
+    and the pairwise coprime case is solved with Rødseth's algorithm, which
+    runs a negative-remainder Euclidean expansion of a₁/s₀ where
+    s₀ ≡ a₂⁻¹·a₃ (mod a₁). The work is O(log a₁).
+
+    Args:
+        a1: A positive integer
+        a2: A positive integer
+        a3: A positive integer, with gcd(a1, a2, a3) = 1
+
+    Returns:
+        The Frobenius number
+    """
+    a1, a2, a3 = sorted((a1, a2, a3))
+    if a1 == 1:
+        return -1
+
+    # Johnson's reduction on any pair that shares a factor
+    for x, y, z in ((a1, a2, a3), (a1, a3, a2), (a2, a3, a1)):
+        d = math.gcd(x, y)
+        if d > 1:
+            return d * frobenius_three_units(x // d, y // d, z) + (d - 1) * z
+
+    # Rødseth: a₁ = q₁s₀ - s₁, s₀ = q₂s₁ - s₂, ... until sₘ₊₁ = 0
+    s_values = [a1, a3 * pow(a2, -1, a1) % a1]
+    p_values = [0, 1]
+    if s_values[1] == 0:
+        # a₃ is a multiple of a₁ and adds nothing
+        return frobenius_two_units(a1, a2)
+    while s_values[-1]:
+        quotient = -(-s_values[-2] // s_values[-1])
+        s_values.append(quotient * s_values[-1] - s_values[-2])
+        p_values.append(quotient * p_values[-1] - p_values[-2])
+
+    # rᵢ = (sᵢ·a₂ - pᵢ·a₃) / a₁ decreases; find rᵥ > 0 >= rᵥ₊₁
+    v = 0
+    while (s_values[v + 1] * a2 - p_values[v + 1] * a3) > 0:
+        v += 1
+
+    return (
+        -a1
+        + a2 * (s_values[v] - 1)
+        + a3 * (p_values[v + 1] - 1)
+        - min(a2 * s_values[v + 1], a3 * p_values[v])
+    )
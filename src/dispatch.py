@@ -0,0 +1,241 @@
+import math
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+from canonical import canonicalize_units
+from closed_forms import (
+    arithmetic_sequence_step,
+    frobenius_arithmetic_sequence,
+    frobenius_three_units,
+    frobenius_two_units,
+)
+from frobenius import (
+    build_residue_table,
+    frobenius_from_table,
+    table_fits,
+    validate_engine,
+)
+from outofcore import solve_out_of_core
+from parallel import build_shared_residue_table
+
+# Paths recorded in Solution.method
+METHODS = (
+    "no_solution",
+    "single_unit",
+    "two_units",
+    "arithmetic_sequence",
+    "three_units",
+    "round_robin",
+)
+
+
+class Solution(NamedTuple):
+    """Result of a dispatched solve.
+
+    Attributes:
+        value: The Frobenius number, or None if no solution exists
+        method: Which path produced the value, one of METHODS
+        removed: (unit, reason) pairs dropped by canonicalize_units
+    """
+
+    value: Optional[int]
+    method: str
+    removed: List[Tuple[int, str]]
+
+
+def select_method(units: list) -> str:
+    """Picks the cheapest exact method for a canonical, coprime unit set.
+
+    Method              | Applies when                  | Cost
+    --------------------+-------------------------------+-----------
+    single_unit         | units == [1]                  | O(1)
+    two_units           | k = 2                         | O(1)
+    arithmetic_sequence | a, a+d, ..., a+sd             | O(k)
+    three_units         | k = 3                         | O(log a₁)
+    round_robin         | anything else                 | O(k·a₁)
+
+    Args:
+        units: Sorted, zero-free, non-redundant units with gcd 1
+
+    Returns:
+        The selected method name
+    """
+    if len(units) == 1:
+        return "single_unit"
+    if len(units) == 2:
+        return "two_units"
+    if arithmetic_sequence_step(units) is not None:
+        return "arithmetic_sequence"
+    if len(units) == 3:
+        return "three_units"
+    return "round_robin"
+
+
+def solve_units(
+    units: list,
+    engine: str = "python",
+    table_dir: Optional[Path] = None,
+    profile=None,
+    checkpoint=None,
+    workers: int = 1,
+) -> tuple:
+    """Solves an already canonical unit set.
+
+    Args:
+        units: Sorted, zero-free, non-redundant units (see canonicalize_units)
+        engine: Round Robin engine used for the fallback
+        table_dir: Keep the Round Robin table in a memory-mapped file in this
+            directory instead of in memory (see outofcore); ignored for
+            units whose table does not fit in int64 (see table_fits)
+        profile: Optional profiling.SolveProfile passed on to
+            build_residue_table; the Frobenius number extraction is timed as
+            its table_max phase
+        checkpoint: Optional checkpoint.CheckpointOptions passed on to
+            build_residue_table
+        workers: With more than one, spread the Round Robin table's
+            independent cycles across processes (see parallel); ignored with
+            table_dir, profile or checkpoint and, like table_dir, for units
+            that do not fit in int64
+
+    Returns:
+        A tuple of (value, method, residue_table); residue_table is only
+        returned on the in-memory round_robin path
+    """
+    if not units or math.gcd(*units) != 1:
+        return (None, "no_solution", None)
+
+    method = select_method(units)
+    residue_table = None
+    if method == "single_unit":
+        value = -1
+    elif method == "two_units":
+        value = frobenius_two_units(*units)
+    elif method == "arithmetic_sequence":
+        step = arithmetic_sequence_step(units)
+        value = frobenius_arithmetic_sequence(units[0], step, len(units))
+    elif method == "three_units":
+        value = frobenius_three_units(*units)
+    elif table_dir is not None and table_fits(units):
+        value = solve_out_of_core(units, table_dir)
+    elif workers > 1 and profile is None and checkpoint is None and table_fits(units):
+        residue_table = build_shared_residue_table(units, engine, workers)
+        value = frobenius_from_table(residue_table, units[0])
+    else:
+        residue_table = build_residue_table(units, engine, profile, checkpoint)
+        with profile.phase("table_max") if profile is not None else nullcontext():
+            value = frobenius_from_table(residue_table, units[0])
+
+    return (value, method, residue_table)
+
+
+def solve(
+    numbers: list,
+    engine: str = "python",
+    cache=None,
+    table_dir: Optional[Path] = None,
+    profile=None,
+    checkpoint=None,
+    workers: int = 1,
+) -> Solution:
+    """Computes the Frobenius number with the fastest applicable exact method.
+
+    The input is canonicalized first, then select_method picks a closed form
+    or falls back to the Round Robin table built by the chosen engine. When a
+    cache (see cache.ResultCache) is given, it is consulted with the canonical
+    units before solving and filled in afterwards.
+
+    Args:
+        numbers: A list of non-negative integers
+        engine: Round Robin engine used for the fallback
+        cache: Optional result cache
+        table_dir: Directory for an out-of-core Round Robin table
+        profile: Optional profiling.SolveProfile to record phase times,
+            counters, the method and cache hits in
+        checkpoint: Optional checkpoint.CheckpointOptions to save Round
+            Robin progress to disk, see build_residue_table
+        workers: Processes sharing one Round Robin table, see solve_units
+
+    Returns:
+        A Solution with the value, the method used and the removed units
+
+    Raises:
+        TimeoutError: If a checkpoint deadline passed; progress is saved
+    """
+    validate_engine(engine)
+
+    # Same contract as solve_for_frobenius_number
+    if len(numbers) < 2:
+        return Solution(None, "no_solution", [])
+
+    if profile is not None:
+        return _solve_profiled(numbers, engine, cache, table_dir, profile, checkpoint)
+
+    units, removed = canonicalize_units(numbers)
+
+    if cache is not None:
+        entry = cache.get(units)
+        if entry is not None:
+            return Solution(entry.value, entry.method, removed)
+
+    value, method, residue_table = solve_units(
+        units, engine, table_dir, checkpoint=checkpoint, workers=workers
+    )
+
+    if cache is not None:
+        cache.put(units, value, method, residue_table)
+
+    return Solution(value, method, removed)
+
+
+def _solve_profiled(
+    numbers: list,
+    engine: str,
+    cache,
+    table_dir: Optional[Path],
+    profile,
+    checkpoint=None,
+) -> Solution:
+    """Runs solve while timing each phase, see profiling.SolveProfile.
+
+    Args:
+        numbers: A list of non-negative integers
+        engine: Round Robin engine used for the fallback
+        cache: Optional result cache
+        table_dir: Directory for an out-of-core Round Robin table
+        profile: profiling.SolveProfile to fill in
+        checkpoint: Optional checkpoint.CheckpointOptions
+
+    Returns:
+        The same Solution as solve
+    """
+    with profile.phase("canonicalize"):
+        units, removed = canonicalize_units(numbers)
+    profile.details["units"] = units
+
+    if cache is not None:
+        with profile.phase("cache_lookup"):
+            entry = cache.get(units)
+        profile.details["cache_hit"] = entry is not None
+        if entry is not None:
+            profile.details["method"] = entry.method
+            return Solution(entry.value, entry.method, removed)
+
+    start = time.perf_counter()
+    value, method, residue_table = solve_units(
+        units, engine, table_dir, profile, checkpoint
+    )
+    seconds = time.perf_counter() - start
+    profile.details["method"] = method
+    if method == "no_solution":
+        profile.add_phase("gcd", seconds)
+    elif method != "round_robin":
+        profile.add_phase("closed_form", seconds)
+    elif table_dir is not None and table_fits(units):
+        profile.add_phase("out_of_core", seconds)
+
+    if cache is not None:
+        cache.put(units, value, method, residue_table)
+
+    return Solution(value, method, removed)
@@ -0,0 +1,203 @@
+import math
+from typing import Dict, NamedTuple, Optional
+
+from canonical import canonicalize_units
+from dispatch import select_method, solve_units
+from frobenius import (
+    TABLE_ENTRY_BYTES,
+    estimate_engine_cost,
+    select_engine,
+    validate_engine,
+)
+
+
+class Estimate(NamedTuple):
+    """Predicted size and cost of a solve, computed without solving.
+
+    Attributes:
+        lower: Lower bound on the Frobenius number, or None if no solution
+            exists
+        upper: Upper bound on the Frobenius number, or None if no solution
+            exists
+        method: Method the dispatcher would use, one of dispatch.METHODS
+        engine: Round Robin engine that would run, or None for closed forms
+        seconds: Predicted solve time
+        table_bytes: Size of the residue table the solve would build
+    """
+
+    lower: Optional[int]
+    upper: Optional[int]
+    method: str
+    engine: Optional[str]
+    seconds: float
+    table_bytes: int
+
+
+def _ceil_root(value: int, degree: int) -> int:
+    """Returns ⌈value^(1/degree)⌉ in exact integer arithmetic.
+
+    Args:
+        value: A positive integer
+        degree: Root degree, at least 1
+
+    Returns:
+        The smallest r with r^degree >= value
+    """
+    root = max(1, int(math.exp(math.log(value) / degree)))
+    while root**degree > value:
+        root -= 1
+    while root**degree < value:
+        root += 1
+    return root
+
+
+def brauer_bound(units: list) -> int:
+    """Brauer's upper bound, exact for two units.
+
+        g <= Σᵢ₌₂ᵏ aᵢ·dᵢ₋₁/dᵢ - Σᵢ₌₁ᵏ aᵢ,  dᵢ = gcd(a₁, ..., aᵢ)
+
+    Args:
+        units: Sorted, distinct units with gcd 1, at least two
+
+    Returns:
+        The bound
+    """
+    bound = -units[0]
+    prefix_gcd = units[0]
+    for unit in units[1:]:
+        next_gcd = math.gcd(prefix_gcd, unit)
+        bound += unit * prefix_gcd // next_gcd - unit
+        prefix_gcd = next_gcd
+    return bound
+
+
+def schur_bound(units: list) -> int:
+    """Schur's upper bound g <= (a₁ - 1)(aₖ - 1) - 1.
+
+    Args:
+        units: Sorted, distinct units with gcd 1, at least two
+
+    Returns:
+        The bound
+    """
+    return (units[0] - 1) * (units[-1] - 1) - 1
+
+
+def erdos_graham_bound(units: list) -> int:
+    """Erdős and Graham's upper bound g <= 2·aₖ₋₁·⌊aₖ/k⌋ - aₖ.
+
+    Args:
+        units: Sorted, distinct units with gcd 1, at least two
+
+    Returns:
+        The bound
+    """
+    return 2 * units[-2] * (units[-1] // len(units)) - units[-1]
+
+
+def volume_lower_bound(units: list) -> int:
+    """Lower bound from counting combinations, exact for two units.
+
+    Fewer than N^(k-1) / ((k-1)!·a₂⋯aₖ) combinations of a₂..aₖ lie below
+    N, and all a₁ residues need one, which gives
+
+        g >= ((k-1)!·a₁⋯aₖ)^(1/(k-1)) - Σ aᵢ
+
+    Args:
+        units: Sorted, distinct units with gcd 1, at least two
+
+    Returns:
+        The bound
+    """
+    degree = len(units) - 1
+    volume = math.factorial(degree) * math.prod(units)
+    return _ceil_root(volume, degree) - sum(units)
+
+
+def davison_lower_bound(units: list) -> int:
+    """Davison's lower bound for three units, g >= √(3·a₁a₂a₃) - a₁ - a₂ - a₃.
+
+    Args:
+        units: Three sorted, distinct units with gcd 1
+
+    Returns:
+        The bound
+    """
+    return _ceil_root(3 * math.prod(units), 2) - sum(units)
+
+
+def frobenius_bounds(units: list) -> Dict[str, int]:
+    """Evaluates every applicable bound for a unit set.
+
+    Each bound takes O(k) arithmetic on numbers of O(k log aₖ) bits.
+
+    Args:
+        units: Sorted, distinct units with gcd 1, at least two
+
+    Returns:
+        {name: value} for the lower bounds "trivial" (1 to a₁ - 1 are gaps),
+        "volume" and, for three units, "davison", and the upper bounds
+        "brauer", "schur" and "erdos_graham"
+    """
+    bounds = {
+        "trivial": units[0] - 1 if units[0] > 1 else -1,
+        "volume": volume_lower_bound(units),
+        "brauer": brauer_bound(units),
+        "schur": schur_bound(units),
+        "erdos_graham": erdos_graham_bound(units),
+    }
+    if len(units) == 3:
+        bounds["davison"] = davison_lower_bound(units)
+    return bounds
+
+
+def estimate(
+    numbers: list, engine: str = "python", closed_forms: bool = True
+) -> Estimate:
+    """Bounds the Frobenius number and predicts the cost of solving it.
+
+    The units are canonicalized so the prediction matches what dispatch.solve
+    would do. Closed forms are cheap, so their exact value is returned as
+    both bounds; otherwise the bounds come from frobenius_bounds and the
+    time from the engine cost model (see estimate_engine_cost).
+
+    Args:
+        numbers: A list of non-negative integers
+        engine: Round Robin engine that would be used, one of ENGINES
+        closed_forms: Use closed forms where they apply; without them every
+            set of two or more units is bounded and costed as a Round Robin
+            solve, which is where Davison's bound for three units applies
+
+    Returns:
+        The estimate
+
+    Raises:
+        ValueError: If engine is not one of ENGINES
+    """
+    validate_engine(engine)
+    no_solution = Estimate(None, None, "no_solution", None, 0.0, 0)
+    if len(numbers) < 2:
+        return no_solution
+
+    units = canonicalize_units(numbers).units
+    if not units or math.gcd(*units) != 1:
+        return no_solution
+
+    method = select_method(units)
+    if not closed_forms and len(units) > 1:
+        method = "round_robin"
+    if method != "round_robin":
+        value = solve_units(units)[0]
+        return Estimate(value, value, method, None, 0.0, 0)
+
+    if engine == "auto":
+        engine = select_engine(units)
+    bounds = frobenius_bounds(units)
+    return Estimate(
+        max(bounds["trivial"], bounds["volume"], bounds.get("davison", -1)),
+        min(bounds["brauer"], bounds["schur"], bounds["erdos_graham"]),
+        method,
+        engine,
+        estimate_engine_cost(units, engine),
+        TABLE_ENTRY_BYTES * units[0],
+    )
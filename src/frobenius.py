@@ -1,5 +1,67 @@
+import heapq
 import math
-from typing import Optional, List
+import re
+import time
+from array import array
+from contextlib import nullcontext
+from copy import copy
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+from canonical import canonicalize_units
+from checkpoint import (
+    CHECKPOINT_STEPS,
+    PassPosition,
+    checkpoint_path,
+    load_checkpoint,
+    save_checkpoint,
+)
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only the "numpy" engine needs it
+    np = None
+
+# Marks residues that cannot be reached yet. Stored as the largest int64 so
+# the residue table can live in a compact typed array instead of a list of
+# boxed ints and float("inf") objects.
+RESIDUE_SENTINEL = 2**63 - 1
+
+# Marks unreached residues in a wide residue table, a list of Python ints
+# used when entries may not fit in int64 (see table_fits)
+WIDE_SENTINEL = math.inf
+
+# Bytes per residue table entry (one int64)
+TABLE_ENTRY_BYTES = 8
+
+# Engines selectable through solve_for_frobenius_number(engine=...); "auto"
+# picks the cheapest of the others with select_engine
+ENGINES = ("python", "numpy", "dijkstra", "sieve", "auto")
+
+# Cost model used by select_engine, in seconds. Measured with CPython 3.11
+# on random, large-unit and shared-gcd sets with a₁ from 10³ to 10⁵ and k
+# from 3 to 40:
+# - python: per table entry per pass, plus per residue class per pass
+# - numpy: per table entry per pass, plus fixed per-pass overhead
+# - dijkstra: per table entry per log₂(a₁), plus per entry per unit
+# - sieve: per bitset bit per shift-or, plus per residue class read off the
+#   bitset; measured on sets with a₁ from 20 to 10⁴, k from 3 to 40 and units
+#   from clustered just above a₁ to spread over 10·a₁
+PYTHON_ENTRY_COST = 0.23e-6
+PYTHON_CLASS_COST = 0.3e-6
+NUMPY_ENTRY_COST = 0.06e-6
+NUMPY_PASS_COST = 20e-6
+DIJKSTRA_HEAP_COST = 0.07e-6
+DIJKSTRA_EDGE_COST = 0.18e-6
+SIEVE_BIT_COST = 0.1e-9
+# Residue class read off the sieve bitset
+SIEVE_CLASS_COST = 0.53e-6
+
+# Bytes of the sieve bitset that hold a residue table entry
+NONZERO_BYTE = re.compile(rb"[^\x00]")
+
+# Widest bitset the sieve engine builds (512 MiB per int, with a few such
+# ints alive during a shift-or step); wider sets use a pass-based engine
+SIEVE_MAX_WINDOW_BITS = 1 << 32
 
 
 def compute_gcd_values(first_number: int, number_list: list) -> tuple:
@@ -42,7 +104,523 @@ def is_list_coprime(remaining_nums: list) -> bool:
     return total_gcd == 1
 
 
-def solve_for_frobenius_number(numbers: list) -> Optional[int]:
+def new_residue_table(first_num: int, wide: bool = False):
+    """Creates the initial residue table for the smallest unit.
+
+    Args:
+        first_num: The smallest unit (a₁), which sets the table size
+        wide: Make a list of Python ints instead, for units whose entries
+            may not fit in int64 (see table_fits)
+
+    Returns:
+        An int64 array of length a₁ with n₀ = 0 and every other residue
+        set to RESIDUE_SENTINEL, or a list with WIDE_SENTINEL if wide
+    """
+    if wide:
+        residue_table = [WIDE_SENTINEL] * first_num
+    else:
+        residue_table = array("q", [RESIDUE_SENTINEL]) * first_num
+    residue_table[0] = 0
+    return residue_table
+
+
+def table_fits(units: list) -> bool:
+    """Checks that every residue table entry of a unit set fits in int64.
+
+    A reached entry nₚ is at most (a₁ - 1)·aₖ: a sum of a₁ or more units
+    has a non-empty part divisible by a₁ (take prefix sums mod a₁), and
+    dropping it gives a smaller volume in the same residue class. a₁·aₖ is
+    therefore above every entry.
+
+    Args:
+        units: Sorted, zero-free units (see canonicalize_units)
+
+    Returns:
+        True if a₁·aₖ stays below RESIDUE_SENTINEL
+    """
+    return units[0] * units[-1] < RESIDUE_SENTINEL
+
+
+def widen_residue_table(residue_table) -> list:
+    """Copies an int64 residue table into a wide one (see new_residue_table).
+
+    Args:
+        residue_table: int64 array or NumPy residue table
+
+    Returns:
+        A list of Python ints with WIDE_SENTINEL for unreached residues
+    """
+    return [
+        WIDE_SENTINEL if entry == RESIDUE_SENTINEL else int(entry)
+        for entry in residue_table
+    ]
+
+
+def unreached_value(residue_table):
+    """Returns the value that marks unreached residues of a residue table.
+
+    Args:
+        residue_table: Residue table of any kind
+
+    Returns:
+        WIDE_SENTINEL for a wide table, RESIDUE_SENTINEL otherwise
+    """
+    return WIDE_SENTINEL if isinstance(residue_table, list) else RESIDUE_SENTINEL
+
+
+def round_robin_pass(
+    residue_table: array,
+    first_num: int,
+    current_num: int,
+    current_gcd: int,
+    remainders: Optional[range] = None,
+) -> None:
+    """Applies one Round Robin pass for a single unit, updating the table in place.
+
+    Each of the current_gcd residue cycles is walked once, starting from its
+    smallest entry. The minimum of a cycle is found with a strided slice of
+    the table, so no per-step lists are built. Cycle r holds the residues
+    congruent to r mod current_gcd, so cycles never share entries and can be
+    walked by different processes (see parallel).
+
+    Args:
+        residue_table: Residue table to update
+        first_num: The smallest unit (a₁)
+        current_num: The unit being added
+        current_gcd: gcd(a₁, current_num)
+        remainders: Cycles to walk, a subrange of range(current_gcd); all of
+            them by default
+    """
+    if remainders is None:
+        remainders = range(current_gcd)
+    cycle_length = first_num // current_gcd
+    unreached = unreached_value(residue_table)
+
+    for remainder in remainders:
+        saved_val = min(residue_table[remainder::current_gcd])
+        if saved_val == unreached:
+            continue
+        walk_cycle(residue_table, first_num, current_num, saved_val, cycle_length)
+
+
+def walk_cycle(
+    residue_table, first_num: int, current_num: int, saved_val: int, steps: int
+) -> int:
+    """Walks part of a residue cycle, adding current_num at every step.
+
+    Args:
+        residue_table: Residue table to update
+        first_num: The smallest unit (a₁)
+        current_num: The unit being added
+        saved_val: Table entry the walk starts from
+        steps: Number of steps to walk
+
+    Returns:
+        The table entry the walk stopped at, to continue the walk from
+    """
+    for _ in range(steps):
+        saved_val += current_num
+        table_position = saved_val % first_num
+        existing_val = residue_table[table_position]
+        if saved_val < existing_val:
+            residue_table[table_position] = saved_val
+        else:
+            saved_val = existing_val
+    return saved_val
+
+
+def numpy_pass_fits(first_num: int, current_num: int) -> bool:
+    """Checks that numpy_round_robin_pass cannot overflow int64.
+
+    Its step offsets reach a₁² and its ramp of j·aᵢ reaches a₁·aᵢ, both
+    of which wrap around silently in NumPy.
+
+    Args:
+        first_num: The smallest unit (a₁)
+        current_num: The unit being added
+
+    Returns:
+        True if both stay below RESIDUE_SENTINEL
+    """
+    return first_num * max(first_num, current_num) < RESIDUE_SENTINEL
+
+
+def numpy_round_robin_pass(
+    residue_table,
+    first_num: int,
+    current_num: int,
+    current_gcd: int,
+    remainders: Optional[range] = None,
+) -> None:
+    """Applies one Round Robin pass for a single unit using whole-array operations.
+
+    All current_gcd residue cycles are laid out as rows of a 2D index array and
+    rotated so each row starts at its smallest entry. Walking a cycle computes
+    vⱼ = min(tⱼ, vⱼ₋₁ + aᵢ), which is the cumulative minimum of tⱼ - j·aᵢ
+    shifted back by j·aᵢ, so each row is a single np.minimum.accumulate scan.
+
+    Units too large for int64 intermediates (see numpy_pass_fits) are
+    added with round_robin_pass on a copy of the table instead.
+
+    Args:
+        residue_table: int64 NumPy residue table to update
+        first_num: The smallest unit (a₁)
+        current_num: The unit being added
+        current_gcd: gcd(a₁, current_num)
+        remainders: Cycles to update, a subrange of range(current_gcd); all
+            of them by default
+    """
+    if not numpy_pass_fits(first_num, current_num):
+        python_table = array("q", residue_table.tobytes())
+        round_robin_pass(python_table, first_num, current_num, current_gcd, remainders)
+        residue_table[:] = np.frombuffer(python_table, dtype=np.int64)
+        return
+
+    if remainders is None:
+        remainders = range(current_gcd)
+    cycle_length = first_num // current_gcd
+    steps = np.arange(cycle_length, dtype=np.int64)
+
+    # positions[r, j] is the j-th residue visited from residue r
+    offsets = steps * (current_num % first_num) % first_num
+    starts = np.arange(remainders.start, remainders.stop, dtype=np.int64)
+    positions = (starts[:, None] + offsets) % first_num
+    cycles = residue_table[positions]
+
+    # Rotate every cycle so it starts at its minimum
+    order = (cycles.argmin(axis=1)[:, None] + steps) % cycle_length
+    positions = np.take_along_axis(positions, order, axis=1)
+    cycles = np.take_along_axis(cycles, order, axis=1)
+
+    # Unreached cycles stay at the sentinel: (S - j·aᵢ) + j·aᵢ = S
+    ramp = steps * current_num
+    residue_table[positions] = np.minimum.accumulate(cycles - ramp, axis=1) + ramp
+
+
+def numpy_walk_cycle(
+    residue_table, first_num: int, current_num: int, saved_val: int, steps: int
+) -> int:
+    """Walks part of a residue cycle with whole-array operations, see walk_cycle.
+
+    The same cumulative minimum as numpy_round_robin_pass, with saved_val
+    prepended so the scan continues from it. Needs numpy_pass_fits.
+
+    Args:
+        residue_table: int64 NumPy residue table to update
+        first_num: The smallest unit (a₁)
+        current_num: The unit being added
+        saved_val: Table entry the walk starts from
+        steps: Number of steps to walk
+
+    Returns:
+        The table entry the walk stopped at, to continue the walk from
+    """
+    offsets = np.arange(1, steps + 1, dtype=np.int64)
+    positions = (
+        saved_val % first_num + offsets * (current_num % first_num)
+    ) % first_num
+    ramp = offsets * current_num
+    scan = np.minimum.accumulate(
+        np.concatenate(([saved_val], residue_table[positions] - ramp))
+    )
+    residue_table[positions] = scan[1:] + ramp
+    return int(residue_table[positions[-1]])
+
+
+def extend_residue_table(
+    residue_table, first_num: int, current_num: int, in_place: bool = False
+):
+    """Adds one unit to a residue table of any kind.
+
+    An int64 table is widened first (see widen_residue_table) if the new
+    unit's entries may not fit in it.
+
+    Args:
+        residue_table: int64 array, NumPy or wide residue table
+        first_num: The smallest unit (a₁)
+        current_num: Unit to add
+        in_place: Update residue_table itself instead of a copy
+
+    Returns:
+        The extended table: a new one if the table was widened or in_place
+        is not set, or residue_table itself if the unit adds nothing
+    """
+    # Before the skip below, which a unit this large would always take
+    widen = not isinstance(residue_table, list) and not table_fits(
+        [first_num, current_num]
+    )
+    if widen:
+        residue_table = widen_residue_table(residue_table)
+    elif current_num >= residue_table[current_num % first_num]:
+        return residue_table
+    elif not in_place:
+        residue_table = copy(residue_table)
+    current_gcd = math.gcd(first_num, current_num)
+    if np is not None and isinstance(residue_table, np.ndarray):
+        numpy_round_robin_pass(residue_table, first_num, current_num, current_gcd)
+    else:
+        round_robin_pass(residue_table, first_num, current_num, current_gcd)
+    return residue_table
+
+
+def dijkstra_residue_table(units: list) -> array:
+    """Builds the residue table as shortest paths on the residue graph mod a₁.
+
+    Residues are nodes and each unit aᵢ is an edge p → (p + aᵢ) mod a₁ of
+    weight aᵢ. Following Nijenhuis, a residue reached last through unit i
+    only relaxes units i, i+1, ..., k, since any representation can list its
+    units in increasing order. Each residue is settled once, so there are no
+    repeated passes over residues a unit cannot improve.
+
+    Args:
+        units: Sorted, zero-free units with gcd 1
+
+    Returns:
+        The residue table, identical to the Round Robin table
+    """
+    first_num = units[0]
+    unit_count = len(units)
+    residue_table = new_residue_table(first_num)
+
+    # Smallest unit index allowed to extend each residue
+    first_unit = array("i", [unit_count]) * first_num
+    first_unit[0] = 1
+
+    heap = [(0, 0)]
+    while heap:
+        saved_val, position = heapq.heappop(heap)
+        if saved_val != residue_table[position]:
+            continue
+
+        for unit_index in range(first_unit[position], unit_count):
+            new_val = saved_val + units[unit_index]
+            table_position = new_val % first_num
+            existing_val = residue_table[table_position]
+            if new_val < existing_val:
+                residue_table[table_position] = new_val
+                first_unit[table_position] = unit_index
+                heapq.heappush(heap, (new_val, table_position))
+            elif new_val == existing_val and unit_index < first_unit[table_position]:
+                first_unit[table_position] = unit_index
+
+    return residue_table
+
+
+def _first_run(reachable: int, run_length: int) -> int:
+    """Finds the first run of consecutive set bits in a bitset.
+
+    Args:
+        reachable: Bitset, bit v set when v is representable
+        run_length: Number of consecutive set bits to look for
+
+    Returns:
+        The lowest bit that starts such a run, or -1 if there is none
+    """
+    runs, covered = reachable, 1
+    while covered < run_length and runs:
+        # Bit v of runs is set when bits v to v + covered - 1 all are
+        step = min(covered, run_length - covered)
+        runs &= runs >> step
+        covered += step
+    return (runs & -runs).bit_length() - 1
+
+
+def sieve_residue_table(units: list) -> array:
+    """Builds the residue table by sieving representable values as a bitset.
+
+    Bit v of a Python int is set when v is a combination of the units. Each
+    unit is added with shift-or steps of aᵢ, 2aᵢ, 4aᵢ, ..., so it costs
+    O(log(W/aᵢ)) whole-bitset operations for a window of W values instead
+    of a walk over the residues. Once a₁ consecutive values are
+    representable every larger value is too, so the window only has to
+    reach F + a₁: it starts small and doubles until such a run shows up.
+    The table entries are the representable values v with v - a₁ not
+    representable, exactly one per residue class, so they are read off
+    reachable & ~(reachable << a₁) without scanning every bit in Python.
+
+    Fast when the Frobenius number is small compared to k·a₁, which is the
+    case for most sets of small units. If the window would grow past
+    SIEVE_MAX_WINDOW_BITS, the table is built with the pass-based engine
+    instead (see pass_engine).
+
+    Args:
+        units: Sorted, zero-free units with gcd 1
+
+    Returns:
+        The residue table, identical to the Round Robin table; an int64
+        array, or a NumPy array when the fallback uses the numpy engine
+    """
+    first_num = units[0]
+    window = 2 * (first_num + units[-1])
+    while True:
+        if window > SIEVE_MAX_WINDOW_BITS:
+            return build_residue_table(units, pass_engine(units, "sieve"))
+        mask = (1 << window) - 1
+        reachable = 1
+        for unit in units:
+            # Already a combination of earlier units
+            if reachable >> unit & 1:
+                continue
+            shift = unit
+            while shift < window:
+                reachable |= (reachable << shift) & mask
+                shift <<= 1
+
+        run_start = _first_run(reachable, first_num)
+        if run_start >= 0:
+            break
+        window *= 2
+
+    run_stop = run_start + first_num
+    smallest = reachable & ~(reachable << first_num) & ((1 << run_stop) - 1)
+    smallest_bytes = smallest.to_bytes((run_stop + 7) // 8, "little")
+    residue_table = new_residue_table(first_num)
+    for match in NONZERO_BYTE.finditer(smallest_bytes):
+        byte_value = smallest_bytes[match.start()]
+        while byte_value:
+            low_bit = byte_value & -byte_value
+            value = 8 * match.start() + low_bit.bit_length() - 1
+            residue_table[value % first_num] = value
+            byte_value ^= low_bit
+    return residue_table
+
+
+def estimate_sieve_window(units: list) -> float:
+    """Predicts the bitset width sieve_residue_table ends up using.
+
+    The window has to reach F + a₁. F is taken as the smaller of the typical
+    size ((k-1)!·a₁⋯aₖ)^(1/(k-1)) and (m + 1)·aₖ, where m is the fewest
+    parts that give C(m + k - 1, k - 1) sums, enough for every residue; the
+    first is close for few units, the second for many. Sums of m parts only
+    reach residues 0 to m·(aₖ - a₁) mod a₁, so clustered units need at least
+    (a₁ - 1)/(aₖ - a₁) parts, which gives a floor of that many times a₂.
+
+    Args:
+        units: Sorted, zero-free units, at least two
+
+    Returns:
+        The predicted window in bits
+    """
+    first_num = units[0]
+    unit_count = len(units)
+    typical = math.exp(
+        (math.lgamma(unit_count) + sum(math.log(unit) for unit in units))
+        / (unit_count - 1)
+    )
+
+    parts = 0
+    while math.comb(parts + unit_count - 1, unit_count - 1) < first_num:
+        parts += 1
+    spread_parts = -(-(first_num - 1) // (units[-1] - first_num))
+    frobenius_number = max(
+        spread_parts * units[1] - first_num, min(typical, (parts + 1) * units[-1])
+    )
+    return 2 * (frobenius_number + first_num)
+
+
+def sieve_window_fits(units: list) -> bool:
+    """Checks whether the sieve engine's bitset should stay within its cap.
+
+    Args:
+        units: Sorted, zero-free units
+
+    Returns:
+        True if the predicted window is at most SIEVE_MAX_WINDOW_BITS
+    """
+    if len(units) < 2:
+        return True
+    return estimate_sieve_window(units) <= SIEVE_MAX_WINDOW_BITS
+
+
+def estimate_engine_cost(units: list, engine: str) -> float:
+    """Predicts the run time of an engine from k, a₁ and the gcd structure.
+
+    Args:
+        units: Sorted, zero-free units
+        engine: One of "python", "numpy", "dijkstra" or "sieve"
+
+    Returns:
+        Estimated seconds to build the residue table
+    """
+    first_num = units[0]
+    pass_count = len(units) - 1
+
+    if engine == "sieve":
+        if pass_count == 0:
+            return SIEVE_CLASS_COST * first_num
+        window = estimate_sieve_window(units)
+        shift_count = sum(max(1.0, math.log2(window / unit)) for unit in units)
+        return SIEVE_BIT_COST * window * shift_count + SIEVE_CLASS_COST * first_num
+
+    if engine == "dijkstra":
+        return first_num * (
+            DIJKSTRA_HEAP_COST * math.log2(first_num + 1)
+            + DIJKSTRA_EDGE_COST * pass_count
+        )
+    if engine == "numpy":
+        return pass_count * (NUMPY_ENTRY_COST * first_num + NUMPY_PASS_COST)
+
+    class_count = sum(math.gcd(first_num, unit) for unit in units[1:])
+    return PYTHON_ENTRY_COST * first_num * pass_count + PYTHON_CLASS_COST * class_count
+
+
+def select_engine(units: list) -> str:
+    """Picks the engine with the lowest estimated cost for a unit set.
+
+    Args:
+        units: Sorted, zero-free units
+
+    Returns:
+        "python", "numpy", "dijkstra" or "sieve"; "numpy" only when it is
+        installed and its passes fit in int64 (see numpy_pass_fits), "sieve"
+        only when its bitset fits (see sieve_window_fits)
+    """
+    candidates = ["python", "dijkstra"]
+    if sieve_window_fits(units):
+        candidates.append("sieve")
+    if np is not None and numpy_pass_fits(units[0], units[-1]):
+        candidates.append("numpy")
+    return min(candidates, key=lambda engine: estimate_engine_cost(units, engine))
+
+
+def pass_engine(units: list, engine: str) -> str:
+    """Picks the pass-based engine for a table that is built pass by pass.
+
+    Args:
+        units: Units of the table
+        engine: Requested engine, one of ENGINES
+
+    Returns:
+        "numpy" or "python"; dijkstra and sieve have no single-unit pass
+    """
+    if engine in ("auto", "dijkstra", "sieve"):
+        return "numpy" if select_engine(units) == "numpy" else "python"
+    return engine
+
+
+def validate_engine(engine: str) -> None:
+    """Checks that a Round Robin engine exists and can run here.
+
+    Args:
+        engine: Engine name
+
+    Raises:
+        ValueError: If engine is not one of ENGINES
+        ImportError: If engine is "numpy" and numpy is not installed
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'. Choose from {ENGINES}")
+    if engine == "numpy" and np is None:
+        raise ImportError("The numpy engine requires numpy to be installed")
+
+
+def solve_for_frobenius_number(
+    numbers: list,
+    legacy: bool = False,
+    engine: str = "python",
+    profile=None,
+    checkpoint=None,
+) -> Optional[int]:
     """Computes the Frobenius number using the Round Robin Algorithm.
 
     For a set of numbers [a₁, a₂, ..., aₖ] where:
@@ -87,18 +665,737 @@ def solve_for_frobenius_number(numbers: list) -> Optional[int]:
     3. The Frobenius number is max(saved_val) - a₁
 
 
+    The residue table is kept in an int64 array (see new_residue_table) and
+    updated by round_robin_pass. Passing legacy=True runs the original
+    list-based kernel instead, which gives identical results and is kept for
+    comparison. engine="numpy" runs each pass as whole-array operations (see
+    numpy_round_robin_pass), which is much faster when a₁ is large.
+    engine="dijkstra" builds the same table as shortest paths (see
+    dijkstra_residue_table), engine="sieve" reads it off a bitset of
+    representable values (see sieve_residue_table) and engine="auto" picks
+    an engine from a measured cost model (see select_engine).
+
+    The input is first reduced with canonicalize_units, so it may be in any
+    order and contain zeros, duplicates or redundant units.
+
     Args:
-        numbers: A sorted list of positive integers
+        numbers: A list of non-negative integers
+        legacy: Use the original list-based kernel
+        engine: Round Robin engine, one of ENGINES
+        profile: Optional profiling.SolveProfile to record phase times and
+            table counters in; ignored with legacy=True
+        checkpoint: Optional checkpoint.CheckpointOptions; the residue table
+            and loop position are then saved to disk at regular intervals,
+            so an interrupted solve can resume; ignored with legacy=True
 
     Returns:
         The Frobenius number or None if no solution exists
 
+    Raises:
+        ValueError: If engine is not one of ENGINES
+        ImportError: If engine is "numpy" and numpy is not installed
+        TimeoutError: If the checkpoint deadline passed; progress is saved
     """
+    if legacy:
+        validate_engine(engine)
+        return _solve_with_legacy_kernel(numbers) if len(numbers) >= 2 else None
+
+    # The checkpointed build does not profile, see build_residue_table
+    if checkpoint is not None:
+        profile = None
+
+    solved = _solved_residue_table(numbers, engine, profile, checkpoint)
+    if solved is None:
+        return None
+    if profile is None:
+        return frobenius_from_table(*solved)
+    with profile.phase("table_max"):
+        return frobenius_from_table(*solved)
+
+
+def _solved_residue_table(
+    numbers: list, engine: str, profile=None, checkpoint=None
+) -> Optional[Tuple[array, int]]:
+    """Canonicalizes numbers and builds their final residue table.
 
-    # Validate input
+    Args:
+        numbers: A list of non-negative integers
+        engine: Round Robin engine, one of ENGINES
+        profile: Optional profiling.SolveProfile, see build_residue_table
+        checkpoint: Optional checkpoint.CheckpointOptions, see
+            build_residue_table
+
+    Returns:
+        A tuple of (residue_table, a₁), or None if no solution exists
+    """
+    validate_engine(engine)
     if len(numbers) < 2:
         return None
 
+    # Sort, drop zeros, duplicates and redundant units
+    with profile.phase("canonicalize") if profile is not None else nullcontext():
+        units = canonicalize_units(numbers).units
+    if not units:
+        return None
+
+    residue_table = build_residue_table(units, engine, profile, checkpoint)
+    if residue_table is None:
+        return None
+    return (residue_table, units[0])
+
+
+def solve_for_genus(numbers: list, engine: str = "python") -> Optional[int]:
+    """Counts the volumes that cannot be purchased (the genus).
+
+    Read off the residue table with Selmer's formula (see genus_from_table),
+    so the cost after the table is built is O(a₁) rather than O(F).
+
+    Args:
+        numbers: A list of non-negative integers
+        engine: Round Robin engine, one of ENGINES
+
+    Returns:
+        The number of gaps, or None if no solution exists
+
+    Raises:
+        ValueError: If engine is not one of ENGINES
+    """
+    solved = _solved_residue_table(numbers, engine)
+    if solved is None:
+        return None
+    return genus_from_table(*solved)
+
+
+def solve_for_gap_sum(numbers: list, engine: str = "python") -> Optional[int]:
+    """Adds up the volumes that cannot be purchased.
+
+    Read off the residue table with Selmer's formula (see
+    gap_sum_from_table), in O(a₁) once the table is built.
+
+    Args:
+        numbers: A list of non-negative integers
+        engine: Round Robin engine, one of ENGINES
+
+    Returns:
+        The sum of the gaps, or None if no solution exists
+
+    Raises:
+        ValueError: If engine is not one of ENGINES
+    """
+    solved = _solved_residue_table(numbers, engine)
+    if solved is None:
+        return None
+    return gap_sum_from_table(*solved)
+
+
+def iter_gaps(numbers: list, engine: str = "python") -> Iterator[int]:
+    """Yields the volumes that cannot be purchased, in increasing order.
+
+    Only the residue table is held in memory, so gap sets far larger than
+    a₁ can be streamed. Nothing is yielded if no solution exists.
+
+    Args:
+        numbers: A list of non-negative integers
+        engine: Round Robin engine, one of ENGINES
+
+    Yields:
+        Each gap, from 1 up to the Frobenius number
+
+    Raises:
+        ValueError: If engine is not one of ENGINES
+    """
+    solved = _solved_residue_table(numbers, engine)
+    if solved is not None:
+        yield from iter_gaps_from_table(*solved)
+
+
+def build_residue_table(
+    units: list, engine: str = "python", profile=None, checkpoint=None
+):
+    """Builds the final residue table for a canonical unit set.
+
+    Units that are already reachable through the table built so far
+    (aᵢ >= n[aᵢ mod a₁]) cannot improve any entry, so their pass is skipped.
+
+    Args:
+        units: Sorted, zero-free units (see canonicalize_units)
+        engine: Round Robin engine, one of ENGINES
+        profile: Optional profiling.SolveProfile to record phases and
+            counters in (see _build_profiled_residue_table)
+        checkpoint: Optional checkpoint.CheckpointOptions to save progress
+            to disk and stop at a deadline (see
+            _build_checkpointed_residue_table); takes precedence over profile,
+            and is ignored for units that do not fit in int64 (see
+            table_fits)
+
+    Returns:
+        The residue table (an int64 array, a NumPy array for the numpy
+        engine or a wide table, see prepare_residue_table), or None if the
+        units are not coprime
+
+    Raises:
+        TimeoutError: If a checkpoint deadline passed before the table was
+            finished
+    """
+    # Checkpoints store int64 tables
+    if checkpoint is not None and table_fits(units):
+        return _build_checkpointed_residue_table(units, engine, checkpoint)
+    if profile is not None:
+        return _build_profiled_residue_table(units, engine, profile)
+
+    setup = prepare_residue_table(units, engine)
+    if setup is None:
+        return None
+    if setup.engine == "dijkstra":
+        return dijkstra_residue_table(units)
+    if setup.engine == "sieve":
+        return sieve_residue_table(units)
+
+    first_num = units[0]
+    residue_table = setup.residue_table
+    for current_num, current_gcd in zip(units[1:], setup.pairwise_gcds):
+        # Already a combination of earlier units
+        if current_num >= residue_table[current_num % first_num]:
+            continue
+        setup.pass_function(residue_table, first_num, current_num, current_gcd)
+
+    return residue_table
+
+
+class TableSetup(NamedTuple):
+    """What a residue table build needs before its first pass.
+
+    Attributes:
+        pairwise_gcds: gcd(a₁, aᵢ) for every unit after a₁
+        engine: Engine to build with, never "auto"
+        residue_table: New table with only n₀ = 0 reached, an int64 array, a
+            NumPy array for the numpy engine or a wide table for units that
+            do not fit in int64 (see table_fits); None for dijkstra and sieve
+        pass_function: round_robin_pass or numpy_round_robin_pass; None for
+            dijkstra and sieve
+    """
+
+    pairwise_gcds: List[int]
+    engine: str
+    residue_table: object
+    pass_function: Optional[Callable]
+
+
+def prepare_residue_table(
+    units: list, engine: str, passes_only: bool = False, profile=None
+) -> Optional[TableSetup]:
+    """Checks that the units are coprime, settles the engine and makes the table.
+
+    Shared by every residue table build, so they agree on when a set has no
+    solution and on which engine "auto" means. Units whose entries may not
+    fit in int64 always get the python engine on a wide table.
+
+    Args:
+        units: Sorted, zero-free units (see canonicalize_units)
+        engine: Round Robin engine, one of ENGINES
+        passes_only: Replace dijkstra and sieve by a pass-based engine (see
+            pass_engine), for builds that work pass by pass
+        profile: Optional profiling.SolveProfile to time the gcd and
+            table_init phases in
+
+    Returns:
+        The TableSetup, or None if the units are not coprime
+    """
+    first_num = units[0]
+    remaining_nums = units[1:]
+
+    with profile.phase("gcd") if profile is not None else nullcontext():
+        if remaining_nums:
+            overall_gcd, pairwise_gcds = compute_gcd_values(first_num, remaining_nums)
+        else:
+            overall_gcd, pairwise_gcds = first_num, []
+    if overall_gcd != 1:
+        return None
+
+    if not table_fits(units):
+        engine = "python"
+    elif passes_only:
+        engine = pass_engine(units, engine)
+    elif engine == "auto":
+        engine = select_engine(units)
+    elif engine == "sieve" and not sieve_window_fits(units):
+        engine = pass_engine(units, engine)
+    if engine in ("dijkstra", "sieve"):
+        return TableSetup(pairwise_gcds, engine, None, None)
+
+    with profile.phase("table_init") if profile is not None else nullcontext():
+        if engine == "numpy":
+            residue_table = np.full(first_num, RESIDUE_SENTINEL, dtype=np.int64)
+            residue_table[0] = 0
+            pass_function = numpy_round_robin_pass
+        else:
+            residue_table = new_residue_table(first_num, not table_fits(units))
+            pass_function = round_robin_pass
+    return TableSetup(pairwise_gcds, engine, residue_table, pass_function)
+
+
+def _build_profiled_residue_table(units: list, engine: str, profile):
+    """Runs build_residue_table while timing each phase and pass.
+
+    Kept apart from build_residue_table so the unprofiled loop carries no
+    timing calls. Update counts are taken by comparing the table before and
+    after each pass, outside the timed region.
+
+    Args:
+        units: Sorted, zero-free units (see canonicalize_units)
+        engine: Round Robin engine, one of ENGINES
+        profile: profiling.SolveProfile to fill in
+
+    Returns:
+        The same table as build_residue_table
+    """
+    setup = prepare_residue_table(units, engine, profile=profile)
+    if setup is None:
+        return None
+    engine = setup.engine
+    profile.details["engine"] = engine
+
+    if engine in ("dijkstra", "sieve"):
+        table_function = (
+            dijkstra_residue_table if engine == "dijkstra" else sieve_residue_table
+        )
+        with profile.phase("passes"):
+            residue_table = table_function(units)
+        profile.count(
+            "table_updates",
+            sum(1 for entry in residue_table if entry != RESIDUE_SENTINEL) - 1,
+        )
+        return residue_table
+
+    first_num = units[0]
+    residue_table, pass_function = setup.residue_table, setup.pass_function
+    for current_num, current_gcd in zip(units[1:], setup.pairwise_gcds):
+        if current_num >= residue_table[current_num % first_num]:
+            profile.count("units_skipped")
+            continue
+
+        # Residue cycles of the pass are the residue classes mod current_gcd
+        if engine == "numpy":
+            cycle_minimums = residue_table.reshape(-1, current_gcd).min(axis=0)
+            previous_table = residue_table.copy()
+        else:
+            cycle_minimums = [
+                min(residue_table[remainder::current_gcd])
+                for remainder in range(current_gcd)
+            ]
+            previous_table = residue_table[:]
+        unreached = unreached_value(residue_table)
+        profile.count(
+            "unreached_cycles",
+            sum(1 for minimum in cycle_minimums if minimum == unreached),
+        )
+
+        start = time.perf_counter()
+        pass_function(residue_table, first_num, current_num, current_gcd)
+        seconds = time.perf_counter() - start
+
+        if engine == "numpy":
+            updates = int(np.count_nonzero(residue_table < previous_table))
+        else:
+            updates = sum(
+                1 for old, new in zip(previous_table, residue_table) if new < old
+            )
+        profile.record_pass(current_num, current_gcd, seconds, updates)
+
+    return residue_table
+
+
+def _build_checkpointed_residue_table(units: list, engine: str, options):
+    """Runs build_residue_table while saving progress to a checkpoint file.
+
+    Each pass walks its residue cycles CHECKPOINT_STEPS steps at a time (see
+    _walk_pass_in_segments). Between segments and between passes the table
+    and the position in it are written to a checkpoint every
+    options.interval seconds. If options.deadline passes, the current state
+    is saved and TimeoutError is raised; running again with options.resume
+    picks up at the same cycle step. A finished solve removes its
+    checkpoint.
+
+    The dijkstra and sieve engines have no passes and are replaced by the
+    Round Robin engine select_engine would use otherwise.
+
+    Args:
+        units: Sorted, zero-free units (see canonicalize_units)
+        engine: Round Robin engine, one of ENGINES
+        options: checkpoint.CheckpointOptions saying where and how often
+
+    Returns:
+        The residue table, or None if the units are not coprime
+
+    Raises:
+        TimeoutError: If the deadline passed before the table was finished
+        ValueError: If the checkpoint on disk belongs to other units
+    """
+    setup = prepare_residue_table(units, engine, passes_only=True)
+    if setup is None:
+        return None
+    first_num = units[0]
+    remaining_nums = units[1:]
+    walk_function = numpy_walk_cycle if setup.engine == "numpy" else walk_cycle
+
+    path = checkpoint_path(options.directory, units)
+    saved = load_checkpoint(path) if options.resume else None
+    if saved is not None and saved.units != list(units):
+        raise ValueError(f"Checkpoint {path} was written for units {saved.units}")
+
+    residue_table, next_index, position = setup.residue_table, 1, None
+    if saved is not None:
+        residue_table[:] = saved.residue_table
+        next_index, position = saved.next_index, saved.position
+
+    def check_deadline(
+        unit_index: int, current_position: Optional[PassPosition]
+    ) -> None:
+        if options.deadline is None or time.time() < options.deadline:
+            return
+        # With no step walked in this call, only a resumed checkpoint holds
+        # the progress
+        if (unit_index, current_position) != (next_index, position):
+            save_checkpoint(path, units, unit_index, residue_table, current_position)
+        elif saved is None:
+            raise TimeoutError(
+                f"Time budget exhausted before the first of "
+                f"{len(remaining_nums)} passes; nothing was saved"
+            )
+        where = f"after {unit_index - 1} of {len(remaining_nums)} passes"
+        if current_position is not None:
+            where = f"in pass {unit_index} of {len(remaining_nums)}"
+        raise TimeoutError(f"Time budget exhausted {where}; progress saved to {path}")
+
+    last_save = time.monotonic()
+    pass_position = position
+    for idx in range(next_index - 1, len(remaining_nums)):
+        check_deadline(idx + 1, pass_position)
+
+        current_num = remaining_nums[idx]
+        # A pass already under way may have reached current_num itself
+        if (
+            pass_position is not None
+            or current_num < residue_table[current_num % first_num]
+        ):
+            for pass_position in _walk_pass_in_segments(
+                residue_table,
+                first_num,
+                current_num,
+                setup.pairwise_gcds[idx],
+                pass_position,
+                walk_function,
+            ):
+                check_deadline(idx + 1, pass_position)
+                if time.monotonic() - last_save >= options.interval:
+                    save_checkpoint(path, units, idx + 1, residue_table, pass_position)
+                    last_save = time.monotonic()
+            pass_position = None
+
+        if time.monotonic() - last_save >= options.interval:
+            save_checkpoint(path, units, idx + 2, residue_table)
+            last_save = time.monotonic()
+
+    if path.exists():
+        path.unlink()
+    return residue_table
+
+
+def _walk_pass_in_segments(
+    residue_table,
+    first_num: int,
+    current_num: int,
+    current_gcd: int,
+    position: Optional[PassPosition],
+    walk_function: Callable,
+) -> Iterator[PassPosition]:
+    """Applies one Round Robin pass CHECKPOINT_STEPS cycle steps at a time.
+
+    Args:
+        residue_table: Residue table to update
+        first_num: The smallest unit (a₁)
+        current_num: The unit being added
+        current_gcd: gcd(a₁, current_num)
+        position: Where to resume the pass, or None to start it
+        walk_function: walk_cycle or numpy_walk_cycle
+
+    Yields:
+        The position to resume from after each segment that does not end
+        the pass
+    """
+    cycle_length = first_num // current_gcd
+    unreached = unreached_value(residue_table)
+    first_cycle = 0 if position is None else position.cycle
+
+    for remainder in range(first_cycle, current_gcd):
+        steps, saved_val = 0, None
+        if remainder == first_cycle and position is not None:
+            steps, saved_val = position.steps, position.saved_val
+        if saved_val is None:
+            cycle = residue_table[remainder::current_gcd]
+            saved_val = cycle.min() if walk_function is numpy_walk_cycle else min(cycle)
+            if saved_val == unreached:
+                continue
+
+        while steps < cycle_length:
+            segment = min(CHECKPOINT_STEPS, cycle_length - steps)
+            saved_val = walk_function(
+                residue_table, first_num, current_num, int(saved_val), segment
+            )
+            steps += segment
+            if steps < cycle_length:
+                yield PassPosition(remainder, steps, saved_val)
+            elif remainder + 1 < current_gcd:
+                yield PassPosition(remainder + 1, 0, None)
+
+
+def frobenius_from_table(residue_table, first_num: int) -> int:
+    """Reads the Frobenius number off a finished residue table.
+
+    Args:
+        residue_table: Residue table from build_residue_table
+        first_num: The smallest unit (a₁)
+
+    Returns:
+        max(nₚ) - a₁
+    """
+    if np is not None and isinstance(residue_table, np.ndarray):
+        return int(residue_table.max()) - first_num
+    return max(residue_table) - first_num
+
+
+def _table_values(residue_table) -> list:
+    """Returns the entries of a residue table as Python ints.
+
+    Args:
+        residue_table: Residue table from build_residue_table
+
+    Returns:
+        The entries, safe from int64 overflow in further arithmetic
+    """
+    if np is not None and isinstance(residue_table, np.ndarray):
+        return residue_table.tolist()
+    return residue_table
+
+
+def genus_from_table(residue_table, first_num: int) -> int:
+    """Counts the gaps of a finished residue table.
+
+    Residue class p holds the gaps p, p + a₁, ..., nₚ - a₁, which gives
+    Selmer's formula g = Σ (nₚ - p) / a₁ = (1/a₁)·Σ nₚ - (a₁ - 1)/2.
+
+    Args:
+        residue_table: Residue table from build_residue_table
+        first_num: The smallest unit (a₁)
+
+    Returns:
+        The number of gaps
+    """
+    return sum(
+        (value - residue) // first_num
+        for residue, value in enumerate(_table_values(residue_table))
+    )
+
+
+def gap_sum_from_table(residue_table, first_num: int) -> int:
+    """Adds up the gaps of a finished residue table.
+
+    The mₚ = (nₚ - p) / a₁ gaps of residue class p sum to
+    mₚ·p + a₁·mₚ(mₚ - 1)/2; summed over p this is Selmer's formula
+    (1/2a₁)·Σ nₚ² - (1/2)·Σ nₚ + (a₁² - 1)/12, kept in exact integers.
+
+    Args:
+        residue_table: Residue table from build_residue_table
+        first_num: The smallest unit (a₁)
+
+    Returns:
+        The sum of the gaps
+    """
+    total = 0
+    for residue, value in enumerate(_table_values(residue_table)):
+        count = (value - residue) // first_num
+        total += count * residue + first_num * count * (count - 1) // 2
+    return total
+
+
+def iter_gaps_from_table(residue_table, first_num: int) -> Iterator[int]:
+    """Yields the gaps of a finished residue table in increasing order.
+
+    A volume v is a gap exactly when v < n[v mod a₁]. Every volume up to the
+    Frobenius number is tested once, which is O(g) since F < 2g.
+
+    Args:
+        residue_table: Residue table from build_residue_table
+        first_num: The smallest unit (a₁)
+
+    Yields:
+        Each gap, from 1 up to the Frobenius number
+    """
+    residue_table = _table_values(residue_table)
+    for volume in range(1, max(residue_table) - first_num + 1):
+        if volume < residue_table[volume % first_num]:
+            yield volume
+
+
+class WitnessTable(NamedTuple):
+    """Records how each residue table entry was reached.
+
+    Entry nₚ equals n_base + multiplicity·a_unit, where unit is an index into
+    the unit list and base is a residue reached through units with a smaller
+    index. Following base links therefore visits at most k entries.
+
+    Attributes:
+        unit_index: Index of the unit that produced nₚ, or -1 for n₀
+        multiplicity: How many copies of that unit were added
+        base: Residue the copies were added to
+    """
+
+    unit_index: array
+    multiplicity: array
+    base: array
+
+
+def new_witness_table(first_num: int) -> WitnessTable:
+    """Creates an empty witness table for the smallest unit.
+
+    Args:
+        first_num: The smallest unit (a₁)
+
+    Returns:
+        A WitnessTable with every residue unset
+    """
+    return WitnessTable(
+        array("i", [-1]) * first_num,
+        array("q", [0]) * first_num,
+        array("q", [0]) * first_num,
+    )
+
+
+def witness_round_robin_pass(
+    residue_table: array,
+    witness_table: WitnessTable,
+    first_num: int,
+    current_num: int,
+    current_gcd: int,
+    unit_index: int,
+) -> None:
+    """Applies round_robin_pass while recording a witness for every improvement.
+
+    Consecutive improvements along a cycle come from adding the same unit
+    again, so they share one base and count up the multiplicity.
+
+    Args:
+        residue_table: Residue table to update
+        witness_table: Witness table to update alongside it
+        first_num: The smallest unit (a₁)
+        current_num: The unit being added
+        current_gcd: gcd(a₁, current_num)
+        unit_index: Index of current_num in the unit list
+    """
+    unit_indexes, multiplicities, bases = witness_table
+    cycle_length = first_num // current_gcd
+    unreached = unreached_value(residue_table)
+
+    for remainder in range(current_gcd):
+        saved_val = min(residue_table[remainder::current_gcd])
+        if saved_val == unreached:
+            continue
+
+        previous_position = saved_val % first_num
+        for _ in range(cycle_length):
+            saved_val += current_num
+            table_position = saved_val % first_num
+            if saved_val < residue_table[table_position]:
+                residue_table[table_position] = saved_val
+                unit_indexes[table_position] = unit_index
+                if unit_indexes[previous_position] == unit_index:
+                    multiplicities[table_position] = (
+                        multiplicities[previous_position] + 1
+                    )
+                    bases[table_position] = bases[previous_position]
+                else:
+                    multiplicities[table_position] = 1
+                    bases[table_position] = previous_position
+            else:
+                saved_val = residue_table[table_position]
+            previous_position = table_position
+
+
+def build_witness_table(units: list) -> Optional[Tuple[array, WitnessTable]]:
+    """Builds the residue table of a canonical unit set with witnesses.
+
+    Args:
+        units: Sorted, zero-free units (see canonicalize_units)
+
+    Returns:
+        A tuple of (residue_table, witness_table), or None if the units are
+        not coprime; the residue table is wide if its entries may not fit
+        in int64 (see table_fits)
+    """
+    first_num = units[0]
+    if math.gcd(*units) != 1:
+        return None
+
+    residue_table = new_residue_table(first_num, not table_fits(units))
+    witness_table = new_witness_table(first_num)
+    for unit_index, current_num in enumerate(units[1:], start=1):
+        if current_num >= residue_table[current_num % first_num]:
+            continue
+        witness_round_robin_pass(
+            residue_table,
+            witness_table,
+            first_num,
+            current_num,
+            math.gcd(first_num, current_num),
+            unit_index,
+        )
+
+    return (residue_table, witness_table)
+
+
+def decompose_from_witnesses(
+    residue_table: array, witness_table: WitnessTable, units: list, volume: int
+) -> Optional[List[int]]:
+    """Reconstructs an exact decomposition of a volume in O(k).
+
+    The volume is written as nₚ plus copies of a₁, and nₚ is unrolled by
+    following witness base links.
+
+    Args:
+        residue_table: Residue table from build_witness_table
+        witness_table: Witness table from build_witness_table
+        units: The units the tables were built for
+        volume: A non-negative order volume
+
+    Returns:
+        Package counts aligned with units, or None if the volume is not
+        purchasable
+    """
+    first_num = units[0]
+    position = volume % first_num
+    if volume < residue_table[position]:
+        return None
+
+    counts = [0] * len(units)
+    counts[0] = (volume - residue_table[position]) // first_num
+    while position:
+        counts[witness_table.unit_index[position]] += witness_table.multiplicity[
+            position
+        ]
+        position = witness_table.base[position]
+
+    return counts
+
+
+def _solve_with_legacy_kernel(numbers: list) -> Optional[int]:
+    """Runs the original list-based Round Robin kernel on the raw input.
+
+    Args:
+        numbers: A list of at least two non-negative integers
+
+    Returns:
+        The Frobenius number or None if no solution exists
+    """
     # Handle leading zeros issues
     if not numbers[0]:
         numbers = list(filter(lambda x: x > 0, numbers))
@@ -108,14 +1405,14 @@ def solve_for_frobenius_number(numbers: list) -> Optional[int]:
     first_num = numbers[0]
     remaining_nums = numbers[1:]
 
-    # Initialize residue table
-    residue_table = [float("inf")] * first_num
-    residue_table[0] = 0
-
     overall_gcd, pairwise_gcds = compute_gcd_values(first_num, remaining_nums)
     if not overall_gcd or overall_gcd > 1:
         return None
 
+    # Initialize residue table
+    residue_table = [float("inf")] * first_num
+    residue_table[0] = 0
+
     # Main loop to step through the remaining_nums
     # Ex: [5,8,9]
     for idx, current_num in enumerate(remaining_nums):  # Ex: current_num = 8
@@ -148,3 +1445,133 @@ def solve_for_frobenius_number(numbers: list) -> Optional[int]:
                     residue_table[table_position] = saved_val  # [0, 16, ∞, 8, ∞]
 
     return max(residue_table) - first_num
+
+
+class FrobeniusSolver:
+    """Keeps Round Robin residue tables alive between changes to the unit set.
+
+    One residue table is stored per prefix of the unit order, where the
+    order is a₁ (the smallest unit) followed by the other units in the order
+    they were added. That makes changes cheap:
+
+    Change                         | Work
+    -------------------------------+--------------------------------------
+    add_unit(x), x > a₁            | one Round Robin pass
+    add_unit(x), x < a₁            | full rebuild (the table size changes)
+    remove_unit(x), x added i-th   | passes for the units added after x
+    remove_unit(a₁)                | full rebuild
+    frobenius_number               | O(1), kept up to date by each change
+
+    Memory is O(k·a₁) for the k prefix tables; prefixes whose unit adds
+    nothing share the previous table.
+
+    Attributes:
+        frobenius_number: Current Frobenius number, or None while the units
+            have no solution
+    """
+
+    def __init__(self, units: Optional[list] = None):
+        self._order = []
+        self._tables = []
+        self.frobenius_number = None
+        for unit in units or []:
+            self.add_unit(unit)
+
+    @property
+    def units(self) -> List[int]:
+        """The current units in ascending order."""
+        return sorted(self._order)
+
+    @property
+    def residue_table(self) -> Optional[array]:
+        """The residue table of the full unit set, or None if there are no units."""
+        return self._tables[-1] if self._tables else None
+
+    def add_unit(self, unit: int) -> None:
+        """Adds a unit and updates the Frobenius number.
+
+        Zeros and units already present are ignored.
+
+        Args:
+            unit: A non-negative integer
+
+        Raises:
+            TypeError: If unit is not an integer
+            ValueError: If unit is negative
+        """
+        if not isinstance(unit, int):
+            raise TypeError(f"Units must be integers, got {type(unit).__name__}")
+        if unit < 0:
+            raise ValueError(f"Units must be non-negative, got {unit}")
+        if unit == 0 or unit in self._order:
+            return
+
+        if not self._order or unit < self._order[0]:
+            self._rebuild([unit] + self._order)
+        else:
+            self._order.append(unit)
+            self._tables.append(
+                extend_residue_table(self._tables[-1], self._order[0], unit)
+            )
+        self._update_frobenius_number()
+
+    def remove_unit(self, unit: int) -> None:
+        """Removes a unit and updates the Frobenius number.
+
+        Only the prefix tables that include the unit are rebuilt.
+
+        Args:
+            unit: A unit currently in the set
+
+        Raises:
+            ValueError: If unit is not in the set
+        """
+        if unit not in self._order:
+            raise ValueError(f"Unit {unit} is not in the set")
+
+        position = self._order.index(unit)
+        if position == 0:
+            remaining = self._order[1:]
+            if remaining:
+                smallest = min(remaining)
+                remaining.remove(smallest)
+                remaining.insert(0, smallest)
+            self._rebuild(remaining)
+        else:
+            replay = self._order[position + 1 :]
+            del self._order[position:]
+            del self._tables[position:]
+            for current_num in replay:
+                self._order.append(current_num)
+                self._tables.append(
+                    extend_residue_table(self._tables[-1], self._order[0], current_num)
+                )
+        self._update_frobenius_number()
+
+    def _rebuild(self, order: list) -> None:
+        """Rebuilds every prefix table for a new unit order.
+
+        Args:
+            order: a₁ followed by the other units
+        """
+        self._order = []
+        self._tables = []
+        if not order:
+            return
+
+        self._order.append(order[0])
+        self._tables.append(new_residue_table(order[0]))
+        for current_num in order[1:]:
+            self._order.append(current_num)
+            self._tables.append(
+                extend_residue_table(self._tables[-1], self._order[0], current_num)
+            )
+
+    def _update_frobenius_number(self) -> None:
+        """Recomputes frobenius_number from the current table."""
+        if not self._order or math.gcd(*self._order) != 1:
+            self.frobenius_number = None
+        else:
+            self.frobenius_number = frobenius_from_table(
+                self._tables[-1], self._order[0]
+            )
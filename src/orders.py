@@ -0,0 +1,413 @@
+import math
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from canonical import canonicalize_units
+from frobenius import (
+    build_residue_table,
+    build_witness_table,
+    decompose_from_witnesses,
+    np,
+)
+
+# Order volumes read and checked per batch by iter_order_volumes
+ORDER_CHUNK_SIZE = 65536
+
+# Marks volumes with no decomposition in a package count table
+UNREACHABLE_COUNT = 2**62
+
+
+def _int64_volumes(volumes):
+    """Converts order volumes for the vectorized checks.
+
+    Args:
+        volumes: Sequence or array of order volumes
+
+    Returns:
+        An int64 NumPy array, or None without numpy or if a volume does not
+        fit in int64
+    """
+    if np is None:
+        return None
+    try:
+        return np.asarray(volumes, dtype=np.int64)
+    except OverflowError:
+        return None
+
+
+class OrderChecker:
+    """Answers "is this order volume perfectly purchasable?" from one residue table.
+
+    The residue table is built once. A volume n is then purchasable exactly
+    when n >= nₚ with p = n mod a₁, so each query is O(1). When the units
+    share a factor g, n must also be a multiple of g and the table is built
+    for the units divided by g.
+
+    Attributes:
+        units: Canonical units the table was built for
+        unit_gcd: gcd of all units
+    """
+
+    def __init__(
+        self,
+        numbers: list,
+        engine: str = "python",
+        cache=None,
+        keep_redundant: bool = False,
+    ):
+        """Builds the residue table for a unit set.
+
+        Args:
+            numbers: A list of non-negative integers
+            engine: Round Robin engine used to build the table
+            cache: Optional cache.ResultCache to reuse a stored table from
+            keep_redundant: Keep units that are combinations of smaller ones
+
+        Raises:
+            ValueError: If numbers contains no positive unit
+        """
+        self.units = canonicalize_units(numbers, keep_redundant).units
+        if not self.units:
+            raise ValueError("At least one positive unit is required")
+
+        self.unit_gcd = math.gcd(*self.units)
+        self._reduced_units = [unit // self.unit_gcd for unit in self.units]
+        self._first_num = self._reduced_units[0]
+        residue_table = self._build_table(engine, cache)
+
+        # Keep a NumPy copy for vectorized checks when numpy is available;
+        # wide tables (see frobenius.table_fits) stay lists of Python ints
+        self._residue_table = (
+            np.asarray(residue_table, dtype=np.int64)
+            if np is not None and not isinstance(residue_table, list)
+            else residue_table
+        )
+
+    def _build_table(self, engine: str, cache):
+        """Builds, or fetches from the cache, the table of the reduced units.
+
+        Args:
+            engine: Round Robin engine used to build the table
+            cache: Optional cache.ResultCache
+
+        Returns:
+            The residue table
+        """
+        # The table only depends on the reachable volumes, so redundant units
+        # can share the entry of their canonical set
+        entry = None
+        if cache is not None:
+            entry = cache.get(canonicalize_units(self._reduced_units).units)
+        if entry is not None and entry.residue_table is not None:
+            return entry.residue_table
+        return build_residue_table(self._reduced_units, engine)
+
+    def is_purchasable(self, volume: int) -> bool:
+        """Checks a single order volume.
+
+        Args:
+            volume: Order volume
+
+        Returns:
+            True if the volume is a non-negative combination of the units
+        """
+        if volume < 0 or volume % self.unit_gcd:
+            return False
+        reduced = volume // self.unit_gcd
+        return reduced >= self._residue_table[reduced % self._first_num]
+
+    def check(self, volumes):
+        """Checks many order volumes at once.
+
+        With numpy installed this is a single vectorized gather and compare
+        over the whole batch; otherwise, or if the table is wide (see
+        frobenius.table_fits) or a volume does not fit in int64, it falls
+        back to is_purchasable.
+
+        Args:
+            volumes: Sequence or array of order volumes
+
+        Returns:
+            A boolean NumPy array, or a list of bools in the fallback
+        """
+        volume_array = _int64_volumes(volumes)
+        if volume_array is None or isinstance(self._residue_table, list):
+            return [self.is_purchasable(volume) for volume in volumes]
+
+        volumes = volume_array
+        valid = (volumes >= 0) & (volumes % self.unit_gcd == 0)
+        reduced = np.where(valid, volumes // self.unit_gcd, 0)
+        return valid & (reduced >= self._residue_table[reduced % self._first_num])
+
+
+def build_package_count_table(units: list, max_volume: int) -> tuple:
+    """Computes the fewest packages needed for every volume up to max_volume.
+
+    This is the unbounded coin-change recurrence c[v] = min(c[v], c[v-u] + 1),
+    applied one unit at a time. With numpy, each unit's pass runs along the
+    residue classes mod u as c[j] = j + cummin(c[i] - i), the same scan the
+    numpy Round Robin engine uses, so it is O(k·max_volume) array work.
+
+    Args:
+        units: Positive units
+        max_volume: Largest volume to cover
+
+    Returns:
+        A tuple of (counts, last_unit): counts[v] is the fewest packages for
+        v (UNREACHABLE_COUNT if none) and last_unit[v] is a unit of one such
+        decomposition (0 for v = 0 or unreachable volumes)
+    """
+    size = max_volume + 1
+
+    if np is None:
+        counts = [0] + [UNREACHABLE_COUNT] * max_volume
+        last_unit = [0] * size
+        for unit in units:
+            for volume in range(unit, size):
+                if counts[volume - unit] + 1 < counts[volume]:
+                    counts[volume] = counts[volume - unit] + 1
+                    last_unit[volume] = unit
+        return (counts, last_unit)
+
+    counts = np.full(size, UNREACHABLE_COUNT, dtype=np.int64)
+    counts[0] = 0
+    last_unit = np.zeros(size, dtype=np.int64)
+    for unit in units:
+        if unit > max_volume:
+            continue
+
+        # Column r holds volumes r, r+u, r+2u, ... of the padded table
+        rows = -(-size // unit)
+        padded = np.full(rows * unit, UNREACHABLE_COUNT, dtype=np.int64)
+        padded[:size] = counts
+        grid = padded.reshape(rows, unit)
+        steps = np.arange(rows, dtype=np.int64)[:, None]
+        improved = np.minimum.accumulate(grid - steps, axis=0) + steps
+
+        improved = improved.reshape(-1)[:size]
+        better = improved < counts
+        counts[better] = improved[better]
+        last_unit[better] = unit
+
+    return (counts, last_unit)
+
+
+class OrderPlanner(OrderChecker):
+    """Turns purchasable order volumes into package combinations.
+
+    Two reconstructions are available, both without re-solving per order:
+
+    - decompose uses Round Robin witnesses and returns an exact combination
+      in O(k) for any volume
+    - fewest_packages uses a package count table covering volumes up to
+      max_volume and returns a combination with the fewest packages; the
+      table grows on demand (at least doubling) when larger volumes appear
+
+    The count table never grows past aₖ₋₁·aₖ (of the units divided by their
+    gcd). A fewest-package combination uses fewer than aₖ packages of the
+    other units: among any aₖ of them some nonempty group sums to a multiple
+    m·aₖ, and m packages of aₖ replace it with fewer packages. So from
+    aₖ₋₁·aₖ on every fewest combination contains aₖ, and larger volumes are
+    first reduced by copies of aₖ.
+
+    Combinations are dicts mapping each used unit to its package count.
+    """
+
+    def __init__(self, numbers: list, max_volume: int = 0):
+        """Builds the witness table and the package count table.
+
+        Args:
+            numbers: A list of non-negative integers
+            max_volume: Initial coverage of the package count table
+        """
+        # Redundant units are kept since they can still save packages
+        super().__init__(numbers, keep_redundant=True)
+        self._largest_unit = self._reduced_units[-1]
+        self._fold_volume = self._largest_unit * (
+            self._reduced_units[-2] if len(self._reduced_units) > 1 else 1
+        )
+        self.max_volume = -1
+        self.ensure_max_volume(max_volume)
+
+    def _build_table(self, engine: str, cache):
+        """Builds the residue table together with its witnesses."""
+        self._residue_list, self._witness_table = build_witness_table(
+            self._reduced_units
+        )
+        return self._residue_list
+
+    def ensure_max_volume(self, max_volume: int) -> None:
+        """Extends the package count table to cover max_volume.
+
+        Args:
+            max_volume: Largest volume that must be covered
+        """
+        if max_volume <= self.max_volume:
+            return
+
+        previous_size = min(self.max_volume // self.unit_gcd, self._fold_volume)
+        self.max_volume = max(max_volume, 2 * self.max_volume)
+        table_size = min(self.max_volume // self.unit_gcd, self._fold_volume)
+        if table_size != previous_size:
+            self._counts, self._last_unit = build_package_count_table(
+                self._reduced_units, table_size
+            )
+
+    def _fold(self, reduced: int) -> tuple:
+        """Reduces a volume into the count table by copies of the largest unit.
+
+        Args:
+            reduced: Volume divided by the unit gcd
+
+        Returns:
+            (volume, copies): the table volume and the copies of aₖ removed
+        """
+        if reduced <= self._fold_volume:
+            return (reduced, 0)
+        copies = -(-(reduced - self._fold_volume) // self._largest_unit)
+        return (reduced - copies * self._largest_unit, copies)
+
+    def decompose(self, volume: int) -> Optional[Dict[int, int]]:
+        """Finds an exact package combination from the witness table.
+
+        Args:
+            volume: Order volume
+
+        Returns:
+            {unit: count} for the used units, or None if not purchasable
+        """
+        if not self.is_purchasable(volume):
+            return None
+
+        counts = decompose_from_witnesses(
+            self._residue_list,
+            self._witness_table,
+            self._reduced_units,
+            volume // self.unit_gcd,
+        )
+        return {unit: count for unit, count in zip(self.units, counts) if count}
+
+    def package_counts(self, volumes):
+        """Looks up the fewest packages for many volumes at once.
+
+        Args:
+            volumes: Order volumes, all at most max_volume
+
+        Returns:
+            Fewest package counts, -1 where a volume is not purchasable; a
+            NumPy array, or a list without numpy or if a volume does not fit
+            in int64
+        """
+        volume_array = _int64_volumes(volumes)
+        if volume_array is None:
+            return [self._package_count(volume) for volume in volumes]
+
+        volumes = volume_array
+        valid = (volumes >= 0) & (volumes % self.unit_gcd == 0)
+        reduced = np.where(valid, volumes // self.unit_gcd, 0)
+        excess = np.maximum(reduced - self._fold_volume, 0)
+        copies = -(-excess // self._largest_unit)
+        counts = self._counts[reduced - copies * self._largest_unit]
+        return np.where(valid & (counts < UNREACHABLE_COUNT), counts + copies, -1)
+
+    def fewest_packages(self, volume: int) -> Optional[Dict[int, int]]:
+        """Finds a package combination with the fewest packages.
+
+        Args:
+            volume: Order volume
+
+        Returns:
+            {unit: count} for the used units, or None if not purchasable
+        """
+        if self._package_count(volume) < 0:
+            return None
+
+        remaining, copies = self._fold(volume // self.unit_gcd)
+        combination = {}
+        if copies:
+            combination[self._largest_unit * self.unit_gcd] = copies
+        while remaining:
+            unit = int(self._last_unit[remaining])
+            combination[unit * self.unit_gcd] = (
+                combination.get(unit * self.unit_gcd, 0) + 1
+            )
+            remaining -= unit
+        return dict(sorted(combination.items()))
+
+    def _package_count(self, volume: int) -> int:
+        """Returns the fewest packages for one volume, or -1 if impossible."""
+        if volume < 0 or volume % self.unit_gcd:
+            return -1
+        self.ensure_max_volume(volume)
+        reduced, copies = self._fold(volume // self.unit_gcd)
+        count = int(self._counts[reduced])
+        return count + copies if count < UNREACHABLE_COUNT else -1
+
+
+def iter_order_volumes(file_path: Path) -> Iterator[List[int]]:
+    """Reads an order file in batches of ORDER_CHUNK_SIZE volumes.
+
+    The file has one non-negative integer per line; blank lines are skipped.
+
+    Args:
+        file_path: Path to the order file
+
+    Yields:
+        Lists of order volumes
+
+    Raises:
+        ValueError: If a line is not a non-negative integer
+    """
+    with open(file_path, mode="r") as file:
+        lines = (line.strip() for line in file)
+        volumes = (line for line in lines if line)
+        while True:
+            chunk = list(islice(volumes, ORDER_CHUNK_SIZE))
+            if not chunk:
+                return
+            for volume in chunk:
+                if not volume.isdigit():
+                    raise ValueError(
+                        f"Order volumes must be non-negative integers, got '{volume}'"
+                    )
+            yield [int(volume) for volume in chunk]
+
+
+def check_order_batches(
+    checker: OrderChecker, batches: Iterable[List[int]]
+) -> Iterator[tuple]:
+    """Checks batches of order volumes against one OrderChecker.
+
+    Args:
+        checker: Checker built for the current unit set
+        batches: Batches of order volumes
+
+    Yields:
+        (volume, purchasable) for every volume, in input order
+    """
+    for batch in batches:
+        for volume, purchasable in zip(batch, checker.check(batch)):
+            yield (volume, bool(purchasable))
+
+
+def plan_order_batches(
+    planner: OrderPlanner, batches: Iterable[List[int]]
+) -> Iterator[tuple]:
+    """Finds fewest-package combinations for batches of order volumes.
+
+    The package count table is grown once per batch to cover its largest
+    volume.
+
+    Args:
+        planner: Planner built for the current unit set
+        batches: Batches of order volumes
+
+    Yields:
+        (volume, combination) for every volume, in input order; combination
+        is None when the volume is not purchasable
+    """
+    for batch in batches:
+        planner.ensure_max_volume(max(batch))
+        for volume in batch:
+            yield (volume, planner.fewest_packages(volume))
@@ -0,0 +1,152 @@
+import math
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from frobenius import RESIDUE_SENTINEL, np, table_fits
+
+# Table entries processed per vectorized step (8 MiB of int64)
+TABLE_CHUNK_SIZE = 1 << 20
+
+
+def create_mapped_table(table_path: Path, first_num: int):
+    """Creates a residue table backed by a memory-mapped file.
+
+    Args:
+        table_path: File to hold the table; created or overwritten
+        first_num: The smallest unit (a₁)
+
+    Returns:
+        An int64 np.memmap with n₀ = 0 and every other residue unreached
+    """
+    residue_table = np.memmap(table_path, dtype=np.int64, mode="w+", shape=(first_num,))
+    for start in range(0, first_num, TABLE_CHUNK_SIZE):
+        residue_table[start : start + TABLE_CHUNK_SIZE] = RESIDUE_SENTINEL
+    residue_table[0] = 0
+    return residue_table
+
+
+def _relax_sweep(residue_table, first_num: int, shift: int, cost: int) -> None:
+    """Applies n_q = min(n_q, n_{q-shift} + cost) to every residue in address order.
+
+    The sources of a chunk are at most two contiguous ranges, so the sweep
+    reads and writes the mapping sequentially.
+
+    Args:
+        residue_table: Mapped residue table to update
+        first_num: The smallest unit (a₁)
+        shift: Residue offset, cost mod a₁
+        cost: Volume added along the edge
+    """
+    limit = RESIDUE_SENTINEL - cost
+    for start in range(0, first_num, TABLE_CHUNK_SIZE):
+        stop = min(start + TABLE_CHUNK_SIZE, first_num)
+        source = (start - shift) % first_num
+        source_stop = source + stop - start
+
+        # Copy the sources first, they may overlap the chunk being written
+        if source_stop <= first_num:
+            candidates = np.array(residue_table[source:source_stop])
+        else:
+            candidates = np.concatenate(
+                (
+                    residue_table[source:first_num],
+                    residue_table[0 : source_stop - first_num],
+                )
+            )
+
+        reachable = candidates < limit
+        candidates[reachable] += cost
+        candidates[~reachable] = RESIDUE_SENTINEL
+        np.minimum(residue_table[start:stop], candidates, out=residue_table[start:stop])
+
+
+def mapped_round_robin_pass(
+    residue_table, first_num: int, current_num: int, current_gcd: int
+) -> None:
+    """Adds one unit to a mapped residue table with page-friendly sweeps.
+
+    Following a residue cycle jumps aᵢ mod a₁ entries per step, which touches
+    a new page almost every time. Instead the table is swept in address
+    order with shifts aᵢ, 2aᵢ, 4aᵢ, ...: after the sweep with 2ʲ·aᵢ every
+    entry has been relaxed with 0 to 2ʲ⁺¹-1 copies of aᵢ, so
+    ⌈log₂(a₁/gcd)⌉ sequential sweeps give the same table as one cycle walk.
+
+    Args:
+        residue_table: Mapped residue table to update
+        first_num: The smallest unit (a₁)
+        current_num: The unit being added
+        current_gcd: gcd(a₁, current_num)
+    """
+    cycle_length = first_num // current_gcd
+    copies = 1
+    while copies < cycle_length:
+        cost = copies * current_num
+        _relax_sweep(residue_table, first_num, cost % first_num, cost)
+        copies *= 2
+
+
+def chunked_table_max(residue_table, first_num: int) -> int:
+    """Finds the largest table entry one chunk at a time.
+
+    Args:
+        residue_table: Mapped residue table
+        first_num: The smallest unit (a₁)
+
+    Returns:
+        max(nₚ)
+    """
+    return max(
+        int(residue_table[start : start + TABLE_CHUNK_SIZE].max())
+        for start in range(0, first_num, TABLE_CHUNK_SIZE)
+    )
+
+
+def solve_out_of_core(units: list, table_dir: Path) -> Optional[int]:
+    """Computes the Frobenius number with the residue table in a mapped file.
+
+    Resident memory stays around a few TABLE_CHUNK_SIZE buffers; the rest of
+    the table lives in the page cache and can be written back to disk.
+
+    Args:
+        units: Sorted, zero-free units (see canonicalize_units)
+        table_dir: Directory for the temporary table file
+
+    Returns:
+        The Frobenius number or None if the units are not coprime
+
+    Raises:
+        ImportError: If numpy is not installed
+        OverflowError: If the table entries may not fit in int64 (see
+            table_fits)
+    """
+    if np is None:
+        raise ImportError("Out-of-core tables require numpy to be installed")
+    if math.gcd(*units) != 1:
+        return None
+    if not table_fits(units):
+        raise OverflowError(
+            f"Out-of-core tables hold int64 entries, too small for units {units}"
+        )
+
+    first_num = units[0]
+    Path(table_dir).mkdir(parents=True, exist_ok=True)
+    handle, table_path = tempfile.mkstemp(
+        prefix=f"residues-{first_num}-", suffix=".bin", dir=table_dir
+    )
+    os.close(handle)
+
+    try:
+        residue_table = create_mapped_table(Path(table_path), first_num)
+        for current_num in units[1:]:
+            if current_num >= residue_table[current_num % first_num]:
+                continue
+            mapped_round_robin_pass(
+                residue_table, first_num, current_num, math.gcd(first_num, current_num)
+            )
+        result = chunked_table_max(residue_table, first_num) - first_num
+        del residue_table
+        return result
+    finally:
+        os.remove(table_path)
@@ -0,0 +1,147 @@
+import math
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from frobenius import (
+    TABLE_ENTRY_BYTES,
+    build_residue_table,
+    np,
+    numpy_round_robin_pass,
+    prepare_residue_table,
+    round_robin_pass,
+    table_fits,
+)
+
+# Cycle ranges handed out per worker and pass, so a worker whose cycles are
+# still unreached does not sit idle while another walks long ones
+TASKS_PER_WORKER = 4
+
+# Set by init_shared_table in every worker process
+_shared_memory = None
+_shared_table = None
+_engine = "python"
+
+
+def _table_view(buffer, first_num: int, engine: str):
+    """Views a shared buffer as a residue table.
+
+    Args:
+        buffer: SharedMemory.buf of at least first_num entries
+        first_num: The smallest unit (a₁)
+        engine: "python" for an int64 memoryview, "numpy" for an ndarray
+
+    Returns:
+        A table usable by round_robin_pass or numpy_round_robin_pass
+    """
+    if engine == "numpy":
+        return np.ndarray((first_num,), dtype=np.int64, buffer=buffer)
+    return buffer[: first_num * TABLE_ENTRY_BYTES].cast("q")
+
+
+def init_shared_table(name: str, first_num: int, engine: str) -> None:
+    """Attaches the current process to a shared residue table.
+
+    Runs as the process pool initializer of build_shared_residue_table.
+
+    Args:
+        name: Name of the shared memory block
+        first_num: The smallest unit (a₁)
+        engine: "python" or "numpy"
+    """
+    global _shared_memory, _shared_table, _engine
+    _shared_memory = shared_memory.SharedMemory(name=name)
+    _shared_table = _table_view(_shared_memory.buf, first_num, engine)
+    _engine = engine
+
+
+def walk_shared_cycles(
+    first_num: int, current_num: int, current_gcd: int, start: int, stop: int
+) -> None:
+    """Walks cycles start to stop - 1 of one pass on the shared table.
+
+    Args:
+        first_num: The smallest unit (a₁)
+        current_num: The unit being added
+        current_gcd: gcd(a₁, current_num)
+        start: First cycle to walk
+        stop: One past the last cycle to walk
+    """
+    pass_function = numpy_round_robin_pass if _engine == "numpy" else round_robin_pass
+    pass_function(
+        _shared_table, first_num, current_num, current_gcd, range(start, stop)
+    )
+
+
+def build_shared_residue_table(units: list, engine: str = "python", workers: int = 2):
+    """Builds the residue table with one pass's cycles spread across processes.
+
+    A unit with g = gcd(a₁, aᵢ) > 1 splits its pass into g cycles that touch
+    disjoint residues, so the table lives in shared memory and each worker
+    walks its own range of cycles in place. Passes with a single cycle
+    (g = 1) have no independent work and run in this process on the same
+    table. Each pass waits for all of its cycles before the next one starts.
+    Units whose entries may not fit in the shared int64 table (see
+    table_fits) are built in this process with build_residue_table.
+
+    Args:
+        units: Sorted, zero-free units (see canonicalize_units)
+        engine: Round Robin engine, one of ENGINES; dijkstra and sieve have
+            no passes and are replaced by the pass-based engine (see
+            pass_engine)
+        workers: Number of worker processes
+
+    Returns:
+        The residue table (an int64 array, or a NumPy array for the numpy
+        engine), or None if the units are not coprime
+    """
+    if not table_fits(units):
+        return build_residue_table(units, engine)
+    setup = prepare_residue_table(units, engine, passes_only=True)
+    if setup is None:
+        return None
+    first_num = units[0]
+    engine, pass_function = setup.engine, setup.pass_function
+
+    block = shared_memory.SharedMemory(create=True, size=first_num * TABLE_ENTRY_BYTES)
+    residue_table = _table_view(block.buf, first_num, engine)
+    try:
+        residue_table[:] = setup.residue_table
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_shared_table,
+            initargs=(block.name, first_num, engine),
+        ) as executor:
+            for current_num, current_gcd in zip(units[1:], setup.pairwise_gcds):
+                # Already a combination of earlier units
+                if current_num >= residue_table[current_num % first_num]:
+                    continue
+                if current_gcd == 1:
+                    pass_function(residue_table, first_num, current_num, 1)
+                    continue
+
+                task_size = math.ceil(current_gcd / (workers * TASKS_PER_WORKER))
+                futures = [
+                    executor.submit(
+                        walk_shared_cycles,
+                        first_num,
+                        current_num,
+                        current_gcd,
+                        start,
+                        min(start + task_size, current_gcd),
+                    )
+                    for start in range(0, current_gcd, task_size)
+                ]
+                for future in futures:
+                    future.result()
+
+        if engine == "numpy":
+            return residue_table.copy()
+        return array("q", residue_table)
+    finally:
+        if engine != "numpy":
+            residue_table.release()
+        del residue_table
+        block.close()
+        block.unlink()
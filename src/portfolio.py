@@ -0,0 +1,289 @@
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple, Optional, Tuple
+
+from frobenius import (
+    frobenius_from_table,
+    genus_from_table,
+    new_residue_table,
+    round_robin_pass,
+    table_fits,
+)
+
+# Quantities search_portfolio can minimize
+OBJECTIVES = ("frobenius", "genus")
+
+# Shared bound value while no subset has been evaluated yet
+NO_BOUND = 2**63 - 1
+
+# Set by init_portfolio_search in every process that runs search_subtree
+_candidates: List[int] = []
+_count = 0
+_objective = "frobenius"
+_shared_bound = None
+
+
+class PortfolioResult(NamedTuple):
+    """Best package-size subset found by search_portfolio.
+
+    Attributes:
+        units: The chosen units in ascending order
+        frobenius_number: Their Frobenius number
+        genus: Their number of unpurchasable volumes
+    """
+
+    units: List[int]
+    frobenius_number: int
+    genus: int
+
+
+def counting_lower_bound(first_num: int, second_num: int, count: int) -> int:
+    """Bounds the Frobenius number of any set with the given two smallest units.
+
+    Every non-zero residue mod a₁ needs a sum of the count - 1 larger units,
+    each at least a₂. Sums of at most m of them take at most
+    C(m + count - 1, count - 1) - 1 non-zero values, so some residue needs
+    m parts for the smallest m that covers a₁ - 1 residues. For two units
+    this is exactly (a₁ - 1)·a₂ - a₁.
+
+    Args:
+        first_num: The smallest unit (a₁)
+        second_num: A lower bound on the second smallest unit (a₂)
+        count: Number of units in the set
+
+    Returns:
+        A lower bound on the Frobenius number
+    """
+    parts, reachable = 0, 0
+    while reachable < first_num - 1:
+        parts += 1
+        reachable = math.comb(parts + count - 1, count - 1) - 1
+    return parts * second_num - first_num
+
+
+def table_lower_bound(
+    residue_table, first_num: int, next_num: int, objective: str
+) -> int:
+    """Bounds the objective of any superset built from a prefix table.
+
+    Units added later are all at least next_num, so a residue p can only
+    improve to the smallest value >= next_num in its class:
+    n'ₚ >= min(nₚ, next_num + (p - next_num) mod a₁).
+
+    Args:
+        residue_table: Residue table of the current prefix
+        first_num: The smallest unit (a₁)
+        next_num: Smallest unit that can still be added
+        objective: One of OBJECTIVES
+
+    Returns:
+        A lower bound on the Frobenius number or genus
+    """
+    floors = [
+        min(value, next_num + (residue - next_num) % first_num)
+        for residue, value in enumerate(residue_table)
+    ]
+    if objective == "genus":
+        return genus_from_table(floors, first_num)
+    return max(floors) - first_num
+
+
+def _objective_bound(frobenius_bound: int, objective: str) -> int:
+    """Turns a Frobenius number bound into a bound on the objective.
+
+    Args:
+        frobenius_bound: Lower bound on the Frobenius number
+        objective: One of OBJECTIVES
+
+    Returns:
+        The bound itself, or the genus bound g >= (F + 1) / 2
+    """
+    if objective == "genus":
+        return max(0, (frobenius_bound + 2) // 2)
+    return frobenius_bound
+
+
+def init_portfolio_search(
+    candidates: List[int], count: int, objective: str, shared_bound
+) -> None:
+    """Sets up the search state used by search_subtree in the current process.
+
+    Also runs as the process pool initializer, so the catalogue is sent to
+    each worker once instead of with every subtree.
+
+    Args:
+        candidates: Sorted, distinct candidate units
+        count: Number of units to choose
+        objective: One of OBJECTIVES
+        shared_bound: multiprocessing.Value holding the best objective found
+            by any process
+    """
+    global _candidates, _count, _objective, _shared_bound
+    _candidates = candidates
+    _count = count
+    _objective = objective
+    _shared_bound = shared_bound
+
+
+def search_subtree(first_index: int, second_index: int) -> Optional[Tuple]:
+    """Searches every subset whose two smallest units are the given candidates.
+
+    Subsets are extended in sorted-prefix order, so each prefix's residue
+    table is built once, with one Round Robin pass on a copy of its parent's
+    table. A prefix is dropped as soon as table_lower_bound exceeds the best
+    objective found by any process; ties are kept, so the result does not
+    depend on scheduling.
+
+    Args:
+        first_index: Index of a₁ in the candidates
+        second_index: Index of a₂ in the candidates
+
+    Returns:
+        (objective, units, frobenius_number, genus) of the best subset in
+        the subtree, or None if the subtree was pruned or has no coprime
+        subset
+    """
+    first_num = _candidates[first_index]
+    second_num = _candidates[second_index]
+    frobenius_bound = counting_lower_bound(first_num, second_num, _count)
+    if _objective_bound(frobenius_bound, _objective) > _shared_bound.value:
+        return None
+
+    residue_table = new_residue_table(first_num, not table_fits(_candidates))
+    round_robin_pass(
+        residue_table, first_num, second_num, math.gcd(first_num, second_num)
+    )
+    best = [None]
+    _extend_subtree([first_num, second_num], residue_table, second_index + 1, best)
+    return best[0]
+
+
+def _extend_subtree(units: list, residue_table, start: int, best: list) -> None:
+    """Depth-first step of search_subtree.
+
+    Args:
+        units: Current prefix
+        residue_table: Residue table of the prefix
+        start: Index of the first candidate that may be added
+        best: One-element list holding the subtree's best result
+    """
+    first_num = units[0]
+    if len(units) == _count:
+        if math.gcd(*units) == 1:
+            _record_subset(units, residue_table, best)
+        return
+
+    last_start = len(_candidates) - (_count - len(units))
+    for index in range(start, last_start + 1):
+        current_num = _candidates[index]
+        if _shared_bound.value != NO_BOUND:
+            bound = table_lower_bound(residue_table, first_num, current_num, _objective)
+            # The bound only grows with current_num, so later candidates fail too
+            if bound > _shared_bound.value:
+                return
+
+        extended_table = residue_table
+        if current_num < residue_table[current_num % first_num]:
+            extended_table = residue_table[:]
+            round_robin_pass(
+                extended_table,
+                first_num,
+                current_num,
+                math.gcd(first_num, current_num),
+            )
+        _extend_subtree(units + [current_num], extended_table, index + 1, best)
+
+
+def _record_subset(units: list, residue_table, best: list) -> None:
+    """Scores a complete subset and keeps it if it is the best so far.
+
+    Args:
+        units: Complete, coprime subset
+        residue_table: Its residue table
+        best: One-element list holding the subtree's best result
+    """
+    frobenius_number = frobenius_from_table(residue_table, units[0])
+    genus = genus_from_table(residue_table, units[0])
+    value = genus if _objective == "genus" else frobenius_number
+    result = (value, list(units), frobenius_number, genus)
+    if best[0] is None or result[:2] < best[0][:2]:
+        best[0] = result
+
+    with _shared_bound.get_lock():
+        if value < _shared_bound.value:
+            _shared_bound.value = value
+
+
+def search_portfolio(
+    catalogue: list,
+    count: int,
+    objective: str = "frobenius",
+    max_first: Optional[int] = None,
+    workers: int = 1,
+) -> Optional[PortfolioResult]:
+    """Finds the count-subset of a catalogue with the smallest objective.
+
+    Instead of solving all C(n, count) subsets from scratch, subsets are
+    enumerated as sorted prefixes: a subset shares the residue tables of its
+    prefixes with every other subset that starts the same way, so each
+    additional unit costs one Round Robin pass. Prefixes are pruned with
+    counting_lower_bound and table_lower_bound against the best subset
+    found so far. With workers > 1, the subtrees for each (a₁, a₂) pair are
+    spread across a process pool that shares the best objective.
+
+    Ties are broken by the lexicographically smallest subset.
+
+    Args:
+        catalogue: Candidate package sizes; zeros and duplicates are ignored
+        count: Number of package sizes to choose
+        objective: "frobenius" for the smallest Frobenius number, "genus" for
+            the fewest unpurchasable volumes
+        max_first: Largest allowed smallest unit (a₁), if any
+        workers: Number of worker processes
+
+    Returns:
+        The best subset, or None if no count-subset is coprime
+
+    Raises:
+        ValueError: If objective is unknown, count is below 2 or the
+            catalogue holds negative sizes
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(
+            f"Unknown objective '{objective}', expected one of {', '.join(OBJECTIVES)}"
+        )
+    if count < 2:
+        raise ValueError(f"At least 2 units must be chosen, got {count}")
+    if any(number < 0 for number in catalogue):
+        raise ValueError("Package sizes must be non-negative")
+
+    candidates = sorted(set(number for number in catalogue if number > 0))
+    tasks = [
+        (first_index, second_index)
+        for first_index in range(len(candidates) - count + 1)
+        if max_first is None or candidates[first_index] <= max_first
+        for second_index in range(first_index + 1, len(candidates) - count + 2)
+    ]
+
+    if not tasks:
+        return None
+
+    shared_bound = multiprocessing.Value("q", NO_BOUND)
+    initargs = (candidates, count, objective, shared_bound)
+    if workers <= 1:
+        init_portfolio_search(*initargs)
+        results = [search_subtree(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_portfolio_search,
+            initargs=initargs,
+        ) as executor:
+            results = list(executor.map(search_subtree, *zip(*tasks)))
+
+    results = [result for result in results if result is not None]
+    if not results:
+        return None
+    _, units, frobenius_number, genus = min(results, key=lambda result: result[:2])
+    return PortfolioResult(units, frobenius_number, genus)
@@ -0,0 +1,103 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+class SolveProfile:
+    """Collects wall times and counters for one solve.
+
+    Solver functions take an optional profile and only touch it when one is
+    given, so an unprofiled solve runs the same code as before.
+
+    Phase          | Covers
+    ---------------+--------------------------------------------------
+    parse          | reading and validating the input row
+    canonicalize   | canonicalize_units
+    cache_lookup   | result cache get
+    gcd            | compute_gcd_values
+    table_init     | allocating the residue table
+    passes         | all Round Robin passes (see passes for each unit)
+    closed_form    | a closed-form formula
+    out_of_core    | a memory-mapped Round Robin solve
+    table_max      | reading the Frobenius number off the table
+
+    Counter          | Meaning
+    -----------------+--------------------------------------------------
+    table_updates    | residue table entries lowered
+    units_skipped    | passes skipped, aᵢ already reachable
+    unreached_cycles | residue cycles skipped, no reachable start
+
+    Attributes:
+        phases: Phase name -> seconds
+        passes: One dict per pass with unit, gcd, seconds and updates
+        counters: Counter name -> count
+        details: Other facts about the solve, e.g. method and engine
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.passes: List[dict] = []
+        self.counters: Dict[str, int] = {
+            "table_updates": 0,
+            "units_skipped": 0,
+            "unreached_cycles": 0,
+        }
+        self.details: Dict[str, object] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Times a block and adds it to a phase.
+
+        Args:
+            name: Phase name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - start)
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        """Adds time measured elsewhere to a phase.
+
+        Args:
+            name: Phase name
+            seconds: Wall time to add
+        """
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increments a counter.
+
+        Args:
+            name: Counter name
+            amount: Value to add
+        """
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record_pass(
+        self, unit: int, current_gcd: int, seconds: float, updates: Optional[int]
+    ) -> None:
+        """Records one Round Robin pass.
+
+        Args:
+            unit: The unit that was added
+            current_gcd: gcd(a₁, unit), the number of residue cycles
+            seconds: Wall time of the pass
+            updates: Table entries the pass lowered
+        """
+        self.passes.append(
+            {"unit": unit, "gcd": current_gcd, "seconds": seconds, "updates": updates}
+        )
+        self.add_phase("passes", seconds)
+        if updates:
+            self.count("table_updates", updates)
+
+    def to_dict(self) -> dict:
+        """Returns the profile as a JSON-serializable dict."""
+        return {
+            **self.details,
+            "phases": dict(self.phases),
+            "passes": list(self.passes),
+            "counters": dict(self.counters),
+        }
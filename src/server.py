@@ -0,0 +1,302 @@
+import asyncio
+import json
+import math
+import multiprocessing
+import signal
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from cache import ResultCache, cache_key
+from canonical import canonicalize_units, validate_units
+from dispatch import select_method, solve_units
+from frobenius import validate_engine
+
+# Longest request line accepted, in bytes
+MAX_REQUEST_BYTES = 1 << 20
+
+
+def parse_address(address: str) -> dict:
+    """Parses a --serve address into asyncio server arguments.
+
+    Args:
+        address: "HOST:PORT", ":PORT" for localhost, or "unix:PATH"
+
+    Returns:
+        {"path": ...} for a Unix socket, or {"host": ..., "port": ...}
+
+    Raises:
+        ValueError: If the address cannot be parsed
+    """
+    if address.startswith("unix:"):
+        return {"path": address[len("unix:") :]}
+
+    host, _, port = address.rpartition(":")
+    if not port.isdigit():
+        raise ValueError(
+            f"Expected HOST:PORT, :PORT or unix:PATH as the address, got '{address}'"
+        )
+    return {"host": host or "127.0.0.1", "port": int(port)}
+
+
+class SolverService:
+    """Answers JSON-lines solve requests with warm tables and coalescing.
+
+    Each request line is a JSON object {"id": ..., "units": [...]} and gets
+    one response line {"id": ..., "result": ..., "method": ..., "removed":
+    [...], "cached": ..., "coalesced": ...} or {"id": ..., "error": "..."}.
+    Requests on one connection are handled concurrently, so responses can
+    arrive out of order and are matched by id.
+
+    - Results and residue tables stay in an in-memory ResultCache, so a
+      repeated canonical set is answered without solving
+    - Round Robin solves run in an executor, so the event loop keeps serving
+      other connections; closed forms are cheap and run inline
+    - Cache lookups and stores, which may compress a table and write it to
+      SQLite, run on one cache thread, off the event loop
+    - Concurrent requests for the same canonical set share one computation
+
+    Attributes:
+        engine: Round Robin engine used when no closed form applies
+        cache: Cache holding solved sets and their residue tables, or None
+            when caching is off
+    """
+
+    def __init__(
+        self,
+        engine: str = "python",
+        workers: int = 1,
+        cache: Optional[ResultCache] = None,
+        executor: Optional[Executor] = None,
+        use_cache: bool = True,
+    ):
+        """Sets up the cache and the worker pool.
+
+        Args:
+            engine: Round Robin engine used when no closed form applies
+            workers: Worker processes for Round Robin solves
+            cache: Cache to serve from; an in-memory one by default
+            executor: Executor to run solves in instead of a process pool
+            use_cache: False disables caching entirely; requests for the
+                same set are still coalesced while one is being solved
+        """
+        validate_engine(engine)
+        self.engine = engine
+        self.cache = None
+        if use_cache:
+            self.cache = cache if cache is not None else ResultCache()
+        # ResultCache is not thread-safe, so it is only used from this thread
+        self._cache_thread = ThreadPoolExecutor(max_workers=1)
+        # Workers are spawned, not forked: a forked worker would inherit the
+        # open client sockets and keep them from closing
+        self._executor = executor or ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    async def solve(self, numbers: list) -> dict:
+        """Solves one unit set, reusing cached and in-flight results.
+
+        Args:
+            numbers: A list of non-negative integers
+
+        Returns:
+            A dict with result, method, removed, cached (answered from the
+            cache) and coalesced (shared another request's computation)
+
+        Raises:
+            TypeError: If any value is not an integer
+            ValueError: If any value is negative
+        """
+        validate_units(numbers)
+        response = {"result": None, "method": "no_solution", "removed": []}
+        response.update(cached=False, coalesced=False)
+        if len(numbers) < 2:
+            return response
+
+        units, removed = canonicalize_units(numbers)
+        response["removed"] = removed
+        entry = None
+        if self.cache is not None:
+            entry = await self._in_cache_thread(self.cache.get, units)
+        if entry is not None:
+            response.update(result=entry.value, method=entry.method, cached=True)
+            return response
+
+        key = cache_key(units)
+        response["coalesced"] = key in self._in_flight
+        if not response["coalesced"]:
+            self._in_flight[key] = asyncio.ensure_future(self._solve_units(units))
+            self._in_flight[key].add_done_callback(
+                lambda _: self._in_flight.pop(key, None)
+            )
+
+        response["result"], response["method"] = await asyncio.shield(
+            self._in_flight[key]
+        )
+        return response
+
+    async def _solve_units(self, units: list) -> tuple:
+        """Solves a canonical set and stores it in the cache.
+
+        Args:
+            units: Canonical units
+
+        Returns:
+            A tuple of (value, method)
+        """
+        if units and math.gcd(*units) == 1 and select_method(units) == "round_robin":
+            loop = asyncio.get_running_loop()
+            value, method, residue_table = await loop.run_in_executor(
+                self._executor, solve_units, units, self.engine
+            )
+        else:
+            value, method, residue_table = solve_units(units, self.engine)
+
+        if self.cache is not None:
+            await self._in_cache_thread(
+                self.cache.put, units, value, method, residue_table
+            )
+        return (value, method)
+
+    async def _in_cache_thread(self, function: Callable, *args):
+        """Runs a cache call on the cache thread.
+
+        Args:
+            function: ResultCache method to call
+            *args: Its arguments
+
+        Returns:
+            What the call returned
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cache_thread, function, *args)
+
+    async def handle_request(self, line: bytes) -> dict:
+        """Turns one request line into a response object.
+
+        Args:
+            line: A JSON-encoded request
+
+        Returns:
+            The response, with the request id if there was one
+        """
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Requests must be JSON objects")
+            request_id = request.get("id")
+            numbers = request.get("units")
+            if not isinstance(numbers, list):
+                raise ValueError("Requests need a 'units' list")
+            return {"id": request_id, **await self.solve(numbers)}
+        except Exception as error:
+            return {"id": request_id, "error": f"{type(error).__name__}: {error}"}
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serves one client until it closes the connection.
+
+        Args:
+            reader: Client stream
+            writer: Response stream
+        """
+        tasks = set()
+
+        async def respond(line: bytes) -> None:
+            response = await self.handle_request(line)
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.ensure_future(respond(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def close(self) -> None:
+        """Shuts down the worker pool and the cache."""
+        self._executor.shutdown(cancel_futures=True)
+        self._cache_thread.shutdown()
+        if self.cache is not None:
+            self.cache.close()
+
+    async def start(self, address: str) -> asyncio.AbstractServer:
+        """Starts listening on an address.
+
+        Args:
+            address: See parse_address
+
+        Returns:
+            The running asyncio server
+        """
+        options = parse_address(address)
+        if "path" in options:
+            return await asyncio.start_unix_server(
+                self.handle_connection, options["path"], limit=MAX_REQUEST_BYTES
+            )
+        return await asyncio.start_server(
+            self.handle_connection,
+            options["host"],
+            options["port"],
+            limit=MAX_REQUEST_BYTES,
+        )
+
+
+async def serve_forever(service: SolverService, address: str) -> None:
+    """Runs the service until SIGINT or SIGTERM.
+
+    Args:
+        service: Service to run
+        address: See parse_address
+    """
+    server = await service.start(address)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, stop.set)
+
+    try:
+        async with server:
+            await stop.wait()
+    finally:
+        service.close()
+        options = parse_address(address)
+        if "path" in options:
+            Path(options["path"]).unlink(missing_ok=True)
+
+
+def run_server(
+    address: str,
+    engine: str = "python",
+    workers: int = 1,
+    cache_path: Optional[str] = None,
+    use_cache: bool = True,
+) -> None:
+    """Runs a solver service on an address until interrupted.
+
+    Args:
+        address: "HOST:PORT", ":PORT" or "unix:PATH"
+        engine: Round Robin engine used when no closed form applies
+        workers: Worker processes for Round Robin solves
+        cache_path: SQLite file to also keep results in, if any
+        use_cache: False disables caching entirely
+    """
+    cache = None
+    if use_cache:
+        cache = ResultCache(Path(cache_path) if cache_path else None)
+    service = SolverService(engine, workers, cache, use_cache=use_cache)
+    asyncio.run(serve_forever(service, address))
@@ -0,0 +1,229 @@
+import math
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple, Optional, Tuple
+
+from canonical import canonicalize_units
+from frobenius import (
+    RESIDUE_SENTINEL,
+    extend_residue_table,
+    frobenius_from_table,
+    genus_from_table,
+    new_residue_table,
+    np,
+    pass_engine,
+    validate_engine,
+)
+
+SWEEP_PATTERN = re.compile(r"(\d+)=(\d+):(\d+)(?::(\d+))?$")
+
+# Candidates per task sent to a worker, as a fraction of the range per worker
+SWEEP_TASKS_PER_WORKER = 4
+
+# Set by init_sweep in every process that runs sweep_candidates
+_fixed_units: List[int] = []
+_fixed_table = None
+_engine = "python"
+
+
+class SweepRow(NamedTuple):
+    """Outcome of one candidate value in a sweep.
+
+    Attributes:
+        unit: Value used for the varying unit
+        frobenius_number: Frobenius number with that value, or None if no
+            solution exists
+        genus: Number of unpurchasable volumes, or None if no solution exists
+    """
+
+    unit: int
+    frobenius_number: Optional[int]
+    genus: Optional[int]
+
+
+def parse_sweep(value: str) -> Tuple[int, range]:
+    """Parses a --sweep argument.
+
+    Args:
+        value: "UNIT=START:STOP" or "UNIT=START:STOP:STEP"; STOP is included
+
+    Returns:
+        A tuple of (unit, candidate values)
+
+    Raises:
+        ValueError: If the argument is malformed or the range is empty
+    """
+    match = SWEEP_PATTERN.match(value)
+    if match is None:
+        raise ValueError(f"Expected UNIT=START:STOP[:STEP], got '{value}'")
+
+    unit, start, stop = (int(group) for group in match.groups()[:3])
+    step = int(match.group(4) or 1)
+    if step < 1 or start > stop:
+        raise ValueError(f"The sweep range {start}:{stop}:{step} is empty")
+    return (unit, range(start, stop + 1, step))
+
+
+def build_fixed_table(units: list, engine: str = "python"):
+    """Builds the residue table of units whose gcd may exceed 1.
+
+    Unlike build_residue_table this keeps going for non-coprime units, since
+    the varying unit may still make the set coprime. Residues the units
+    cannot reach stay at RESIDUE_SENTINEL.
+
+    Args:
+        units: Sorted, zero-free units (see canonicalize_units)
+        engine: Round Robin engine, one of ENGINES
+
+    Returns:
+        The residue table (an int64 array, or a NumPy array for the numpy
+        engine)
+    """
+    first_num = units[0]
+    if pass_engine(units, engine) == "numpy":
+        residue_table = np.full(first_num, RESIDUE_SENTINEL, dtype=np.int64)
+        residue_table[0] = 0
+    else:
+        residue_table = new_residue_table(first_num)
+
+    for current_num in units[1:]:
+        residue_table = extend_residue_table(
+            residue_table, first_num, current_num, in_place=True
+        )
+    return residue_table
+
+
+def init_sweep(fixed_units: List[int], fixed_table, engine: str) -> None:
+    """Sets up the fixed table used by sweep_candidates in the current process.
+
+    Also runs as the process pool initializer, so the fixed table is sent to
+    each worker once instead of with every task.
+
+    Args:
+        fixed_units: Canonical units that do not change
+        fixed_table: Their residue table, or None if there are none
+        engine: Round Robin engine, one of ENGINES
+    """
+    global _fixed_units, _fixed_table, _engine
+    _fixed_units = fixed_units
+    _fixed_table = fixed_table
+    _engine = engine
+
+
+def sweep_candidates(candidates: List[int]) -> List[SweepRow]:
+    """Solves the fixed units together with each candidate value.
+
+    A candidate at least as large as the smallest fixed unit costs one
+    Round Robin pass on a copy of the fixed table; a smaller one changes
+    the table size, so its table is built from scratch.
+
+    Args:
+        candidates: Values for the varying unit
+
+    Returns:
+        One SweepRow per candidate, in order
+    """
+    fixed_gcd = math.gcd(*_fixed_units)
+    rows = []
+    for candidate in candidates:
+        if _fixed_units and candidate == 0:
+            first_num, residue_table = _fixed_units[0], _fixed_table
+        elif _fixed_units and candidate >= _fixed_units[0]:
+            first_num = _fixed_units[0]
+            residue_table = extend_residue_table(_fixed_table, first_num, candidate)
+        elif candidate > 0:
+            first_num = candidate
+            residue_table = build_fixed_table([candidate] + _fixed_units, _engine)
+        else:
+            rows.append(SweepRow(candidate, None, None))
+            continue
+
+        if math.gcd(fixed_gcd, candidate) != 1:
+            rows.append(SweepRow(candidate, None, None))
+            continue
+        rows.append(
+            SweepRow(
+                candidate,
+                frobenius_from_table(residue_table, first_num),
+                genus_from_table(residue_table, first_num),
+            )
+        )
+    return rows
+
+
+def sweep_unit(
+    numbers: list,
+    unit: int,
+    candidates: range,
+    engine: str = "python",
+    workers: int = 1,
+) -> List[SweepRow]:
+    """Solves a unit set once for every value of one of its units.
+
+    The residue table of the units that stay fixed is built once; each
+    candidate then only adds its own pass on a copy of it. With workers > 1
+    the candidates are split into contiguous slices solved in a process
+    pool.
+
+    Args:
+        numbers: A list of non-negative integers that contains unit
+        unit: The unit to vary
+        candidates: Values to try in place of unit
+        engine: Round Robin engine, one of ENGINES
+        workers: Number of worker processes
+
+    Returns:
+        One SweepRow per candidate, in order
+
+    Raises:
+        ValueError: If unit is not in numbers or engine is unknown
+    """
+    validate_engine(engine)
+    if unit not in numbers:
+        raise ValueError(f"Unit {unit} is not one of the units {numbers}")
+    if len(numbers) < 2:
+        return [SweepRow(candidate, None, None) for candidate in candidates]
+
+    fixed_numbers = list(numbers)
+    fixed_numbers.remove(unit)
+    fixed_units = canonicalize_units(fixed_numbers).units
+    fixed_table = build_fixed_table(fixed_units, engine) if fixed_units else None
+    initargs = (fixed_units, fixed_table, engine)
+
+    candidates = list(candidates)
+    if workers <= 1:
+        init_sweep(*initargs)
+        return sweep_candidates(candidates)
+
+    task_size = max(1, -(-len(candidates) // (workers * SWEEP_TASKS_PER_WORKER)))
+    tasks = [
+        candidates[start : start + task_size]
+        for start in range(0, len(candidates), task_size)
+    ]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_sweep, initargs=initargs
+    ) as executor:
+        return [row for rows in executor.map(sweep_candidates, tasks) for row in rows]
+
+
+def format_sweep_table(rows: List[SweepRow]) -> List[str]:
+    """Lays out sweep results as an aligned text table.
+
+    Args:
+        rows: Results from sweep_unit
+
+    Returns:
+        Header, separator and one line per row, without trailing newlines
+    """
+    header = ("unit", "frobenius", "gaps")
+    cells = [(str(row.unit), str(row.frobenius_number), str(row.genus)) for row in rows]
+    widths = [
+        max(len(line[column]) for line in [header] + cells) for column in range(3)
+    ]
+
+    def format_line(line: tuple) -> str:
+        return " | ".join(cell.rjust(width) for cell, width in zip(line, widths))
+
+    lines = [format_line(header), "-+-".join("-" * width for width in widths)]
+    lines.extend(format_line(line) for line in cells)
+    return lines
@@ -1,8 +1,12 @@
+import io
+import json
+import os
 import unittest
 from unittest.mock import Mock, patch, mock_open
 from pathlib import Path
 
 import app
+from dispatch import Solution
 
 
 class TestApp(unittest.TestCase):
@@ -180,7 +184,7 @@ class TestApp(unittest.TestCase):
         mock_string_to_list.assert_called_once_with("1,2,3")
         self.assertEqual(result, [["1", "2", "3"]])
 
-    @patch("app.read_csv_to_integer_lists")
+    @patch("app.iter_csv_integer_lists")
     def test_process_input_args_file(self, mock_read_csv):
         """Test input formatting with file type"""
 
@@ -216,43 +220,409 @@ class TestApp(unittest.TestCase):
             # Assert
             mock_read_csv.assert_not_called()
 
-    @patch("app.solve_for_frobenius_number")
+    @patch("app.solve")
     def test_calculate_and_print_results(self, mock_solve):
         """Test Frobenius calculator execution"""
 
         # Arrange
         mock_input = [[5, 8, 9, 12]]
-        mock_solve.return_value = 11
+        mock_solve.return_value = Solution(11, "round_robin", [])
 
-        with patch("builtins.print") as mock_print:
+        output = io.StringIO()
 
-            # Apply
-            app.calculate_and_print_results(mock_input, True)
+        # Apply
+        app.calculate_and_print_results(mock_input, True, output=output)
 
-            # Assert
-            mock_solve.assert_called_once()
-            mock_print.assert_called_once_with(
-                f"The largest order volume that is NOT perfectly purchasable for units {mock_input[0]} is 11."
-            )
+        # Assert
+        mock_solve.assert_called_once()
+        self.assertEqual(
+            output.getvalue(),
+            f"The largest order volume that is NOT perfectly purchasable for units {mock_input[0]} is 11.\n",
+        )
 
-    @patch("app.solve_for_frobenius_number")
+    @patch("app.solve")
     def test_calculate_and_print_results_None(self, mock_solve):
         """Test Frobenius calculator execution if result is None"""
 
         # Arrange
         mock_input = [[5], [2, 4]]
-        mock_solve.return_value = None
+        mock_solve.return_value = Solution(None, "no_solution", [])
+
+        output = io.StringIO()
+
+        # Apply
+        app.calculate_and_print_results(mock_input, True, output=output)
+
+        # Assert
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(
+            lines[-1], f"There is no finite solution for units {mock_input[1]}."
+        )
+
+    @patch("app.solve")
+    def test_solve_row_error(self, mock_solve):
+        """Test that a failing row is reported instead of raised"""
+
+        # Arrange
+        mock_solve.side_effect = TypeError("bad row")
+
+        # Apply
+        result = app.solve_row([1, 2], "python")
+
+        # Assert
+        self.assertEqual(result, (None, "TypeError: bad row"))
+
+    @patch("app.ROW_CHUNK_SIZE", 2)
+    def test_iter_results_workers(self):
+        """Test that pooled results keep input order and isolate failures"""
+
+        # Arrange
+        rows = [[3, 5], [6, 9, 20], [4, 6], [2.5, 3], [3, 5, 7], [2, 3]]
 
-        with patch("builtins.print") as mock_print:
+        # Apply
+        results = list(app.iter_results(rows, workers=2))
+
+        # Assert
+        self.assertEqual([numbers for numbers, _, _ in results], rows)
+        self.assertEqual(
+            [result for _, result, _ in results], [7, 43, None, None, 4, 1]
+        )
+        self.assertIsNone(results[2][2])
+        self.assertTrue(results[3][2].startswith("TypeError"))
+
+    @patch("app.solve")
+    def test_calculate_and_print_results_error(self, mock_solve):
+        """Test Frobenius calculator execution if a row fails"""
+
+        # Arrange
+        mock_solve.side_effect = ValueError("boom")
+
+        output = io.StringIO()
+
+        # Apply
+        app.calculate_and_print_results([[3, 5]], False, output=output)
+
+        # Assert
+        self.assertEqual(output.getvalue(), "[3, 5] -> error: ValueError: boom\n")
+
+    def test_estimate_and_print_results(self):
+        """Test that --estimate writes bounds instead of results"""
+
+        # Arrange
+        output = io.StringIO()
+
+        # Apply
+        app.estimate_and_print_results(
+            [[6, 9, 20], [4, 6], [3, -5]], False, output=output
+        )
+
+        # Assert
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[0], "[6, 9, 20] -> 43..43 (three_units, ~0 s, 0 bytes)")
+        self.assertEqual(lines[1], "[4, 6] -> None")
+        self.assertTrue(lines[2].startswith("[3, -5] -> error: ValueError"))
+
+    def test_calculate_and_print_results_share_prefixes(self):
+        """Test that the batch planner writes rows in input order"""
+
+        # Arrange
+        output = io.StringIO()
+
+        # Apply
+        app.calculate_and_print_results(
+            [[6, 9, 20, 21], [6, 9, 20], [4, 6], [3, -5]],
+            False,
+            output=output,
+            share_prefixes=True,
+        )
+
+        # Assert
+        lines = output.getvalue().splitlines()
+        self.assertEqual(
+            lines[:3], ["[6, 9, 20, 21] -> 43", "[6, 9, 20] -> 43", "[4, 6] -> None"]
+        )
+        self.assertTrue(lines[3].startswith("[3, -5] -> error: ValueError"))
+
+    @unittest.skipIf(app.np is None, "numpy is not installed")
+    def test_calculate_and_print_results_vectorize(self):
+        """Test that vectorized batches write rows in input order"""
+
+        # Arrange
+        output = io.StringIO()
+
+        # Apply
+        app.calculate_and_print_results(
+            [[6, 9, 20], [3, 5], [4, 6], [3, -5]],
+            False,
+            output=output,
+            vectorize=True,
+        )
+
+        # Assert
+        lines = output.getvalue().splitlines()
+        self.assertEqual(
+            lines[:3], ["[6, 9, 20] -> 43", "[3, 5] -> 7", "[4, 6] -> None"]
+        )
+        self.assertTrue(lines[3].startswith("[3, -5] -> error: ValueError"))
+
+    def test_format_portfolio_result(self):
+        """Test the output line of a portfolio search"""
+
+        # Arrange
+        result = app.search_portfolio([6, 9, 20, 11, 13, 17, 40], 3)
+
+        # Apply / Assert
+        self.assertEqual(
+            app.format_portfolio_result(result, 3, False), "[6, 9, 11] -> 25 (13 gaps)"
+        )
+        self.assertEqual(app.format_portfolio_result(None, 3, False), "None")
+        self.assertIn("[6, 9, 11]", app.format_portfolio_result(result, 3, True))
+
+    def test_calculate_and_print_results_profile(self):
+        """Test that --profile writes one JSON line per row next to the results"""
+
+        # Arrange
+        rows = [[6, 9, 20], [12, 18, 20, 27], [2.5, 3]]
+        output = io.StringIO()
+        profile_output = io.StringIO()
+
+        # Apply
+        app.calculate_and_print_results(
+            rows, False, output=output, profile_output=profile_output
+        )
+
+        # Assert
+        self.assertEqual(len(output.getvalue().splitlines()), 3)
+        records = [json.loads(line) for line in profile_output.getvalue().splitlines()]
+        self.assertEqual([record["row"] for record in records], [1, 2, 3])
+        self.assertEqual(records[0]["method"], "three_units")
+        self.assertIn("parse", records[0]["phases"])
+        self.assertEqual(records[1]["result"], 73)
+        self.assertEqual(len(records[1]["passes"]), 3)
+        self.assertIn("passes", records[1]["phases"])
+        self.assertTrue(records[2]["error"].startswith("TypeError"))
+
+    @patch("app.ROW_CHUNK_SIZE", 2)
+    def test_iter_results_workers_profile(self):
+        """Test that pooled rows carry their profiles"""
+
+        # Apply
+        results = list(
+            app.iter_results(
+                [[3, 5], [12, 18, 20, 27], [4, 6]], workers=2, profile=True
+            )
+        )
+
+        # Assert
+        self.assertEqual([len(result) for result in results], [4, 4, 4])
+        self.assertEqual(results[1][3]["method"], "round_robin")
+        self.assertIn("parse", results[2][3]["phases"])
+
+    @patch("app.solve")
+    def test_calculate_and_print_results_flush(self, mock_solve):
+        """Test that the first row is flushed before the rest are solved"""
+
+        # Arrange
+        mock_solve.return_value = Solution(1, "two_units", [])
+        output = Mock()
+        flushed_before_second_row = []
+
+        def rows():
+            yield [2, 3]
+            flushed_before_second_row.append(output.flush.called)
+            yield [2, 3]
+
+        # Apply
+        app.calculate_and_print_results(rows(), False, output=output)
+
+        # Assert
+        self.assertEqual(flushed_before_second_row, [True])
+        self.assertEqual(output.write.call_count, 2)
+
+    def test_iter_csv_integer_lists_is_lazy(self):
+        """Test that CSV rows are read one at a time"""
+
+        # Arrange
+        with patch("builtins.open", mock_open(read_data="1,2\n3,x\n")):
 
             # Apply
-            app.calculate_and_print_results(mock_input, True)
+            rows = app.iter_csv_integer_lists(Path("test.csv"))
 
             # Assert
-            self.assertEqual(mock_print.call_count, 2)
-            mock_print.assert_called_with(
-                f"There is no finite solution for units {mock_input[1]}."
-            )
+            self.assertEqual(next(rows), [1, 2])
+            row = next(rows)
+            self.assertIsInstance(row, app.MalformedRow)
+            self.assertEqual(row.line, "3,x")
+            self.assertTrue(row.error.startswith("ValueError: "))
+
+    def test_malformed_csv_row_does_not_stop_batch(self):
+        """Test that a bad CSV line gets an error line and later rows still solve"""
+
+        # Arrange
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                with patch("builtins.open", mock_open(read_data="3,5\n3,x\n6,9,20\n")):
+                    rows = app.iter_csv_integer_lists(Path("test.csv"))
+                    output = io.StringIO()
+
+                    # Apply
+                    app.calculate_and_print_results(
+                        rows, False, workers=workers, output=output
+                    )
+
+                # Assert
+                lines = output.getvalue().splitlines()
+                self.assertEqual(lines[0], "[3, 5] -> 7")
+                self.assertTrue(lines[1].startswith("3,x -> error: ValueError: "))
+                self.assertEqual(lines[2], "[6, 9, 20] -> 43")
+
+    def test_parse_stream_line(self):
+        """Test JSON and CSV stdin rows"""
+
+        # Arrange
+        test_cases = [
+            ('{"id": "a", "units": [3, 5]}', ("a", [3, 5], None)),
+            ("[6, 9, 20]", (4, [6, 9, 20], None)),
+            ("3,5,7\n", (4, [3, 5, 7], None)),
+            ('{"units": [3, 5]}', (4, [3, 5], None)),
+        ]
+
+        for line, expected in test_cases:
+            with self.subTest(line=line):
+
+                # Apply / Assert
+                self.assertEqual(app.parse_stream_line(line, 4), expected)
+
+        for line in ['{"id": 1}', '{"id": 2, "units": "3,5"}', "{", "3;5"]:
+            with self.subTest(line=line):
+                row_id, numbers, error = app.parse_stream_line(line, 4)
+                self.assertIsNone(numbers)
+                self.assertRegex(error, r"^(ValueError|JSONDecodeError): ")
+
+        for line in ['{"units": ["x"]}', '{"units": [-4]}', "[true, 3]"]:
+            with self.subTest(line=line):
+                row_id, numbers, error = app.parse_stream_line(line, 4)
+                self.assertIsNone(numbers)
+                self.assertRegex(error, r"^(TypeError|ValueError): ")
+
+    def test_stream_json_results(self):
+        """Test one JSON result line per stdin row, in order, with row ids"""
+
+        # Arrange
+        input_stream = io.StringIO(
+            '{"id": "x", "units": [6, 9, 20]}\n\n3,5\nbad\n[2.5, 3]\n'
+        )
+        output = io.StringIO()
+
+        # Apply
+        app.stream_json_results(input_stream, output)
+
+        # Assert
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([record["id"] for record in records], ["x", 3, 4, 5])
+        self.assertEqual(
+            records[:2],
+            [
+                {"id": "x", "units": [6, 9, 20], "result": 43, "error": None},
+                {"id": 3, "units": [3, 5], "result": 7, "error": None},
+            ],
+        )
+        self.assertIsNone(records[2]["units"])
+        self.assertTrue(records[2]["error"].startswith("ValueError"))
+        self.assertTrue(records[3]["error"].startswith("TypeError"))
+
+    @patch("app.ROW_CHUNK_SIZE", 2)
+    def test_stream_json_results_workers(self):
+        """Test that pooled stdin rows keep their ids"""
+
+        # Arrange
+        input_stream = io.StringIO("3,5\nbad\n4,6\n6,9,20\n3,4\n")
+        output = io.StringIO()
+
+        # Apply
+        app.stream_json_results(input_stream, output, workers=2)
+
+        # Assert
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([record["id"] for record in records], [1, 2, 3, 4, 5])
+        self.assertEqual(
+            [record["result"] for record in records], [7, None, None, 43, 5]
+        )
+
+    def test_iter_results_submits_when_input_idle(self):
+        """Test that pooled rows are solved without waiting for a full chunk"""
+
+        # Arrange
+        pulled = []
+
+        def rows():
+            for numbers in ([3, 5], [6, 9, 20]):
+                pulled.append(numbers)
+                yield numbers
+
+        # Apply
+        results = app.iter_results(rows(), workers=2, input_idle=lambda: True)
+
+        # Assert
+        self.assertEqual(next(results), ([3, 5], 7, None))
+        self.assertEqual(pulled, [[3, 5]])
+        self.assertEqual(list(results), [([6, 9, 20], 43, None)])
+
+    @patch("app.StreamLineReader.has_pending")
+    def test_iter_stream_rows_flushes_when_idle(self, mock_has_pending):
+        """Test that output is flushed before waiting for more input"""
+
+        # Arrange
+        mock_has_pending.side_effect = [True, False, False]
+        reader = app.StreamLineReader(io.StringIO("3,5\n3,4\n"))
+        on_idle = Mock()
+
+        # Apply
+        rows = list(app.iter_stream_rows(reader, on_idle))
+
+        # Assert
+        self.assertEqual([numbers for _, numbers, _ in rows], [[3, 5], [3, 4]])
+        self.assertEqual(on_idle.call_count, 2)
+
+    def test_stream_line_reader_open_pipe(self):
+        """Test that lines read ahead from an open pipe count as pending"""
+
+        # Arrange
+        read_fd, write_fd = os.pipe()
+        stream = open(read_fd, mode="r", encoding="utf-8")
+        self.addCleanup(stream.close)
+        os.write(write_fd, "3,5\n6,9,20\n3,4\n".encode())
+        reader = app.StreamLineReader(stream)
+
+        # Apply
+        rows = app.iter_stream_rows(reader)
+        chunk = app._read_chunk(rows, lambda: not reader.has_pending())
+
+        # Assert
+        self.assertEqual(
+            [numbers for _, numbers, _ in chunk], [[3, 5], [6, 9, 20], [3, 4]]
+        )
+        self.assertFalse(reader.has_pending())
+        os.write(write_fd, "4,7".encode())
+        self.assertTrue(reader.has_pending())
+        os.close(write_fd)
+        self.assertEqual(reader.readline(), "4,7")
+        self.assertEqual(reader.readline(), "")
+
+    def test_format_order_result(self):
+        """Test order check output lines"""
+
+        # Apply
+        short = app.format_order_result(43, False, [6, 9, 20], False)
+        sentence = app.format_order_result(44, True, [6, 9, 20], True)
+
+        # Assert
+        self.assertEqual(short, "43 -> False")
+        self.assertEqual(
+            sentence,
+            "The order volume 44 is perfectly purchasable for units [6, 9, 20].",
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,85 @@
+import random
+import unittest
+from unittest.mock import patch
+
+import frobenius
+from batchplan import BatchPlanner, iter_planned_results
+from dispatch import solve
+from frobenius import np
+
+CORE_UNITS = [101, 113, 127, 139]
+
+
+class TestBatchPlanner(unittest.TestCase):
+    """Test suite for solving batches over a trie of shared unit prefixes."""
+
+    def setUp(self):
+        """Builds a batch of near-identical rows with a few odd ones."""
+        generator = random.Random(23)
+        self.rows = []
+        for _ in range(60):
+            row = CORE_UNITS + generator.sample(
+                range(140, 400), generator.randint(0, 2)
+            )
+            generator.shuffle(row)
+            self.rows.append(row)
+        self.rows += [[6, 9, 20], [4, 6], [3, 0], [7], [3, -5], [], [1, 5]]
+        self.rows.append(list(self.rows[0]))
+
+    def expected(self, numbers):
+        """Solves one row the way calculate_and_print_results would."""
+        try:
+            return (solve(numbers).value, None)
+        except Exception as error:
+            return (None, f"{type(error).__name__}: {error}")
+
+    def test_matches_solver(self):
+        """Test every engine, with and without a binding memory limit."""
+        engines = ["python", "dijkstra", "auto"] + (["numpy"] if np is not None else [])
+        expected = [self.expected(numbers) for numbers in self.rows]
+        for engine in engines:
+            for memory_limit in [1 << 30, 2000, 0]:
+                with self.subTest(engine=engine, memory_limit=memory_limit):
+                    planner = BatchPlanner(engine, memory_limit)
+                    self.assertEqual(planner.solve_batch(self.rows), expected)
+                    self.assertEqual(planner._held_bytes, 0)
+
+    def test_memory_limit_evicts(self):
+        """Test that a tight limit gives up parent tables instead of copying."""
+        roomy = BatchPlanner(memory_limit=1 << 30)
+        roomy.solve_batch(self.rows)
+        self.assertEqual(roomy.evictions, 0)
+
+        tight = BatchPlanner(memory_limit=0)
+        tight.solve_batch(self.rows)
+        self.assertGreater(tight.evictions, 0)
+
+    def test_shared_prefix_built_once(self):
+        """Test that rows sharing a prefix pay for its passes only once."""
+        rows = [CORE_UNITS + [extra] for extra in range(140, 150)]
+        rows += [list(CORE_UNITS), list(reversed(CORE_UNITS))]
+        with patch(
+            "frobenius.round_robin_pass", wraps=frobenius.round_robin_pass
+        ) as apply:
+            results = BatchPlanner().solve_batch(rows)
+        # Three passes for the core units, then one per extra unit
+        self.assertEqual(apply.call_count, 3 + 10)
+        self.assertEqual(results, [(solve(row).value, None) for row in rows])
+
+    def test_iter_planned_results_keeps_order(self):
+        """Test that results come back in input order across batches."""
+        results = list(iter_planned_results(iter(self.rows), batch_rows=7))
+        self.assertEqual([numbers for numbers, _, _ in results], self.rows)
+        self.assertEqual(
+            [tuple(result) for _, *result in results],
+            [self.expected(numbers) for numbers in self.rows],
+        )
+
+    def test_unknown_engine(self):
+        """Test that an unknown engine is rejected up front."""
+        with self.assertRaises(ValueError):
+            BatchPlanner("fortran")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import math
+import tempfile
+import unittest
+from pathlib import Path
+
+from bench import (
+    FAMILIES,
+    compare_to_baseline,
+    format_crossover_table,
+    generate_crossover_cases,
+    generate_family,
+    load_csv_cases,
+    percentile,
+    run_benchmarks,
+    run_crossover,
+)
+
+
+class TestBench(unittest.TestCase):
+    """Test suite for the benchmark harness."""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        samples = [5.0, 1.0, 4.0, 2.0, 3.0]
+        self.assertEqual(percentile(samples, 0.5), 3.0)
+        self.assertEqual(percentile(samples, 0.95), 5.0)
+        self.assertEqual(percentile([7.0], 0.95), 7.0)
+
+    def test_families_are_reproducible(self):
+        """Test generated cases are seeded, sorted and coprime."""
+        for family in FAMILIES:
+            with self.subTest(family=family):
+                cases = generate_family(family, seed=3)
+                self.assertEqual(cases, generate_family(family, seed=3))
+                for units in cases.values():
+                    self.assertEqual(units, sorted(units))
+                    self.assertEqual(math.gcd(*units), 1)
+
+        with self.assertRaises(ValueError):
+            generate_family("unknown", seed=0)
+
+    def test_load_csv_cases(self):
+        """Test CSV cases are named by line number."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "cases.csv"
+            path.write_text("3,5\n\n6,9,20\n")
+            self.assertEqual(
+                load_csv_cases(path), {"csv:01": [3, 5], "csv:03": [6, 9, 20]}
+            )
+
+    def test_run_benchmarks(self):
+        """Test the report holds results, timings and peak memory."""
+        report = run_benchmarks({"mcnugget": [6, 9, 20]}, repeats=3)
+        case = report["cases"]["mcnugget"]
+        self.assertEqual(case["result"], 43)
+        self.assertEqual(len(case["samples_s"]), 3)
+        self.assertLessEqual(case["median_s"], case["p95_s"])
+        self.assertGreater(case["peak_bytes"], 0)
+
+        report = run_benchmarks({"mcnugget": [6, 9, 20]}, repeats=1, use_dispatch=True)
+        self.assertEqual(report["cases"]["mcnugget"]["result"], 43)
+
+        report = run_benchmarks({"mcnugget": [6, 9, 20]}, repeats=1, legacy=True)
+        self.assertEqual(report["meta"]["solver"], "legacy")
+        self.assertEqual(report["cases"]["mcnugget"]["result"], 43)
+
+    def test_crossover(self):
+        """Test the crossover grid times every engine and names a winner."""
+        cases = generate_crossover_cases(
+            seed=1, first_units=[20, 50], unit_counts=[3, 5]
+        )
+        self.assertEqual(cases, generate_crossover_cases(1, [20, 50], [3, 5]))
+        self.assertEqual(len(cases), 4)
+        for units in cases.values():
+            self.assertEqual(math.gcd(*units), 1)
+
+        report = run_crossover(cases, repeats=1)
+        for case in report["cases"].values():
+            self.assertEqual(set(case["median_s"]), set(report["meta"]["engines"]))
+            self.assertIn(case["fastest"], report["meta"]["engines"])
+            self.assertIn(case["selected"], report["meta"]["engines"])
+
+        lines = format_crossover_table(report)
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[1].lstrip().startswith("20 "))
+
+    def test_compare_to_baseline(self):
+        """Test only slowdowns beyond the threshold are regressions."""
+        baseline = {"cases": {"a": {"median_s": 1.0}, "b": {"median_s": 1.0}}}
+        report = {
+            "cases": {
+                "a": {"median_s": 1.05},
+                "b": {"median_s": 1.5},
+                "new": {"median_s": 9.0},
+            }
+        }
+        regressions = compare_to_baseline(report, baseline, threshold=0.1)
+        self.assertEqual([regression["name"] for regression in regressions], ["b"])
+        self.assertAlmostEqual(regressions[0]["ratio"], 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
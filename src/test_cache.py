@@ -0,0 +1,88 @@
+import tempfile
+import unittest
+from array import array
+from pathlib import Path
+
+from cache import CacheEntry, ResultCache, cache_key
+from dispatch import solve
+from frobenius import build_residue_table
+
+
+class TestResultCache(unittest.TestCase):
+    """Test suite for the two-level result cache."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "cache.sqlite"
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_cache_key(self):
+        """Test that keys are built from the canonical units."""
+        self.assertEqual(cache_key([3, 5, 7]), "3,5,7")
+
+    def test_memo_only(self):
+        """Test that a cache without a path keeps entries in memory."""
+        cache = ResultCache()
+        self.assertIsNone(cache.get([3, 5]))
+        cache.put([3, 5], 7, "two_units")
+        self.assertEqual(cache.get([3, 5]), CacheEntry(7, "two_units", None))
+
+    def test_persists_across_instances(self):
+        """Test that values and residue tables survive reopening the file."""
+        table = array("q", [0, 16, 17, 8, 9])
+        cache = ResultCache(self.path)
+        cache.put([5, 8, 9], 12, "round_robin", table)
+        cache.put([4, 6], None, "no_solution")
+        cache.close()
+
+        cache = ResultCache(self.path)
+        self.assertEqual(cache.get([5, 8, 9]), CacheEntry(12, "round_robin", table))
+        self.assertEqual(cache.get([4, 6]), CacheEntry(None, "no_solution", None))
+        cache.close()
+
+    def test_evicts_least_recently_used(self):
+        """Test that the SQLite layer stays under its size limit."""
+        cache = ResultCache(self.path, max_bytes=200, memo_max_bytes=0)
+        cache.put([3, 5], 7, "two_units")
+        cache.put([3, 7], 11, "two_units")
+        cache.get([3, 5])
+        cache.put([3, 8], 13, "two_units")
+
+        self.assertIsNone(cache.get([3, 7]))
+        self.assertEqual(cache.get([3, 5]).value, 7)
+        self.assertEqual(cache.get([3, 8]).value, 13)
+        cache.close()
+
+    def test_memo_evicts_by_size(self):
+        """Test that the memo drops the oldest entries past its limit."""
+        cache = ResultCache(memo_max_bytes=100)
+        cache.put([3, 5], 7, "two_units")
+        cache.put([3, 7], 11, "two_units")
+        self.assertIsNone(cache.get([3, 5]))
+        self.assertEqual(cache.get([3, 7]).value, 11)
+
+    def test_memo_skips_oversized_entries(self):
+        """Test that an entry larger than the memo is not kept in memory."""
+        cache = ResultCache(memo_max_bytes=200)
+        cache.put([3, 5], 7, "two_units")
+        cache.put([5, 8, 9], 12, "round_robin", array("q", [0, 16, 17, 8, 9]) * 10)
+        self.assertIsNone(cache.get([5, 8, 9]))
+        self.assertEqual(cache.get([3, 5]).value, 7)
+
+    def test_solve_uses_canonical_key(self):
+        """Test that reordered, padded inputs hit the same cache entry."""
+        cache = ResultCache(self.path)
+        first = solve([10, 11, 9, 5, 8], cache=cache)
+        entry = cache.get([5, 8, 9, 11])
+        self.assertEqual(entry.value, first.value)
+        self.assertEqual(entry.residue_table, build_residue_table([5, 8, 9, 11]))
+
+        cache.put([5, 8, 9, 11], 99, "round_robin", entry.residue_table)
+        self.assertEqual(solve([0, 9, 11, 8, 5, 5], cache=cache).value, 99)
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
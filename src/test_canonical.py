@@ -0,0 +1,61 @@
+import unittest
+from canonical import canonicalize_units
+
+
+class TestCanonicalizeUnits(unittest.TestCase):
+    """Test suite for unit set canonicalization."""
+
+    def test_sorts_units(self):
+        """Test that units come back in ascending order."""
+        self.assertEqual(canonicalize_units([7, 3, 5]).units, [3, 5, 7])
+
+    def test_removes_zeros_and_duplicates(self):
+        """Test that zeros and repeated units are dropped and reported."""
+        result = canonicalize_units([0, 3, 3, 0, 5])
+        self.assertEqual(result.units, [3, 5])
+        self.assertEqual(result.removed, [(0, "zero"), (0, "zero"), (3, "duplicate")])
+
+    def test_removes_multiples(self):
+        """Test that multiples of a smaller unit are dropped."""
+        result = canonicalize_units([3, 5, 10])
+        self.assertEqual(result.units, [3, 5])
+        self.assertEqual(result.removed, [(10, "multiple of 5")])
+
+    def test_removes_representable_units(self):
+        """Test that combinations of smaller units are dropped.
+
+        8 = 3 + 5 and 11 = 3 + 3 + 5.
+        """
+        result = canonicalize_units([3, 5, 8, 11, 7])
+        self.assertEqual(result.units, [3, 5, 7])
+        self.assertEqual(result.removed, [(8, "representable"), (11, "representable")])
+
+    def test_keeps_needed_units(self):
+        """Test that no unit of a minimal set is removed."""
+        numbers = [101, 103, 107, 109, 113, 127, 131, 137]
+        result = canonicalize_units(numbers)
+        self.assertEqual(result.units, numbers)
+        self.assertEqual(result.removed, [])
+
+    def test_empty(self):
+        """Test that an empty list stays empty."""
+        self.assertEqual(canonicalize_units([]), ([], []))
+
+    def test_non_integer(self):
+        """Test that non-integer inputs raise TypeError."""
+        with self.assertRaises(TypeError):
+            canonicalize_units([2.5, 3])
+
+    def test_bool(self):
+        """Test that booleans are not taken as units of 0 or 1."""
+        with self.assertRaises(TypeError):
+            canonicalize_units([True, 3])
+
+    def test_negative(self):
+        """Test that negative inputs raise ValueError."""
+        with self.assertRaises(ValueError):
+            canonicalize_units([-3, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
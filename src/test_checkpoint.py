@@ -0,0 +1,156 @@
+import itertools
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from checkpoint import (
+    CheckpointOptions,
+    PassPosition,
+    checkpoint_path,
+    load_checkpoint,
+    save_checkpoint,
+)
+from frobenius import (
+    build_residue_table,
+    new_residue_table,
+    np,
+    solve_for_frobenius_number,
+)
+
+UNITS = [101, 103, 107, 109, 113, 127, 131, 137]
+
+
+class TestCheckpoint(unittest.TestCase):
+    """Test suite for checkpointed Round Robin solves."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.checkpoint_dir = Path(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_save_and_load(self):
+        """Test that a checkpoint round-trips units, position and table."""
+        path = self.checkpoint_dir / "table.ckpt"
+        residue_table = new_residue_table(5)
+        residue_table[3] = 8
+        save_checkpoint(path, [5, 8, 9], 2, residue_table)
+
+        checkpoint = load_checkpoint(path)
+        self.assertEqual(checkpoint.units, [5, 8, 9])
+        self.assertEqual(checkpoint.next_index, 2)
+        self.assertEqual(checkpoint.residue_table, residue_table)
+        self.assertIsNone(checkpoint.position)
+
+        save_checkpoint(path, [5, 8, 9], 2, residue_table, PassPosition(0, 2, 17))
+        self.assertEqual(load_checkpoint(path).position, PassPosition(0, 2, 17))
+        self.assertIsNone(load_checkpoint(self.checkpoint_dir / "missing.ckpt"))
+
+        path.write_bytes(b"not a checkpoint\n")
+        with self.assertRaises(ValueError):
+            load_checkpoint(path)
+
+    @patch("frobenius.time")
+    def test_deadline_and_resume(self, mock_time):
+        """Test that a solve stopped by its deadline resumes where it left off."""
+        engines = ["python"] + (["numpy"] if np is not None else [])
+        for engine in engines:
+            with self.subTest(engine=engine):
+                # One second passes per pass, the deadline falls before the third
+                mock_time.time.side_effect = itertools.count()
+                mock_time.monotonic.return_value = 0.0
+                options = CheckpointOptions(self.checkpoint_dir, deadline=1.5)
+
+                with self.assertRaises(TimeoutError) as raised:
+                    solve_for_frobenius_number(UNITS, engine=engine, checkpoint=options)
+
+                path = checkpoint_path(self.checkpoint_dir, UNITS)
+                self.assertIn(str(path), str(raised.exception))
+                self.assertEqual(load_checkpoint(path).next_index, 3)
+                self.assertEqual(
+                    load_checkpoint(path).residue_table,
+                    build_residue_table(UNITS[:3]),
+                )
+
+                options = CheckpointOptions(self.checkpoint_dir, resume=True)
+                self.assertEqual(
+                    solve_for_frobenius_number(
+                        UNITS, engine=engine, checkpoint=options
+                    ),
+                    solve_for_frobenius_number(UNITS),
+                )
+                self.assertFalse(path.exists())
+
+    @patch("frobenius.CHECKPOINT_STEPS", 7)
+    @patch("frobenius.time")
+    def test_deadline_mid_pass(self, mock_time):
+        """Test that a pass cut short by its deadline resumes at the same step."""
+        engines = ["python"] + (["numpy"] if np is not None else [])
+        for units in [UNITS, [60, 84, 90, 105, 126, 131]]:
+            for engine in engines:
+                with self.subTest(units=units, engine=engine):
+                    # Every run walks a few segments before its deadline
+                    mock_time.monotonic.return_value = 0.0
+                    options = CheckpointOptions(self.checkpoint_dir, deadline=3.5)
+                    path = checkpoint_path(self.checkpoint_dir, units)
+                    positions = []
+                    while True:
+                        mock_time.time.side_effect = itertools.count()
+                        try:
+                            value = solve_for_frobenius_number(
+                                units, engine=engine, checkpoint=options
+                            )
+                            break
+                        except TimeoutError as error:
+                            self.assertIn(str(path), str(error))
+                            positions.append(load_checkpoint(path).position)
+                            options = options._replace(resume=True)
+
+                    self.assertEqual(value, solve_for_frobenius_number(units))
+                    self.assertIn(None, positions)
+                    self.assertTrue(
+                        any(
+                            position is not None and position.steps
+                            for position in positions
+                        )
+                    )
+                    self.assertFalse(path.exists())
+
+    def test_periodic_snapshots(self):
+        """Test that snapshots are written during the solve."""
+        saved_positions = []
+        with patch(
+            "frobenius.save_checkpoint",
+            side_effect=lambda path, units, next_index, table: saved_positions.append(
+                next_index
+            ),
+        ):
+            options = CheckpointOptions(self.checkpoint_dir, interval=0.0)
+            solve_for_frobenius_number(UNITS, checkpoint=options)
+        self.assertEqual(saved_positions, list(range(2, len(UNITS) + 1)))
+
+    def test_no_progress_is_not_saved(self):
+        """Test that an expired deadline before any pass writes nothing."""
+        options = CheckpointOptions(self.checkpoint_dir, deadline=0.0)
+        with self.assertRaises(TimeoutError) as raised:
+            solve_for_frobenius_number(UNITS, checkpoint=options)
+        self.assertEqual(list(self.checkpoint_dir.iterdir()), [])
+        self.assertNotIn("saved to", str(raised.exception))
+
+    def test_mismatched_checkpoint(self):
+        """Test that a checkpoint written for other units is rejected."""
+        save_checkpoint(
+            checkpoint_path(self.checkpoint_dir, UNITS),
+            [5, 8, 9],
+            2,
+            new_residue_table(5),
+        )
+        options = CheckpointOptions(self.checkpoint_dir, resume=True)
+        with self.assertRaises(ValueError):
+            solve_for_frobenius_number(UNITS, checkpoint=options)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from closed_forms import (
+    arithmetic_sequence_step,
+    frobenius_arithmetic_sequence,
+    frobenius_three_units,
+    frobenius_two_units,
+)
+from frobenius import solve_for_frobenius_number
+
+
+class TestClosedForms(unittest.TestCase):
+    """Test suite for the closed-form Frobenius number methods."""
+
+    def test_two_units(self):
+        """Test Sylvester's formula on known pairs."""
+        self.assertEqual(frobenius_two_units(2, 3), 1)
+        self.assertEqual(frobenius_two_units(3, 4), 5)
+        self.assertEqual(frobenius_two_units(5, 14), 51)
+
+    def test_arithmetic_sequence_step(self):
+        """Test arithmetic sequence detection."""
+        self.assertEqual(arithmetic_sequence_step([9901, 10000, 10099]), 99)
+        self.assertIsNone(arithmetic_sequence_step([6, 9, 20]))
+
+    def test_arithmetic_sequence(self):
+        """Test Roberts' formula on the [9901, 10000, 10099] case."""
+        self.assertEqual(frobenius_arithmetic_sequence(9901, 99, 3), 49980149)
+        self.assertEqual(frobenius_arithmetic_sequence(3, 2, 3), 4)
+
+    def test_three_units(self):
+        """Test Rødseth's algorithm on known triples."""
+        self.assertEqual(frobenius_three_units(6, 9, 20), 43)
+        self.assertEqual(frobenius_three_units(5, 8, 9), 12)
+        self.assertEqual(frobenius_three_units(10, 14, 33), 79)
+
+    def test_three_units_shared_factors(self):
+        """Test Johnson's reduction when every pair shares a factor."""
+        self.assertEqual(frobenius_three_units(6, 10, 15), 29)
+
+    def test_three_units_matches_round_robin(self):
+        """Test Rødseth's algorithm against Round Robin over a grid of triples."""
+        for a1 in range(2, 16):
+            for a2 in range(a1 + 1, 24):
+                for a3 in range(a2 + 1, 30, 3):
+                    numbers = [a1, a2, a3]
+                    expected = solve_for_frobenius_number(numbers)
+                    if expected is None:
+                        continue
+                    with self.subTest(numbers=numbers):
+                        self.assertEqual(frobenius_three_units(*numbers), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
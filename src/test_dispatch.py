@@ -0,0 +1,108 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from cache import ResultCache
+from dispatch import Solution, select_method, solve
+from profiling import SolveProfile
+
+
+class TestDispatch(unittest.TestCase):
+    """Test suite for the method dispatcher."""
+
+    def test_select_method(self):
+        """Test that each input shape goes to the expected method."""
+        cases = {
+            (1,): "single_unit",
+            (3, 4): "two_units",
+            (9901, 10000, 10099): "arithmetic_sequence",
+            (6, 9, 20): "three_units",
+            (5, 8, 9, 12): "round_robin",
+        }
+        for units, expected in cases.items():
+            with self.subTest(units=units):
+                self.assertEqual(select_method(list(units)), expected)
+
+    def test_solve(self):
+        """Test dispatched results and recorded methods."""
+        cases = [
+            ([2, 3], Solution(1, "two_units", [])),
+            ([9901, 10000, 10099], Solution(49980149, "arithmetic_sequence", [])),
+            ([6, 9, 20], Solution(43, "three_units", [])),
+            ([3, 5, 10], Solution(7, "two_units", [(10, "multiple of 5")])),
+            ([1, 5], Solution(-1, "single_unit", [(5, "multiple of 1")])),
+            ([4, 6], Solution(None, "no_solution", [])),
+            ([0, 0, 0, 0], Solution(None, "no_solution", [(0, "zero")] * 4)),
+            ([5], Solution(None, "no_solution", [])),
+        ]
+        for numbers, expected in cases:
+            with self.subTest(numbers=numbers):
+                self.assertEqual(solve(numbers), expected)
+
+    def test_solve_round_robin(self):
+        """Test that inputs without a closed form fall back to Round Robin."""
+        numbers = [
+            101,
+            103,
+            107,
+            109,
+            113,
+            127,
+            131,
+            137,
+            139,
+            149,
+            151,
+            157,
+            163,
+            167,
+            173,
+        ]
+        self.assertEqual(solve(numbers), Solution(402, "round_robin", []))
+
+    def test_solve_units_above_int64(self):
+        """Test that every path gives exact results for very large units."""
+        numbers = [1000, 10**17 + 1, 10**17 + 3, 10**17 + 7]
+        with tempfile.TemporaryDirectory() as table_dir:
+            for options in [
+                {},
+                {"workers": 2},
+                {"table_dir": Path(table_dir)},
+                {"profile": SolveProfile()},
+                {"profile": SolveProfile(), "table_dir": Path(table_dir)},
+                {"cache": ResultCache()},
+            ]:
+                with self.subTest(options=list(options)):
+                    self.assertEqual(
+                        solve(numbers, **options).value, 14499999999999999999
+                    )
+
+    def test_solve_profile(self):
+        """Test that the profile records the method, phases and cache hits."""
+        cache = ResultCache()
+        profile = SolveProfile()
+        solve([0, 6, 9, 20], cache=cache, profile=profile)
+        self.assertEqual(profile.details["method"], "three_units")
+        self.assertEqual(profile.details["units"], [6, 9, 20])
+        self.assertFalse(profile.details["cache_hit"])
+        self.assertIn("closed_form", profile.phases)
+
+        profile = SolveProfile()
+        self.assertEqual(solve([20, 9, 6], cache=cache, profile=profile).value, 43)
+        self.assertTrue(profile.details["cache_hit"])
+        self.assertNotIn("closed_form", profile.phases)
+
+        profile = SolveProfile()
+        solve([12, 18, 20, 27], profile=profile)
+        self.assertEqual(profile.details["method"], "round_robin")
+        self.assertEqual([record["unit"] for record in profile.passes], [18, 20, 27])
+        self.assertIn("table_max", profile.phases)
+
+    def test_unknown_engine(self):
+        """Test that an unknown engine raises ValueError."""
+        with self.assertRaises(ValueError):
+            solve([3, 5], engine="fortran")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import itertools
+import unittest
+
+from dispatch import solve
+from estimator import (
+    brauer_bound,
+    davison_lower_bound,
+    erdos_graham_bound,
+    estimate,
+    frobenius_bounds,
+    schur_bound,
+    volume_lower_bound,
+)
+from frobenius import estimate_engine_cost
+
+LOWER_BOUNDS = ("trivial", "volume", "davison")
+UPPER_BOUNDS = ("brauer", "schur", "erdos_graham")
+
+
+class TestEstimator(unittest.TestCase):
+    """Test suite for Frobenius number bounds and cost estimates."""
+
+    def test_bounds_hold(self):
+        """Test every bound against exact values of small coprime sets."""
+        for count in (2, 3, 4, 5):
+            for units in itertools.combinations(range(2, 23, 3), count):
+                value = solve(list(units)).value
+                if value is None:
+                    continue
+                with self.subTest(units=units):
+                    bounds = frobenius_bounds(list(units))
+                    for name in LOWER_BOUNDS:
+                        self.assertLessEqual(bounds.get(name, value), value, name)
+                    for name in UPPER_BOUNDS:
+                        self.assertGreaterEqual(bounds[name], value, name)
+
+    def test_two_units_exact(self):
+        """Test that Brauer, Schur and the volume bound are exact for k = 2."""
+        for bound in (brauer_bound, schur_bound, volume_lower_bound):
+            with self.subTest(bound=bound.__name__):
+                self.assertEqual(bound([101, 137]), 101 * 137 - 101 - 137)
+
+    def test_known_values(self):
+        """Test the bounds of [6, 9, 20] (g = 43)."""
+        self.assertEqual(brauer_bound([6, 9, 20]), 6 * 9 // 3 + 20 * 3 - 35)
+        self.assertEqual(schur_bound([6, 9, 20]), 5 * 19 - 1)
+        self.assertEqual(erdos_graham_bound([6, 9, 20]), 2 * 9 * 6 - 20)
+        # ⌈√3240⌉ = 57
+        self.assertEqual(davison_lower_bound([6, 9, 20]), 57 - 35)
+
+    def test_estimate_round_robin(self):
+        """Test the bounds and cost of a set that needs a Round Robin table."""
+        units = [1000003, 1000033, 1500007, 1700021]
+        row_estimate = estimate(units[::-1] + [0])
+        self.assertEqual(row_estimate.method, "round_robin")
+        self.assertEqual(row_estimate.engine, "python")
+        self.assertEqual(row_estimate.seconds, estimate_engine_cost(units, "python"))
+        self.assertEqual(row_estimate.table_bytes, 8 * 1000003)
+        self.assertLess(row_estimate.lower, row_estimate.upper)
+        self.assertEqual(estimate(units, "dijkstra").engine, "dijkstra")
+
+    def test_estimate_closed_forms(self):
+        """Test that closed forms report their exact value and no cost."""
+        self.assertEqual(estimate([6, 9, 20]), (43, 43, "three_units", None, 0.0, 0))
+        self.assertEqual(estimate([3, 5]).lower, 7)
+        self.assertEqual(estimate([4, 6]).method, "no_solution")
+        self.assertIsNone(estimate([5]).upper)
+
+    def test_estimate_without_closed_forms(self):
+        """Test that skipping closed forms bounds three units with Davison's bound."""
+        row_estimate = estimate([6, 9, 20], closed_forms=False)
+        self.assertEqual(row_estimate.method, "round_robin")
+        self.assertEqual(row_estimate.lower, davison_lower_bound([6, 9, 20]))
+        self.assertLessEqual(row_estimate.lower, 43)
+        self.assertGreaterEqual(row_estimate.upper, 43)
+        self.assertEqual(estimate([1, 7], closed_forms=False).method, "single_unit")
+        self.assertEqual(estimate([4, 6], closed_forms=False).method, "no_solution")
+
+
+if __name__ == "__main__":
+    unittest.main()
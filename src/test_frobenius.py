@@ -1,6 +1,30 @@
 import unittest
+from unittest.mock import patch
 from typing import Optional, List
-from frobenius import solve_for_frobenius_number
+from frobenius import (
+    ENGINES,
+    RESIDUE_SENTINEL,
+    FrobeniusSolver,
+    build_residue_table,
+    build_witness_table,
+    decompose_from_witnesses,
+    dijkstra_residue_table,
+    estimate_engine_cost,
+    extend_residue_table,
+    gap_sum_from_table,
+    genus_from_table,
+    iter_gaps,
+    select_engine,
+    np,
+    new_residue_table,
+    round_robin_pass,
+    sieve_residue_table,
+    solve_for_frobenius_number,
+    solve_for_gap_sum,
+    solve_for_genus,
+)
+from dispatch import solve
+from profiling import SolveProfile
 
 
 class TestFrobeniusNumber(unittest.TestCase):
@@ -67,6 +91,15 @@ class TestFrobeniusNumber(unittest.TestCase):
         """Test that repeated number don't affect result."""
         self.assertEqual(solve_for_frobenius_number([3, 3, 5, 7]), 4)
 
+    def test_redundant_units(self):
+        """Test that units built from smaller units don't affect result."""
+        self.assertEqual(solve_for_frobenius_number([3, 5, 10]), 7)
+        self.assertEqual(solve_for_frobenius_number([5, 8, 13, 16]), 27)
+
+    def test_unit_of_one(self):
+        """Test that a unit of one makes every volume purchasable."""
+        self.assertEqual(solve_for_frobenius_number([1, 5]), -1)
+
     def test_non_integer(self):
         """Test that non-integer inputs raise TypeError."""
         with self.assertRaises(TypeError):
@@ -146,5 +179,436 @@ class TestFrobeniusNumber(unittest.TestCase):
         )
 
 
+class TestResidueTableKernel(unittest.TestCase):
+    """Test suite for the array-backed residue table kernel."""
+
+    def test_new_residue_table(self):
+        """Test that the initial table only reaches residue 0."""
+        table = new_residue_table(5)
+        self.assertEqual(list(table), [0] + [RESIDUE_SENTINEL] * 4)
+        self.assertEqual(table.typecode, "q")
+
+    def test_round_robin_pass(self):
+        """Test the [5, 8, 9] walkthrough from the solver docstring."""
+        table = new_residue_table(5)
+        round_robin_pass(table, 5, 8, 1)
+        self.assertEqual(list(table), [0, 16, 32, 8, 24])
+        round_robin_pass(table, 5, 9, 1)
+        self.assertEqual(list(table), [0, 16, 17, 8, 9])
+
+    def test_extend_residue_table(self):
+        """Test that extending copies by default and skips redundant units."""
+        tables = [new_residue_table(5)]
+        if np is not None:
+            tables.append(np.asarray(new_residue_table(5), dtype=np.int64))
+        for table in tables:
+            with self.subTest(kind=type(table).__name__):
+                extended = extend_residue_table(table, 5, 8)
+                self.assertEqual(list(extended), [0, 16, 32, 8, 24])
+                self.assertEqual(list(table), [0] + [RESIDUE_SENTINEL] * 4)
+                self.assertIs(extend_residue_table(extended, 5, 16), extended)
+                self.assertIs(
+                    extend_residue_table(extended, 5, 9, in_place=True), extended
+                )
+                self.assertEqual(list(extended), [0, 16, 17, 8, 9])
+
+    def test_matches_legacy_kernel(self):
+        """Test that the array kernel and legacy kernel agree."""
+        cases = [
+            [2, 3],
+            [6, 9, 20],
+            [7, 5, 3],
+            [3, 0, 5, 7],
+            [4, 6],
+            [12, 18, 20, 27],
+            [10, 14, 30],
+            [101, 103, 107, 109, 113, 127, 131, 137, 139, 149],
+        ]
+        for numbers in cases:
+            with self.subTest(numbers=numbers):
+                self.assertEqual(
+                    solve_for_frobenius_number(numbers),
+                    solve_for_frobenius_number(numbers, legacy=True),
+                )
+
+    def test_units_above_int64(self):
+        """Test units whose table entries do not fit in int64."""
+        cases = [
+            [2, 10**19 + 1],
+            [1000, 10**17 + 1, 10**17 + 3, 10**17 + 7],
+            [6, 9 * 2**61, 9 * 2**61 + 1, 9 * 2**61 + 2],
+        ]
+        for numbers in cases:
+            expected = solve_for_frobenius_number(numbers, legacy=True)
+            for engine in ENGINES:
+                with self.subTest(numbers=numbers, engine=engine):
+                    self.assertEqual(
+                        solve_for_frobenius_number(numbers, engine=engine), expected
+                    )
+        self.assertEqual(solve_for_frobenius_number(cases[1]), 14499999999999999999)
+
+    def test_extend_widens_table(self):
+        """Test that a unit too large for int64 entries widens the table."""
+        table = extend_residue_table(new_residue_table(2), 2, 10**19 + 1)
+        self.assertEqual(table, [0, 10**19 + 1])
+        solver = FrobeniusSolver([3, 2**63])
+        self.assertEqual(solver.frobenius_number, 2**64 - 3)
+
+    def test_unknown_engine(self):
+        """Test that an unknown engine raises ValueError."""
+        with self.assertRaises(ValueError):
+            solve_for_frobenius_number([3, 5], engine="fortran")
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestNumpyEngine(unittest.TestCase):
+    """Test suite for the NumPy Round Robin engine."""
+
+    def test_matches_python_engine(self):
+        """Test that the numpy and python engines agree."""
+        cases = [
+            [2, 3],
+            [3, 4],
+            [4, 6],
+            [6, 9, 20],
+            [7, 5, 3],
+            [0, 3, 5, 7],
+            [3, 3, 5, 7],
+            [12, 18, 20, 27],
+            [9901, 10000, 10099],
+            [101, 103, 107, 109, 113, 127, 131, 137, 139, 149, 151, 157],
+        ]
+        for numbers in cases:
+            with self.subTest(numbers=numbers):
+                self.assertEqual(
+                    solve_for_frobenius_number(numbers, engine="numpy"),
+                    solve_for_frobenius_number(numbers),
+                )
+
+    def test_large_units_do_not_overflow(self):
+        """Test units whose a₁·aᵢ ramp does not fit in int64."""
+        cases = [
+            [100003, 10**14 + 1, 10**14 + 7, 10**14 + 13],
+            [3000017, 4 * 10**12 + 1, 4 * 10**12 + 7, 4 * 10**12 + 19],
+        ]
+        for units in cases:
+            with self.subTest(units=units):
+                expected = solve_for_frobenius_number(units, engine="dijkstra")
+                self.assertEqual(
+                    solve_for_frobenius_number(units, engine="numpy"), expected
+                )
+                self.assertNotEqual(select_engine(units), "numpy")
+                self.assertEqual(solve(units, engine="auto").value, expected)
+
+
+class TestDijkstraEngine(unittest.TestCase):
+    """Test suite for the shortest-path engine and engine selection."""
+
+    def test_matches_round_robin_table(self):
+        """Test that Dijkstra builds the same table as Round Robin."""
+        cases = [
+            [5, 8, 9],
+            [6, 9, 20],
+            [12, 18, 20, 27],
+            [20, 22, 25, 33, 34],
+            [101, 103, 107, 109, 113, 127, 131, 137, 139, 149, 151, 157],
+        ]
+        for units in cases:
+            with self.subTest(units=units):
+                self.assertEqual(
+                    dijkstra_residue_table(units), build_residue_table(units)
+                )
+
+    def test_engines_agree(self):
+        """Test that every engine gives the same Frobenius number."""
+        for engine in ("dijkstra", "sieve", "auto"):
+            with self.subTest(engine=engine):
+                self.assertEqual(
+                    solve_for_frobenius_number([6, 9, 20, 21], engine=engine), 43
+                )
+                self.assertIsNone(solve_for_frobenius_number([4, 6, 8], engine=engine))
+
+    def test_estimate_engine_cost(self):
+        """Test that estimated costs grow with a₁ and k."""
+        for engine in ("python", "numpy", "dijkstra"):
+            with self.subTest(engine=engine):
+                small = estimate_engine_cost([1000, 1001, 1003], engine)
+                self.assertLess(small, estimate_engine_cost([9000, 9001, 9003], engine))
+                self.assertLess(
+                    small, estimate_engine_cost([1000, 1001, 1003, 1007], engine)
+                )
+
+    @patch("frobenius.np", None)
+    def test_select_engine_without_numpy(self):
+        """Test the choice between Round Robin and Dijkstra without numpy."""
+        self.assertEqual(select_engine([101, 103]), "python")
+        self.assertEqual(
+            select_engine([100000] + list(range(100001, 100041))), "dijkstra"
+        )
+
+
+class TestSieveEngine(unittest.TestCase):
+    """Test suite for the bitset sieve engine."""
+
+    def test_matches_round_robin_table(self):
+        """Test that the sieve builds the same table as Round Robin."""
+        cases = [
+            [1],
+            [2, 3],
+            [5, 8, 9],
+            [6, 9, 20],
+            [12, 18, 20, 27],
+            [20, 22, 25, 33, 34],
+            [101, 103, 107, 109, 113, 127, 131, 137, 139, 149, 151, 157],
+            [997, 1009, 5003],
+        ]
+        for units in cases:
+            with self.subTest(units=units):
+                self.assertEqual(sieve_residue_table(units), build_residue_table(units))
+
+    def test_window_grows(self):
+        """Test a Frobenius number far beyond the initial window."""
+        units = [1000, 1001]
+        self.assertEqual(
+            solve_for_frobenius_number(units, engine="sieve"), 1000 * 1001 - 2001
+        )
+
+    @patch("frobenius.SIEVE_MAX_WINDOW_BITS", 100)
+    def test_window_cap(self):
+        """Test that windows past the cap fall back to a pass-based engine."""
+        # Grows 42 -> 84 -> 168 bits before it would cover F + a₁ = 99
+        self.assertEqual(
+            list(sieve_residue_table([10, 11])), list(build_residue_table([10, 11]))
+        )
+
+        units = [1000, 1001]
+        with patch("frobenius._first_run") as first_run:
+            self.assertEqual(
+                solve_for_frobenius_number(units, engine="sieve"), 1000 * 1001 - 2001
+            )
+        first_run.assert_not_called()
+        self.assertNotEqual(select_engine(units), "sieve")
+
+    def test_estimate_engine_cost(self):
+        """Test that the estimated cost grows with a₁ and with clustering."""
+        small = estimate_engine_cost([1000, 1001, 1003], "sieve")
+        self.assertLess(small, estimate_engine_cost([9000, 9001, 9003], "sieve"))
+        spread = list(range(1000, 1400, 10))
+        clustered = list(range(1000, 1040))
+        self.assertLess(
+            estimate_engine_cost(spread, "sieve"),
+            estimate_engine_cost(clustered, "sieve"),
+        )
+
+    @patch("frobenius.np", None)
+    def test_select_engine(self):
+        """Test that many small units with a small gap region pick the sieve."""
+        self.assertEqual(select_engine(list(range(1000, 1400, 10)) + [1401]), "sieve")
+        self.assertNotEqual(select_engine([10007, 10009, 20011]), "sieve")
+
+
+class TestProfiledBuild(unittest.TestCase):
+    """Test suite for profiled residue table builds."""
+
+    def test_same_table(self):
+        """Test that profiling does not change the table."""
+        engines = ["python", "dijkstra", "sieve"]
+        engines += ["numpy"] if np is not None else []
+        for engine in engines:
+            with self.subTest(engine=engine):
+                units = [12, 18, 20, 27, 30, 31]
+                self.assertEqual(
+                    list(build_residue_table(units, engine, SolveProfile())),
+                    list(build_residue_table(units, engine)),
+                )
+
+    def test_counters(self):
+        """Test pass records and counters for [6, 8, 9, 10]."""
+        engines = ["python"] + (["numpy"] if np is not None else [])
+        for engine in engines:
+            with self.subTest(engine=engine):
+                profile = SolveProfile()
+                self.assertEqual(
+                    solve_for_frobenius_number(
+                        [6, 8, 9, 10], engine=engine, profile=profile
+                    ),
+                    13,
+                )
+
+                # 8 has two cycles mod 6 and the odd one has no reachable
+                # start yet; 10 still lowers n₄ = 8+8 and n₁ = 8+8+9
+                self.assertEqual(
+                    [(record["unit"], record["updates"]) for record in profile.passes],
+                    [(8, 2), (9, 3), (10, 2)],
+                )
+                self.assertEqual(
+                    profile.counters,
+                    {"table_updates": 7, "units_skipped": 0, "unreached_cycles": 1},
+                )
+                self.assertEqual(
+                    set(profile.phases),
+                    {"canonicalize", "gcd", "table_init", "passes", "table_max"},
+                )
+
+    def test_skipped_unit(self):
+        """Test that a unit already reachable is counted as skipped."""
+        profile = SolveProfile()
+        build_residue_table([5, 8, 9, 16, 17], profile=profile)
+        self.assertEqual(profile.counters["units_skipped"], 2)
+        self.assertEqual(len(profile.passes), 2)
+
+
+class TestGaps(unittest.TestCase):
+    """Test suite for the genus, gap sum and gap enumeration."""
+
+    def brute_force_gaps(self, units: list) -> List[int]:
+        """Lists the gaps by marking every representable volume."""
+        limit = solve_for_frobenius_number(units) + 1
+        representable = [True] + [False] * limit
+        for volume in range(1, limit + 1):
+            representable[volume] = any(
+                unit <= volume and representable[volume - unit] for unit in units
+            )
+        return [volume for volume in range(limit) if not representable[volume]]
+
+    def test_docstring_example(self):
+        """Test [5, 8, 9] against its gaps 1-4, 6, 7, 11 and 12."""
+        self.assertEqual(list(iter_gaps([5, 8, 9])), [1, 2, 3, 4, 6, 7, 11, 12])
+        self.assertEqual(solve_for_genus([9, 5, 8]), 8)
+        self.assertEqual(solve_for_gap_sum([5, 8, 9]), 46)
+
+    def test_matches_brute_force(self):
+        """Test every engine against a direct enumeration of the gaps."""
+        engines = ["python", "dijkstra", "sieve"]
+        engines += ["numpy"] if np is not None else []
+        for units in ([3, 5], [6, 9, 20], [12, 18, 20, 27], [23, 29, 31, 37, 41]):
+            gaps = self.brute_force_gaps(units)
+            for engine in engines:
+                with self.subTest(units=units, engine=engine):
+                    self.assertEqual(list(iter_gaps(units, engine)), gaps)
+                    self.assertEqual(solve_for_genus(units, engine), len(gaps))
+                    self.assertEqual(solve_for_gap_sum(units, engine), sum(gaps))
+
+    def test_two_units(self):
+        """Test the two-unit closed forms g = (a-1)(b-1)/2."""
+        a, b = 101, 137
+        residue_table = build_residue_table([a, b])
+        self.assertEqual(genus_from_table(residue_table, a), (a - 1) * (b - 1) // 2)
+        self.assertEqual(
+            gap_sum_from_table(residue_table, a),
+            (a - 1) * (b - 1) * (2 * a * b - a - b - 1) // 12,
+        )
+
+    def test_no_gaps_and_no_solution(self):
+        """Test a set with a unit of one and sets without a solution."""
+        self.assertEqual(solve_for_genus([1, 7]), 0)
+        self.assertEqual(solve_for_gap_sum([1, 7]), 0)
+        self.assertEqual(list(iter_gaps([1, 7])), [])
+        self.assertIsNone(solve_for_genus([4, 6]))
+        self.assertIsNone(solve_for_gap_sum([5]))
+        self.assertEqual(list(iter_gaps([4, 6])), [])
+
+
+class TestWitnessTable(unittest.TestCase):
+    """Test suite for Round Robin witness tracking."""
+
+    def test_same_table_as_round_robin(self):
+        """Test that tracking witnesses does not change the residue table."""
+        units = [101, 103, 107, 109, 113, 127]
+        residue_table, _ = build_witness_table(units)
+        self.assertEqual(residue_table, build_residue_table(units))
+
+    def test_decompose(self):
+        """Test decompositions of [5, 8, 9] against the docstring table."""
+        units = [5, 8, 9]
+        residue_table, witness_table = build_witness_table(units)
+        self.assertEqual(
+            decompose_from_witnesses(residue_table, witness_table, units, 17), [0, 1, 1]
+        )
+        self.assertEqual(
+            decompose_from_witnesses(residue_table, witness_table, units, 32), [3, 1, 1]
+        )
+        self.assertIsNone(
+            decompose_from_witnesses(residue_table, witness_table, units, 12)
+        )
+
+    def test_decompose_all_volumes(self):
+        """Test that every purchasable volume decomposes exactly."""
+        units = [12, 18, 20, 27]
+        residue_table, witness_table = build_witness_table(units)
+        for volume in range(300):
+            counts = decompose_from_witnesses(
+                residue_table, witness_table, units, volume
+            )
+            if counts is not None:
+                with self.subTest(volume=volume):
+                    self.assertEqual(sum(c * u for c, u in zip(counts, units)), volume)
+
+    def test_not_coprime(self):
+        """Test that non-coprime units have no witness table."""
+        self.assertIsNone(build_witness_table([4, 6]))
+
+
+class TestFrobeniusSolver(unittest.TestCase):
+    """Test suite for the incremental FrobeniusSolver."""
+
+    def test_add_units(self):
+        """Test the Frobenius number after each added unit."""
+        solver = FrobeniusSolver()
+        self.assertIsNone(solver.frobenius_number)
+        solver.add_unit(6)
+        self.assertIsNone(solver.frobenius_number)
+        solver.add_unit(9)
+        self.assertIsNone(solver.frobenius_number)
+        solver.add_unit(20)
+        self.assertEqual(solver.frobenius_number, 43)
+
+    def test_add_smaller_unit(self):
+        """Test that adding a new smallest unit rebuilds the table."""
+        solver = FrobeniusSolver([8, 9])
+        solver.add_unit(5)
+        self.assertEqual(solver.units, [5, 8, 9])
+        self.assertEqual(list(solver.residue_table), [0, 16, 17, 8, 9])
+        self.assertEqual(solver.frobenius_number, 12)
+
+    def test_remove_units(self):
+        """Test removing a middle unit and the smallest unit."""
+        solver = FrobeniusSolver([5, 8, 9, 12])
+        solver.remove_unit(8)
+        self.assertEqual(
+            solver.frobenius_number, solve_for_frobenius_number([5, 9, 12])
+        )
+        solver.remove_unit(5)
+        self.assertEqual(solver.units, [9, 12])
+        self.assertIsNone(solver.frobenius_number)
+
+    def test_ignores_zeros_and_duplicates(self):
+        """Test that zeros and repeated units leave the set unchanged."""
+        solver = FrobeniusSolver([3, 0, 5, 3])
+        self.assertEqual(solver.units, [3, 5])
+        self.assertEqual(solver.frobenius_number, 7)
+
+    def test_remove_missing_unit(self):
+        """Test that removing an unknown unit raises ValueError."""
+        with self.assertRaises(ValueError):
+            FrobeniusSolver([3, 5]).remove_unit(4)
+
+    def test_matches_solver(self):
+        """Test a sequence of changes against full solves."""
+        solver = FrobeniusSolver()
+        units = []
+        for unit in [101, 103, 107, 97, 109, 113, 127]:
+            solver.add_unit(unit)
+            units.append(unit)
+            if len(units) > 1:
+                self.assertEqual(
+                    solver.frobenius_number, solve_for_frobenius_number(units)
+                )
+        for unit in [107, 97, 127]:
+            solver.remove_unit(unit)
+            units.remove(unit)
+            self.assertEqual(solver.frobenius_number, solve_for_frobenius_number(units))
+
+
 if __name__ == "__main__":
     unittest.main()
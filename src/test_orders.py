@@ -0,0 +1,185 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from orders import (
+    OrderChecker,
+    OrderPlanner,
+    build_package_count_table,
+    check_order_batches,
+    iter_order_volumes,
+    plan_order_batches,
+)
+
+
+class TestOrderChecker(unittest.TestCase):
+    """Test suite for batched order volume checks."""
+
+    def brute_force(self, units, volume):
+        """Checks representability by dynamic programming."""
+        reachable = [True] + [False] * volume
+        for n in range(1, volume + 1):
+            reachable[n] = any(n >= u and reachable[n - u] for u in units)
+        return reachable[volume]
+
+    def test_is_purchasable(self):
+        """Test single volume checks against [6, 9, 20]."""
+        checker = OrderChecker([6, 9, 20])
+        self.assertTrue(checker.is_purchasable(0))
+        self.assertTrue(checker.is_purchasable(44))
+        self.assertFalse(checker.is_purchasable(43))
+        self.assertFalse(checker.is_purchasable(-6))
+
+    def test_check_matches_brute_force(self):
+        """Test batched checks against dynamic programming."""
+        for units in ([6, 9, 20], [5, 8, 9, 12], [4, 6], [10, 15, 35]):
+            checker = OrderChecker(units)
+            volumes = list(range(120))
+            expected = [self.brute_force(units, volume) for volume in volumes]
+            with self.subTest(units=units):
+                self.assertEqual(list(checker.check(volumes)), expected)
+
+    def test_check_without_numpy(self):
+        """Test that checks fall back to plain Python without numpy."""
+        with patch("orders.np", None):
+            checker = OrderChecker([3, 5])
+            self.assertEqual(checker.check([1, 3, 7, 8]), [False, True, False, True])
+
+    def test_check_volumes_beyond_int64(self):
+        """Test that volumes too large for int64 are still checked."""
+        checker = OrderChecker([6, 9, 20])
+        self.assertEqual(
+            [bool(purchasable) for purchasable in checker.check([2**63, 43, 2**70])],
+            [True, False, True],
+        )
+
+    def test_no_units(self):
+        """Test that a set with no positive unit raises ValueError."""
+        with self.assertRaises(ValueError):
+            OrderChecker([0, 0])
+
+    def test_iter_order_volumes(self):
+        """Test that order files are read in batches and validated."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "orders.txt"
+            path.write_text("1\n\n2\n3\n")
+            with patch("orders.ORDER_CHUNK_SIZE", 2):
+                self.assertEqual(list(iter_order_volumes(path)), [[1, 2], [3]])
+
+            path.write_text("1\n-2\n")
+            with self.assertRaises(ValueError):
+                list(iter_order_volumes(path))
+
+    def test_check_order_batches(self):
+        """Test that batch results keep input order."""
+        checker = OrderChecker([3, 5])
+        results = list(check_order_batches(checker, [[7, 8], [9]]))
+        self.assertEqual(results, [(7, False), (8, True), (9, True)])
+
+
+class TestOrderPlanner(unittest.TestCase):
+    """Test suite for package combination planning."""
+
+    def fewest_by_brute_force(self, units, max_volume):
+        """Computes fewest package counts by plain dynamic programming."""
+        counts = [0] + [None] * max_volume
+        for volume in range(1, max_volume + 1):
+            options = [
+                counts[volume - unit] + 1
+                for unit in units
+                if unit <= volume and counts[volume - unit] is not None
+            ]
+            counts[volume] = min(options) if options else None
+        return [-1 if count is None else count for count in counts]
+
+    def test_package_counts(self):
+        """Test fewest package counts against dynamic programming."""
+        for units in ([6, 9, 20], [5, 8, 9, 12], [4, 6], [10, 15, 35]):
+            planner = OrderPlanner(units, 150)
+            expected = self.fewest_by_brute_force(units, 150)
+            with self.subTest(units=units):
+                self.assertEqual(list(planner.package_counts(range(151))), expected)
+
+    def test_package_counts_beyond_int64(self):
+        """Test that volumes too large for int64 get exact package counts.
+
+        2⁶³ + 3 is 51 = 5·9 + 6 above a multiple of 20.
+        """
+        planner = OrderPlanner([6, 9, 20])
+        self.assertEqual(
+            list(planner.package_counts([2**63 + 3, 44, 43])),
+            [(2**63 + 3 - 51) // 20 + 6, 4, -1],
+        )
+
+    def test_package_counts_without_numpy(self):
+        """Test that the count table falls back to plain Python without numpy."""
+        with patch("orders.np", None):
+            counts, last_unit = build_package_count_table([3, 5], 10)
+        self.assertEqual(counts[8], 2)
+        self.assertEqual(last_unit[8], 5)
+
+    def test_keeps_redundant_units(self):
+        """Test that a redundant unit is still used to save packages.
+
+        35 = 10 + 10 + 15, but a single 35 package is fewer packages.
+        """
+        planner = OrderPlanner([10, 15, 35])
+        self.assertEqual(planner.fewest_packages(35), {35: 1})
+
+    def test_decompose(self):
+        """Test that witness decompositions add up to the volume."""
+        planner = OrderPlanner([6, 9, 20])
+        for volume in range(200):
+            combination = planner.decompose(volume)
+            with self.subTest(volume=volume):
+                if planner.is_purchasable(volume):
+                    total = sum(unit * count for unit, count in combination.items())
+                    self.assertEqual(total, volume)
+                else:
+                    self.assertIsNone(combination)
+
+    def test_fewest_packages_grows_table(self):
+        """Test that volumes above max_volume extend the count table."""
+        planner = OrderPlanner([6, 9, 20], 10)
+        self.assertEqual(planner.fewest_packages(44), {6: 1, 9: 2, 20: 1})
+        self.assertGreaterEqual(planner.max_volume, 44)
+        self.assertIsNone(planner.fewest_packages(43))
+
+    def test_package_counts_past_fold_volume(self):
+        """Test that volumes folded by the largest unit keep their counts."""
+        for units in ([6, 9, 20], [4, 6, 15], [7, 11]):
+            planner = OrderPlanner(units, 600)
+            expected = self.fewest_by_brute_force(units, 600)
+            with self.subTest(units=units):
+                self.assertEqual(list(planner.package_counts(range(601))), expected)
+                for volume in range(601):
+                    combination = planner.fewest_packages(volume)
+                    if expected[volume] < 0:
+                        self.assertIsNone(combination)
+                        continue
+                    self.assertEqual(sum(combination.values()), expected[volume])
+                    self.assertEqual(
+                        sum(unit * count for unit, count in combination.items()),
+                        volume,
+                    )
+
+    def test_fewest_packages_far_above_frobenius_number(self):
+        """Test that a huge order does not grow the count table with it."""
+        planner = OrderPlanner([6, 9, 20])
+        results = list(plan_order_batches(planner, [[5000000000]]))
+        self.assertEqual(results, [(5000000000, {20: 250000000})])
+        self.assertLessEqual(len(planner._counts), 9 * 20 + 1)
+        self.assertEqual(
+            planner.fewest_packages(5000000001), {6: 2, 9: 1, 20: 249999999}
+        )
+
+    def test_plan_order_batches(self):
+        """Test that planned batches keep input order."""
+        planner = OrderPlanner([4, 6])
+        results = list(plan_order_batches(planner, [[10, 7], [12]]))
+        self.assertEqual(results, [(10, {4: 1, 6: 1}), (7, None), (12, {6: 2})])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from dispatch import solve
+from frobenius import build_residue_table, np
+from outofcore import create_mapped_table, mapped_round_robin_pass, solve_out_of_core
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestOutOfCore(unittest.TestCase):
+    """Test suite for memory-mapped residue tables."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.table_dir = Path(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_mapped_pass(self):
+        """Test the [5, 8, 9] walkthrough from the solver docstring."""
+        residue_table = create_mapped_table(self.table_dir / "table.bin", 5)
+        mapped_round_robin_pass(residue_table, 5, 8, 1)
+        self.assertEqual(list(residue_table), [0, 16, 32, 8, 24])
+        mapped_round_robin_pass(residue_table, 5, 9, 1)
+        self.assertEqual(list(residue_table), [0, 16, 17, 8, 9])
+
+    @patch("outofcore.TABLE_CHUNK_SIZE", 7)
+    def test_matches_in_memory_table(self):
+        """Test that chunked sweeps match the in-memory Round Robin table."""
+        cases = [
+            [6, 9, 20],
+            [12, 18, 20, 27],
+            [20, 22, 25, 33],
+            [101, 103, 107, 109, 113, 127, 131, 137, 139, 149],
+        ]
+        for units in cases:
+            residue_table = create_mapped_table(self.table_dir / "table.bin", units[0])
+            for unit in units[1:]:
+                mapped_round_robin_pass(
+                    residue_table, units[0], unit, np.gcd(units[0], unit)
+                )
+            with self.subTest(units=units):
+                self.assertEqual(list(residue_table), list(build_residue_table(units)))
+
+    @patch("outofcore.TABLE_CHUNK_SIZE", 16)
+    def test_solve_out_of_core(self):
+        """Test results and that the table file is removed afterwards."""
+        self.assertEqual(solve_out_of_core([6, 9, 20, 21], self.table_dir), 43)
+        self.assertIsNone(solve_out_of_core([4, 6, 8, 10], self.table_dir))
+        self.assertEqual(os.listdir(self.table_dir), [])
+
+    def test_dispatch_with_table_dir(self):
+        """Test that the dispatcher routes Round Robin through the mapped table."""
+        numbers = [101, 103, 107, 109, 113, 127, 131, 137, 139, 149, 151, 157]
+        solution = solve(numbers, table_dir=self.table_dir)
+        self.assertEqual(solution.value, solve(numbers).value)
+        self.assertEqual(solution.method, "round_robin")
+
+
+if __name__ == "__main__":
+    unittest.main()
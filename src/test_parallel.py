@@ -0,0 +1,64 @@
+import unittest
+from multiprocessing import shared_memory
+from unittest.mock import patch
+
+import parallel
+from dispatch import solve
+from frobenius import build_residue_table, np, solve_for_frobenius_number
+from parallel import build_shared_residue_table
+
+# gcds with a₁ = 2310 are 11, 1 and 210
+UNITS = [2310, 2321, 2333, 2520]
+
+
+class TestParallel(unittest.TestCase):
+    """Test suite for Round Robin tables shared across processes."""
+
+    def test_same_table(self):
+        """Test that splitting cycles across workers gives the same table."""
+        engines = ["python", "dijkstra"] + (["numpy"] if np is not None else [])
+        for engine in engines:
+            with self.subTest(engine=engine):
+                residue_table = build_shared_residue_table(UNITS, engine, workers=3)
+                self.assertEqual(list(residue_table), list(build_residue_table(UNITS)))
+
+    def test_not_coprime(self):
+        """Test that non-coprime units have no table."""
+        self.assertIsNone(build_shared_residue_table([6, 9, 15], workers=2))
+
+    def test_single_cycle_passes_stay_local(self):
+        """Test that passes with gcd 1 are not sent to the workers."""
+        with patch("parallel.walk_shared_cycles") as walk:
+            residue_table = build_shared_residue_table([101, 103, 107], workers=2)
+        walk.assert_not_called()
+        self.assertEqual(residue_table, build_residue_table([101, 103, 107]))
+
+    def test_shared_memory_released(self):
+        """Test that the shared block is unlinked after the solve."""
+        names = []
+        shared_memory_class = shared_memory.SharedMemory
+
+        def record(*args, **kwargs):
+            block = shared_memory_class(*args, **kwargs)
+            names.append(block.name)
+            return block
+
+        with patch("parallel.shared_memory.SharedMemory", side_effect=record):
+            build_shared_residue_table(UNITS, workers=2)
+        with self.assertRaises(FileNotFoundError):
+            shared_memory_class(name=names[0])
+
+    def test_dispatch(self):
+        """Test that the dispatcher uses the shared table with workers."""
+        with patch(
+            "dispatch.build_shared_residue_table",
+            wraps=parallel.build_shared_residue_table,
+        ) as build:
+            self.assertEqual(
+                solve(UNITS, workers=2).value, solve_for_frobenius_number(UNITS)
+            )
+        build.assert_called_once_with(UNITS, "python", 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
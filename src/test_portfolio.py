@@ -0,0 +1,76 @@
+import itertools
+import unittest
+
+from frobenius import solve_for_frobenius_number, solve_for_genus
+from portfolio import counting_lower_bound, search_portfolio
+
+CATALOGUE = [6, 9, 10, 14, 15, 20, 21, 26, 33]
+
+
+class TestPortfolio(unittest.TestCase):
+    """Test suite for the package-size portfolio search."""
+
+    def brute_force(self, catalogue, count, objective, max_first=None):
+        """Solves every subset from scratch and returns (objective, units)."""
+        solve = solve_for_genus if objective == "genus" else solve_for_frobenius_number
+        scored = [
+            (solve(list(units)), list(units))
+            for units in itertools.combinations(sorted(catalogue), count)
+            if max_first is None or units[0] <= max_first
+        ]
+        return min(result for result in scored if result[0] is not None)
+
+    def test_matches_brute_force(self):
+        """Test both objectives and a₁ limits against every subset."""
+        for count, objective, max_first in itertools.product(
+            (2, 3, 4), ("frobenius", "genus"), (None, 9)
+        ):
+            with self.subTest(count=count, objective=objective, max_first=max_first):
+                result = search_portfolio(CATALOGUE, count, objective, max_first)
+                value = (
+                    result.genus if objective == "genus" else result.frobenius_number
+                )
+                self.assertEqual(
+                    (value, result.units),
+                    self.brute_force(CATALOGUE, count, objective, max_first),
+                )
+                self.assertEqual(
+                    result.frobenius_number, solve_for_frobenius_number(result.units)
+                )
+                self.assertEqual(result.genus, solve_for_genus(result.units))
+
+    def test_workers(self):
+        """Test that a process pool finds the same subset."""
+        self.assertEqual(
+            search_portfolio(CATALOGUE, 3, workers=2), search_portfolio(CATALOGUE, 3)
+        )
+
+    def test_counting_lower_bound(self):
+        """Test that the bound is exact for two units and never too high."""
+        self.assertEqual(counting_lower_bound(101, 137, 2), 101 * 137 - 101 - 137)
+        for units in itertools.combinations(CATALOGUE, 3):
+            if solve_for_frobenius_number(list(units)) is not None:
+                with self.subTest(units=units):
+                    self.assertLessEqual(
+                        counting_lower_bound(units[0], units[1], 3),
+                        solve_for_frobenius_number(list(units)),
+                    )
+
+    def test_no_solution(self):
+        """Test catalogues without a coprime subset."""
+        self.assertIsNone(search_portfolio([4, 6, 8, 0], 2))
+        self.assertIsNone(search_portfolio(CATALOGUE, 2, max_first=5))
+        self.assertIsNone(search_portfolio([6, 9], 3))
+
+    def test_invalid_arguments(self):
+        """Test unknown objectives, too few units and negative sizes."""
+        with self.assertRaises(ValueError):
+            search_portfolio(CATALOGUE, 3, "gaps")
+        with self.assertRaises(ValueError):
+            search_portfolio(CATALOGUE, 1)
+        with self.assertRaises(ValueError):
+            search_portfolio([-3, 5, 7], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import asyncio
+import json
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+from cache import ResultCache
+from server import SolverService, parse_address
+
+LARGE_UNITS = [101, 103, 107, 109, 113, 127, 131, 137]
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool that counts submitted solves."""
+
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+    """Test suite for the JSON-lines solver service."""
+
+    async def asyncSetUp(self):
+        self.executor = CountingExecutor()
+        self.service = SolverService(executor=self.executor)
+
+    async def asyncTearDown(self):
+        self.service.close()
+
+    def test_parse_address(self):
+        """Test TCP and Unix socket addresses."""
+        self.assertEqual(
+            parse_address("0.0.0.0:8000"), {"host": "0.0.0.0", "port": 8000}
+        )
+        self.assertEqual(parse_address(":8000"), {"host": "127.0.0.1", "port": 8000})
+        self.assertEqual(parse_address("unix:/tmp/x.sock"), {"path": "/tmp/x.sock"})
+        with self.assertRaises(ValueError):
+            parse_address("localhost")
+
+    async def test_coalesces_and_caches(self):
+        """Test that concurrent requests for one canonical set share a solve."""
+        first, second = await asyncio.gather(
+            self.service.solve(LARGE_UNITS), self.service.solve(LARGE_UNITS[::-1] + [0])
+        )
+        self.assertEqual(first["result"], 705)
+        self.assertEqual(second["result"], 705)
+        self.assertFalse(first["coalesced"])
+        self.assertTrue(second["coalesced"])
+        self.assertEqual(second["removed"], [(0, "zero")])
+        self.assertEqual(self.executor.submitted, 1)
+
+        third = await self.service.solve(LARGE_UNITS)
+        self.assertTrue(third["cached"])
+        self.assertIsNotNone(self.service.cache.get(LARGE_UNITS).residue_table)
+        self.assertEqual(self.executor.submitted, 1)
+
+    async def test_cache_runs_off_event_loop(self):
+        """Test that storing a solve does not run on the event loop thread."""
+        loop_thread = threading.get_ident()
+        put_threads = []
+        put = self.service.cache.put
+
+        def recording_put(*args):
+            put_threads.append(threading.get_ident())
+            put(*args)
+
+        with patch.object(self.service.cache, "put", recording_put):
+            await self.service.solve(LARGE_UNITS)
+        self.assertEqual(len(put_threads), 1)
+        self.assertNotEqual(put_threads[0], loop_thread)
+
+    async def test_sqlite_cache(self):
+        """Test that a file-backed cache works from the cache thread."""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(Path(directory) / "cache.sqlite")
+            service = SolverService(executor=self.executor, cache=cache)
+            try:
+                await service.solve(LARGE_UNITS)
+                response = await service.solve(LARGE_UNITS)
+                self.assertEqual((response["result"], response["cached"]), (705, True))
+            finally:
+                service.close()
+
+    async def test_without_cache(self):
+        """Test that use_cache=False solves a repeated set again."""
+        service = SolverService(executor=self.executor, use_cache=False)
+        try:
+            for _ in range(2):
+                response = await service.solve(LARGE_UNITS)
+                self.assertEqual((response["result"], response["cached"]), (705, False))
+            self.assertIsNone(service.cache)
+            self.assertEqual(self.executor.submitted, 2)
+        finally:
+            service.close()
+
+    async def test_closed_forms_run_inline(self):
+        """Test that closed forms do not use the worker pool."""
+        response = await self.service.solve([6, 9, 20])
+        self.assertEqual((response["result"], response["method"]), (43, "three_units"))
+        self.assertEqual(self.executor.submitted, 0)
+
+    async def test_handle_request_errors(self):
+        """Test that bad requests get an error response with their id."""
+        self.assertEqual(
+            await self.service.handle_request(b'{"id": 7, "units": "3,5"}'),
+            {"id": 7, "error": "ValueError: Requests need a 'units' list"},
+        )
+        response = await self.service.handle_request(b'{"id": 8, "units": [3, -5]}')
+        self.assertTrue(response["error"].startswith("ValueError"))
+        for units in (b'["x"]', b"[-4]", b"[true, 3]"):
+            response = await self.service.handle_request(
+                b'{"id": 9, "units": %s}' % units
+            )
+            self.assertRegex(response["error"], r"^(TypeError|ValueError): ")
+        response = await self.service.handle_request(b"not json")
+        self.assertIsNone(response["id"])
+
+    async def exchange(self, reader, writer, requests: list) -> dict:
+        """Sends requests, closes the write side and collects responses by id."""
+        for request in requests:
+            writer.write(json.dumps(request).encode() + b"\n")
+        writer.write_eof()
+        lines = (await reader.read()).splitlines()
+        writer.close()
+        return {response["id"]: response for response in map(json.loads, lines)}
+
+    async def test_tcp(self):
+        """Test a pipelined exchange over TCP."""
+        server = await self.service.start("127.0.0.1:0")
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            responses = await self.exchange(
+                reader,
+                writer,
+                [{"id": 1, "units": LARGE_UNITS}, {"id": 2, "units": [3, 5]}],
+            )
+        self.assertEqual(responses[1]["result"], 705)
+        self.assertEqual(responses[2]["result"], 7)
+
+    async def test_unix_socket(self):
+        """Test an exchange over a Unix socket."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "solver.sock"
+            server = await self.service.start(f"unix:{path}")
+            async with server:
+                reader, writer = await asyncio.open_unix_connection(str(path))
+                responses = await self.exchange(
+                    reader, writer, [{"id": "a", "units": [4, 6]}]
+                )
+        self.assertIsNone(responses["a"]["result"])
+        self.assertEqual(responses["a"]["method"], "no_solution")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+from unittest.mock import patch
+
+import sweep
+from frobenius import np, solve_for_frobenius_number, solve_for_genus
+from sweep import SweepRow, format_sweep_table, parse_sweep, sweep_unit
+
+
+class TestSweep(unittest.TestCase):
+    """Test suite for sweeping one unit over a range of values."""
+
+    def assert_matches_solver(self, numbers, unit, rows):
+        """Checks every row against a from-scratch solve."""
+        for row in rows:
+            replaced = list(numbers)
+            replaced[replaced.index(unit)] = row.unit
+            with self.subTest(units=replaced):
+                self.assertEqual(
+                    row.frobenius_number, solve_for_frobenius_number(replaced)
+                )
+                if row.frobenius_number is not None:
+                    self.assertEqual(row.genus, solve_for_genus(replaced))
+
+    def test_parse_sweep(self):
+        """Test sweep arguments with and without a step."""
+        self.assertEqual(parse_sweep("30=25:45"), (30, range(25, 46)))
+        self.assertEqual(parse_sweep("30=25:45:5"), (30, range(25, 46, 5)))
+        for value in ["30=25", "30:25:45", "30=45:25", "30=25:45:0", "a=1:2"]:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_sweep(value)
+
+    def test_matches_solver(self):
+        """Test candidates above, below and equal to the fixed units."""
+        engines = ["python", "dijkstra"] + (["numpy"] if np is not None else [])
+        for engine in engines:
+            with self.subTest(engine=engine):
+                rows = sweep_unit([6, 9, 20, 30], 30, range(0, 46), engine)
+                self.assertEqual([row.unit for row in rows], list(range(0, 46)))
+                self.assert_matches_solver([6, 9, 20, 30], 30, rows)
+
+    def test_fixed_table_built_once(self):
+        """Test that candidates above a₁ reuse the fixed units' table."""
+        with patch("sweep.build_fixed_table", wraps=sweep.build_fixed_table) as build:
+            sweep_unit([12, 18, 20, 27], 27, range(20, 60))
+        self.assertEqual(build.call_count, 1)
+
+    def test_non_coprime_fixed_units(self):
+        """Test that the varying unit can make the set coprime."""
+        rows = sweep_unit([6, 9, 10], 10, range(10, 13))
+        self.assertEqual(
+            rows, [SweepRow(10, 23, 12), SweepRow(11, 25, 13), SweepRow(12, None, None)]
+        )
+
+    def test_workers(self):
+        """Test that a process pool returns the rows in order."""
+        self.assertEqual(
+            sweep_unit([12, 18, 20, 27], 27, range(1, 40), workers=3),
+            sweep_unit([12, 18, 20, 27], 27, range(1, 40)),
+        )
+
+    def test_missing_unit(self):
+        """Test sweeping a unit that is not in the set."""
+        with self.assertRaises(ValueError):
+            sweep_unit([6, 9, 20], 30, range(25, 30))
+
+    def test_format_sweep_table(self):
+        """Test the aligned output table."""
+        self.assertEqual(
+            format_sweep_table([SweepRow(25, 28, 17), SweepRow(100, None, None)]),
+            [
+                "unit | frobenius | gaps",
+                "-----+-----------+-----",
+                "  25 |        28 |   17",
+                " 100 |      None | None",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
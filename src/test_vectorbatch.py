@@ -0,0 +1,90 @@
+import random
+import unittest
+from unittest.mock import patch
+
+import vectorbatch
+from frobenius import build_residue_table, np, solve_for_frobenius_number
+from vectorbatch import (
+    iter_vectorized_results,
+    solve_vectorized,
+    stacked_residue_tables,
+)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestVectorBatch(unittest.TestCase):
+    """Test suite for solving many unit sets with stacked NumPy tables."""
+
+    def expected(self, numbers):
+        """Solves one row with solve_for_frobenius_number."""
+        try:
+            return (solve_for_frobenius_number(numbers), None)
+        except Exception as error:
+            return (None, f"{type(error).__name__}: {error}")
+
+    def test_stacked_tables_match_round_robin(self):
+        """Test that each stacked row is the row's own residue table."""
+        unit_rows = [[5, 8, 9], [6, 9, 20], [12, 18, 20, 27], [7, 10], [1]]
+        residue_tables = stacked_residue_tables(unit_rows)
+        self.assertEqual(residue_tables.shape, (5, 12))
+        for row, units in zip(residue_tables, unit_rows):
+            with self.subTest(units=units):
+                self.assertEqual(
+                    row[: units[0]].tolist(), list(build_residue_table(units))
+                )
+
+    def test_matches_solver(self):
+        """Test random rows of mixed a₁ and k, in input order."""
+        generator = random.Random(25)
+        rows = []
+        for _ in range(400):
+            first_num = generator.randint(1, 200)
+            others = [generator.randint(0, 900) for _ in range(generator.randint(0, 6))]
+            row = [first_num] + others
+            generator.shuffle(row)
+            rows.append(row)
+        rows += [[6, 9, 20], [4, 6], [3, 0], [7], [], [3, -5], [1, 5], [6, 9, 20]]
+        self.assertEqual(
+            solve_vectorized(rows), [self.expected(numbers) for numbers in rows]
+        )
+
+    def test_large_rows_solved_one_at_a_time(self):
+        """Test rows too large for a stacked table or for int64 shifts."""
+        rows = [[5003, 5009, 5011], [3, 2**61 + 1], [6, 9, 20]]
+        with patch(
+            "vectorbatch.stacked_residue_tables",
+            wraps=vectorbatch.stacked_residue_tables,
+        ) as stacked:
+            results = solve_vectorized(rows)
+        self.assertEqual(results, [self.expected(numbers) for numbers in rows])
+        self.assertEqual(stacked.call_count, 1)
+        self.assertEqual(len(stacked.call_args.args[0]), 1)
+
+    def test_buckets_split_into_chunks(self):
+        """Test that a bucket larger than one chunk gives the same results."""
+        rows = [
+            [first_num, first_num + 1, first_num + 3] for first_num in range(64, 128)
+        ]
+        with patch("vectorbatch.VECTOR_CHUNK_ENTRIES", 1000):
+            results = solve_vectorized(rows)
+        self.assertEqual(results, [self.expected(numbers) for numbers in rows])
+
+    def test_iter_vectorized_results_keeps_order(self):
+        """Test that results come back in input order across batches."""
+        rows = [[3, 5], [4, 6], [6, 9, 20], [3, -5], [10, 11]]
+        results = list(iter_vectorized_results(iter(rows), batch_rows=2))
+        self.assertEqual([numbers for numbers, _, _ in results], rows)
+        self.assertEqual(
+            [tuple(result) for _, *result in results],
+            [self.expected(numbers) for numbers in rows],
+        )
+
+    @patch("vectorbatch.np", None)
+    def test_requires_numpy(self):
+        """Test that a missing numpy is reported up front."""
+        with self.assertRaises(ImportError):
+            solve_vectorized([[3, 5]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+import math
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from canonical import canonicalize_units
+from frobenius import RESIDUE_SENTINEL, np, solve_for_frobenius_number
+
+# Rows read and solved together; results of a batch are written before the
+# next batch is read
+VECTOR_BATCH_ROWS = 4096
+
+# Rows with a larger smallest unit are solved one at a time, since their
+# own passes outweigh the per-call overhead the batch saves
+VECTOR_MAX_FIRST_UNIT = 1 << 12
+
+# Entries per stacked 2D table; buckets with more rows are split
+VECTOR_CHUNK_ENTRIES = 1 << 22
+
+# Unreached entries in the stacked table. Half of RESIDUE_SENTINEL, so
+# adding a shift of up to 2⁶² cannot overflow int64
+VECTOR_SENTINEL = 2**62
+
+
+def _bucket_key(units: list) -> Tuple[int, int]:
+    """Groups unit sets into power-of-two buckets of a₁ with equal k.
+
+    Rows of one bucket are padded to its largest a₁, so this keeps the
+    padding below half of every stacked table, and no row waits through
+    passes it does not have.
+
+    Args:
+        units: Sorted, zero-free units
+
+    Returns:
+        A tuple of (bit length of a₁, number of units)
+    """
+    return (units[0].bit_length(), len(units))
+
+
+def stacked_residue_tables(unit_rows: List[List[int]]):
+    """Builds the residue tables of many unit sets at once.
+
+    Row r of the result is the table of unit_rows[r], padded with
+    VECTOR_SENTINEL up to the largest a₁. A Round Robin pass over a unit
+    u gives n'[q] = min over j of n[q - j·u mod a₁] + j·u, a min-plus scan
+    along each residue cycle. It is done by doubling the span instead of
+    walking the cycles: after the step with span s,
+
+        n[q] = min(n[q], n[q - s·u mod a₁] + s·u)
+
+    covers every j below 2s, so ⌈log₂ a₁⌉ gathers finish a pass for all
+    rows together, whatever their cycle structure. Rows with fewer units
+    are padded with u = 0, which changes nothing.
+
+    Args:
+        unit_rows: Sorted, zero-free units with gcd 1 (see
+            canonicalize_units)
+
+    Returns:
+        An int64 NumPy array with one row per unit set
+    """
+    row_count = len(unit_rows)
+    width = max(units[0] for units in unit_rows)
+    pass_count = max(len(units) for units in unit_rows) - 1
+
+    first_nums = np.array([units[0] for units in unit_rows], dtype=np.int64)
+    pass_units = np.zeros((row_count, max(pass_count, 1)), dtype=np.int64)
+    for row, units in enumerate(unit_rows):
+        pass_units[row, : len(units) - 1] = units[1:]
+
+    residue_tables = np.full((row_count, width), VECTOR_SENTINEL, dtype=np.int64)
+    residue_tables[:, 0] = 0
+    columns = np.arange(width, dtype=np.int64)
+    moduli = first_nums[:, None]
+    # Flat index of the start of every row
+    row_starts = (np.arange(row_count, dtype=np.int64) * width)[:, None]
+
+    for pass_index in range(pass_count):
+        current_nums = pass_units[:, pass_index]
+        span = 1
+        while span < width:
+            shifts = span * current_nums
+            # q - s·u mod a₁ without a per-entry division
+            sources = columns - (shifts % first_nums)[:, None]
+            sources += np.where(sources < 0, moduli, 0) + row_starts
+            candidates = np.take(residue_tables, sources)
+            candidates += shifts[:, None]
+            np.minimum(residue_tables, candidates, out=residue_tables)
+            span *= 2
+
+    # Columns past a row's own a₁ hold leftovers of the padding
+    residue_tables[columns >= moduli] = VECTOR_SENTINEL
+    residue_tables[residue_tables >= VECTOR_SENTINEL] = RESIDUE_SENTINEL
+    return residue_tables
+
+
+def _frobenius_numbers(unit_rows: List[List[int]]) -> List[int]:
+    """Computes the Frobenius numbers of a bucket, a chunk of rows at a time.
+
+    Args:
+        unit_rows: Sorted, zero-free units with gcd 1, of similar a₁ and k
+
+    Returns:
+        One Frobenius number per unit set, in order
+    """
+    width = max(units[0] for units in unit_rows)
+    chunk_rows = max(1, VECTOR_CHUNK_ENTRIES // width)
+
+    values = []
+    for start in range(0, len(unit_rows), chunk_rows):
+        chunk = unit_rows[start : start + chunk_rows]
+        residue_tables = stacked_residue_tables(chunk)
+        # Padding is RESIDUE_SENTINEL, so hide it from the row maximum
+        residue_tables[residue_tables == RESIDUE_SENTINEL] = -1
+        maxima = residue_tables.max(axis=1).tolist()
+        values.extend(maximum - units[0] for maximum, units in zip(maxima, chunk))
+    return values
+
+
+def solve_vectorized(
+    integer_lists: List[List[int]], engine: str = "python"
+) -> List[Tuple[Optional[int], Optional[str]]]:
+    """Solves many unit sets with one stacked Round Robin table per a₁ bucket.
+
+    Gives the same values as calling solve_for_frobenius_number on each row,
+    but rows are canonicalized, grouped by number of units and power-of-two
+    bucket of a₁, and solved with whole-bucket NumPy operations (see
+    stacked_residue_tables), so thousands of small rows cost a few hundred
+    array operations instead of thousands of Python-level solves. Rows
+    whose a₁ is above VECTOR_MAX_FIRST_UNIT, or whose units are too large
+    for int64 shifts, go through solve_for_frobenius_number instead.
+
+    Args:
+        integer_lists: Rows to solve
+        engine: Engine for the rows solved one at a time, one of ENGINES
+
+    Returns:
+        One (result, error) tuple per row, in input order
+
+    Raises:
+        ImportError: If numpy is not installed
+    """
+    if np is None:
+        raise ImportError("Vectorized batches require numpy to be installed")
+
+    results: List[Tuple[Optional[int], Optional[str]]] = [(None, None)] * len(
+        integer_lists
+    )
+    buckets: Dict[Tuple[int, int], List[Tuple[int, List[int]]]] = {}
+
+    for index, numbers in enumerate(integer_lists):
+        try:
+            units = (
+                canonicalize_units(numbers, keep_redundant=True).units
+                if len(numbers) > 1
+                else []
+            )
+            if not units or math.gcd(*units) != 1:
+                continue
+            # Shifts reach 2·a₁·aₖ, which must stay below the sentinel
+            too_large = 2 * units[0] * units[-1] >= VECTOR_SENTINEL
+            if units[0] > VECTOR_MAX_FIRST_UNIT or too_large:
+                results[index] = (
+                    solve_for_frobenius_number(units, engine=engine),
+                    None,
+                )
+                continue
+        except Exception as error:
+            results[index] = (None, f"{type(error).__name__}: {error}")
+            continue
+        buckets.setdefault(_bucket_key(units), []).append((index, units))
+
+    for rows in buckets.values():
+        values = _frobenius_numbers([units for _, units in rows])
+        for (index, _), value in zip(rows, values):
+            results[index] = (value, None)
+    return results
+
+
+def iter_vectorized_results(
+    integer_lists: Iterable[List[int]],
+    engine: str = "python",
+    batch_rows: int = VECTOR_BATCH_ROWS,
+) -> Iterator[Tuple[List[int], Optional[int], Optional[str]]]:
+    """Solves rows in vectorized batches, yielding results in input order.
+
+    Args:
+        integer_lists: Rows to solve
+        engine: Engine for rows with a large a₁, one of ENGINES
+        batch_rows: Rows solved together
+
+    Yields:
+        (numbers, result, error) for each row
+    """
+    rows = iter(integer_lists)
+    while True:
+        batch = list(islice(rows, batch_rows))
+        if not batch:
+            return
+        for numbers, result in zip(batch, solve_vectorized(batch, engine)):
+            yield (numbers, *result)